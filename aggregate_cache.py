@@ -0,0 +1,151 @@
+import sys
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+import numpy as np
+import pandas as pd
+from config import AGGREGATE_CACHE_MB
+
+
+class AggregateCache:
+    """Report aggregates shared by every session, keyed on snapshot version + filters
+
+    Least recently used entries are evicted once the estimated size passes the
+    budget, and entries of older snapshot versions go as soon as a newer one is
+    cached. Concurrent misses on one key share a single computation.
+    """
+
+    def __init__(self, max_mb=AGGREGATE_CACHE_MB):
+        self.max_bytes = int(max_mb * 1024 ** 2)
+        self.nbytes = 0
+        self.version = None
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._inflight = {}
+        self.counters = Counter()
+
+    def get(self, name, version, compute, **filters):
+        """Cached compute() for (name, version, filters); callers get their own copy"""
+        key = (name, version, normalize_filters(filters))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.counters['hits'] += 1
+                return _copy(entry[0])
+
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                self.counters['misses'] += 1
+            else:
+                self.counters['coalesced'] += 1
+
+        if not leader:
+            return _copy(future.result())
+
+        try:
+            value = compute()
+            future.set_result(value)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+        self._store(key, version, value)
+        return _copy(value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        """Hit/miss counters and current memory use"""
+        with self._lock:
+            lookups = self.counters['hits'] + self.counters['misses'] + self.counters['coalesced']
+            return {
+                'entries': len(self._entries),
+                'size_mb': round(self.nbytes / 1024 ** 2, 2),
+                'budget_mb': round(self.max_bytes / 1024 ** 2, 2),
+                'hits': self.counters['hits'],
+                'misses': self.counters['misses'],
+                'coalesced': self.counters['coalesced'],
+                'evictions': self.counters['evictions'],
+                'hit_rate': round((lookups - self.counters['misses']) / lookups, 3) if lookups else 0.0,
+            }
+
+    def _store(self, key, version, value):
+        size = estimate_nbytes(value)
+        with self._lock:
+            if self.version is None or version > self.version:
+                # A newer snapshot was published, nothing keyed on the old ones can hit again
+                self.version = version
+                for old in [k for k in self._entries if k[1] < version]:
+                    self.nbytes -= self._entries.pop(old)[1]
+            elif version < self.version or size > self.max_bytes:
+                return
+
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.nbytes += size
+
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.counters['evictions'] += 1
+
+
+def normalize_filters(filters):
+    """Hashable, order-independent form of widget filters
+
+    None and empty selections compare equal, multiselect order doesn't matter
+    and numpy scalars match the plain Python values.
+    """
+    normalized = []
+    for name, value in sorted(filters.items()):
+        if isinstance(value, (list, tuple, set, frozenset, np.ndarray, pd.Index)):
+            value = tuple(sorted((_scalar(v) for v in value), key=repr)) or None
+        else:
+            value = _scalar(value)
+        normalized.append((name, value))
+    return tuple(normalized)
+
+
+def estimate_nbytes(value):
+    """Approximate memory held by a cached aggregate"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_nbytes(v) for v in value.values())
+    return sys.getsizeof(value)
+
+
+def _scalar(value):
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _copy(value):
+    # Reports add columns to what they get back; the cached object must stay intact
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy(v) for v in value)
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    return value
@@ -0,0 +1,58 @@
+"""Company Analysis aggregate with and without the shared AggregateCache.
+
+Replays widget picks from several sessions, skewed towards popular views the
+way dashboard traffic is. Run from the repo root:
+    python benchmarks/bench_aggregate_cache.py [rows] [requests]
+"""
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aggregate_cache import AggregateCache  # noqa: E402
+from data_loader import OrderDataLoader  # noqa: E402
+from fake_sheets import synthetic_order_rows  # noqa: E402
+
+
+def company_metrics(df, year_option):
+    analysis_df = df if year_option == "All Years" else df[df['Year'] == int(year_option)]
+    return analysis_df.groupby('Company', observed=True).agg({
+        'Total_Amount': ['sum', 'count', 'mean', 'std'],
+        'Qty': ['sum', 'mean'],
+        'Inquiry_No': 'nunique',
+        'Date': ['min', 'max'],
+        'Product': 'nunique',
+    }).round(2)
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    n_requests = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    loader = OrderDataLoader()
+    df, _ = loader.clean_and_validate(loader.parse_order_rows(synthetic_order_rows(n_rows)[1:]))
+
+    options = ["All Years"] + [str(y) for y in sorted(df['Year'].unique(), reverse=True)]
+    weights = 1.0 / np.arange(1, len(options) + 1)
+    picks = np.random.default_rng(3).choice(options, size=n_requests, p=weights / weights.sum())
+
+    start = time.perf_counter()
+    for option in picks:
+        company_metrics(df, option)
+    uncached = time.perf_counter() - start
+
+    cache = AggregateCache()
+    start = time.perf_counter()
+    for option in picks:
+        cache.get('company_metrics', 1, lambda: company_metrics(df, option), Year=option)
+    cached = time.perf_counter() - start
+
+    stats = cache.stats()
+    print(f"rows: {len(df):,}  requests: {n_requests}  distinct views: {len(set(picks))}")
+    print(f"uncached: {uncached * 1000 / n_requests:8.1f} ms/request")
+    print(f"cached:   {cached * 1000 / n_requests:8.1f} ms/request  "
+          f"(hit rate {stats['hit_rate']:.0%}, {stats['size_mb']:.1f} MB held)")
+
+
+if __name__ == '__main__':
+    main()
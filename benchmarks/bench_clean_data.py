@@ -0,0 +1,64 @@
+"""Rows/second of OrderDataLoader.clean_data before and after vectorization.
+
+Run from the repo root:
+    python benchmarks/bench_clean_data.py [rows]
+"""
+import os
+import sys
+import time
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_loader import OrderDataLoader  # noqa: E402
+from fake_sheets import synthetic_order_rows  # noqa: E402
+
+
+def synthetic_raw_orders(n_rows, seed=7):
+    """Raw sheet strings shaped like read_order_rows output"""
+    rows = synthetic_order_rows(n_rows, seed=seed)
+    return OrderDataLoader().parse_order_rows(rows[1:])
+
+
+def legacy_clean_data(df):
+    """clean_data as it was before the vectorized rewrite"""
+    df['Date'] = pd.to_datetime(df['Date'], errors='coerce', dayfirst=True)
+    df['Total_Amount'] = df['Total_Amount'].astype(str).str.replace(r'[₹,]', '', regex=True)
+    df['Total_Amount'] = pd.to_numeric(df['Total_Amount'], errors='coerce')
+    df['Qty'] = pd.to_numeric(df['Qty'], errors='coerce').fillna(1)
+    df['State'] = df['State'].str.strip().str.title()
+    df['State'] = df['State'].replace({'N/A': 'Not Specified', 'Na': 'Not Specified', '': 'Not Specified'})
+    df['Product'] = df['Product'].str.strip()
+    df['Company'] = df['Company'].str.strip().str.title()
+    df['Client_Name'] = df['Client_Name'].str.strip().str.title()
+    df['EDD'] = pd.to_datetime(df['EDD'], errors='coerce', dayfirst=True)
+    df['Lead_Time_Days'] = (df['EDD'] - df['Date']).dt.days
+    df['Year'] = df['Date'].dt.year
+    df['Month'] = df['Date'].dt.month
+    df['Month_Name'] = df['Date'].dt.month_name()
+    return df.dropna(subset=['Date', 'Total_Amount'])
+
+
+def timed(fn, raw):
+    start = time.perf_counter()
+    out = fn(raw.copy())
+    return out, time.perf_counter() - start
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    raw = synthetic_raw_orders(n_rows)
+    loader = OrderDataLoader()
+
+    before, t_before = timed(legacy_clean_data, raw)
+    after, t_after = timed(loader.clean_data, raw)
+
+    print(f"rows: {n_rows:,}")
+    print(f"legacy clean_data:     {t_before:7.2f}s  {n_rows / t_before:>12,.0f} rows/s  ({len(before):,} kept)")
+    print(f"vectorized clean_data: {t_after:7.2f}s  {n_rows / t_after:>12,.0f} rows/s  ({len(after):,} kept)")
+    print(f"speed-up: {t_before / t_after:.1f}x")
+    print(f"deep memory: {before.memory_usage(deep=True).sum() / 1024**2:.1f} MB -> "
+          f"{after.memory_usage(deep=True).sum() / 1024**2:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Report roll-ups from OrderCube vs groupby over the raw order rows.
+
+Run from the repo root:
+    python benchmarks/bench_cube.py [rows]
+"""
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_loader import OrderDataLoader  # noqa: E402
+from fake_sheets import synthetic_order_rows  # noqa: E402
+from order_cube import OrderCube  # noqa: E402
+
+
+def realistic_orders(n_rows, seed=7):
+    """Cleaned orders where each company sits in one state and buys from a small basket
+
+    The uniform synthetic rows put almost every row in its own cube cell, which
+    real order books don't do. Multi-line inquiries are simulated too.
+    """
+    loader = OrderDataLoader()
+    df, _ = loader.clean_and_validate(loader.parse_order_rows(synthetic_order_rows(n_rows, seed=seed)[1:]))
+
+    rng = np.random.default_rng(seed)
+    company = df['Company'].cat.codes.to_numpy()
+    states, products = df['State'].cat.categories, df['Product'].cat.categories
+    home_state = rng.integers(0, len(states), company.max() + 1)
+    basket = rng.integers(0, len(products), (company.max() + 1, 5))
+
+    df['State'] = pd.Categorical.from_codes(home_state[company], states)
+    df['Product'] = pd.Categorical.from_codes(basket[company, rng.integers(0, 5, len(df))], products)
+    df['Inquiry_No'] = df['Inquiry_No'].str.slice(0, 10)
+    return df
+
+
+def timed(fn, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    df = realistic_orders(n_rows)
+
+    start = time.perf_counter()
+    cube = OrderCube(df)
+    print(f"rows: {len(df):,}  cells: {len(cube.cells):,}  sketch entries: {len(cube.sketch_ranks):,}  "
+          f"build: {time.perf_counter() - start:.2f}s")
+
+    year = int(df['Year'].mode()[0])
+    state = df['State'].mode()[0]
+    cases = [
+        ("revenue by state", lambda: cube.rollup('State')['Revenue'],
+         lambda: df.groupby('State', observed=True)['Total_Amount'].sum()),
+        ("revenue by product, one year", lambda: cube.rollup('Product', Year=year)['Revenue'],
+         lambda: df[df['Year'] == year].groupby('Product', observed=True)['Total_Amount'].sum()),
+        ("company table (distinct states/products)",
+         lambda: cube.rollup('Company', distinct=['State', 'Product'])[['Revenue', 'State', 'Product']],
+         lambda: df.groupby('Company', observed=True).agg(
+             Revenue=('Total_Amount', 'sum'), State=('State', 'nunique'), Product=('Product', 'nunique'))),
+        ("monthly revenue, one state", lambda: cube.rollup('Year_Month', State=state)['Revenue'],
+         lambda: df[df['State'] == state].groupby('Year_Month', observed=True)['Total_Amount'].sum()),
+        ("orders (distinct) by state", lambda: cube.rollup('State', orders=True)['Orders'],
+         lambda: df.groupby('State', observed=True)['Inquiry_No'].nunique()),
+    ]
+
+    print(f"{'':42} {'raw ms':>8} {'cube ms':>8}  {'max rel. error':>14}")
+    for label, from_cube, from_rows in cases:
+        expected, t_rows = timed(from_rows)
+        result, t_cube = timed(from_cube)
+        error = np.abs(np.asarray(result, dtype=float) / np.asarray(expected, dtype=float) - 1).max()
+        print(f"{label:42} {t_rows:8.1f} {t_cube:8.1f}  {error:14.2%}")
+
+
+if __name__ == '__main__':
+    main()
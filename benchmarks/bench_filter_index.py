@@ -0,0 +1,58 @@
+"""Report slicing through OrderFilterIndex vs boolean masks over the full frame.
+
+Run from the repo root:
+    python benchmarks/bench_filter_index.py [rows]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_loader import OrderDataLoader  # noqa: E402
+from fake_sheets import synthetic_order_rows  # noqa: E402
+from filter_index import OrderFilterIndex  # noqa: E402
+
+
+def timed(fn, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    loader = OrderDataLoader()
+    df, _ = loader.clean_and_validate(loader.parse_order_rows(synthetic_order_rows(n_rows)[1:]))
+
+    start = time.perf_counter()
+    index = OrderFilterIndex(df)
+    print(f"rows: {len(df):,}  index build: {time.perf_counter() - start:.2f}s")
+
+    year = int(df['Year'].mode()[0])
+    states = index.values('State')
+    products = index.values('Product')
+
+    # (label, index filters, equivalent mask) modelled on the report widgets
+    cases = [
+        ("Executive: year+state+product", dict(Year=year, State=states[0], Product=products[0]),
+         lambda: df[(df['Year'] == year) & (df['State'] == states[0]) & (df['Product'] == products[0])]),
+        ("Map: year", dict(Year=year),
+         lambda: df[df['Year'] == year]),
+        ("Map: year+state", dict(Year=year, State=states[0]),
+         lambda: df[(df['Year'] == year) & (df['State'] == states[0])]),
+        ("Explorer: 3 states, 50 products", dict(State=states[:3], Product=products[:50]),
+         lambda: df[df['State'].isin(states[:3]) & df['Product'].isin(products[:50])]),
+    ]
+
+    print(f"{'':34} {'mask ms':>9} {'index ms':>9} {'rows only':>10} {'rows':>9}")
+    for label, filters, masked in cases:
+        expected, t_mask = timed(masked)
+        result, t_index = timed(lambda: index.select(df, **filters))
+        _, t_rows = timed(lambda: index.rows(**filters))
+        assert result.index.equals(expected.index), label
+        print(f"{label:34} {t_mask:9.2f} {t_index:9.2f} {t_rows:10.3f} {len(result):9,}")
+
+
+if __name__ == '__main__':
+    main()
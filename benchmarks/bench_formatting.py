@@ -0,0 +1,55 @@
+"""Display formatting: per-cell .apply(lambda x: f"...") vs the vectorized formatters in formatting.py.
+
+Both sides format the same float column, half of it raw amounts and half
+values with two decimals (so every format hits .5 ties); "differ" counts
+rows whose text isn't identical and has to be zero.
+Run from the repo root:
+    python benchmarks/bench_formatting.py [rows ...]
+"""
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import CURRENCY  # noqa: E402
+from formatting import compact, inr, number, percent, signed_percent  # noqa: E402
+
+FORMATS = [
+    ('INR', lambda x: f"{CURRENCY}{x:,.0f}", inr),
+    ('number, 2 decimals', lambda x: f"{x:,.2f}", lambda s: number(s, 2)),
+    ('percent', lambda x: f"{x:.2f}%", lambda s: percent(s, 2)),
+    ('signed growth', lambda x: f"{x:+.1f}%", signed_percent),
+    ('lakh label', lambda x: f"{CURRENCY}{x / 100000:.1f}L", compact),
+]
+
+
+def best_ms(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [20, 1_000, 50_000, 500_000]
+    rng = np.random.default_rng(0)
+    print(f"{'':22}{'rows':>10}{'apply ms':>12}{'vectorized ms':>15}{'speedup':>9}{'differ':>8}")
+    for n_rows in sizes:
+        values = rng.gamma(2, 50_000, n_rows) * rng.choice([-1, 1], n_rows, p=[0.1, 0.9])
+        values[::2] = np.round(rng.uniform(-100, 100, len(values[::2])), 2)
+        values = pd.Series(values)
+        for label, cell, column in FORMATS:
+            differ = int((column(values) != values.apply(cell)).sum())
+            if differ:
+                raise AssertionError(f"{label}, {n_rows:,} rows: {differ:,} rows differ from the f-string")
+            per_cell = best_ms(lambda: values.apply(cell))
+            vectorized = best_ms(lambda: column(values))
+            print(f"{label:22}{n_rows:10,}{per_cell:12.2f}{vectorized:15.2f}{per_cell / vectorized:8.1f}x{differ:8,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Ingestion and brush-sheet writer throughput against the offline fake Sheets backend.
+
+Run from the repo root:
+    python benchmarks/bench_ingest.py --rows 100000 --append 500 --latency 0.2
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import data_loader  # noqa: E402
+from data_loader import OrderDataLoader  # noqa: E402
+from fake_sheets import FakeClientManager, FakeSheetsClient, synthetic_order_rows  # noqa: E402
+from sheets_client import SheetsRequestScheduler  # noqa: E402
+
+
+def fresh_loader(client, quota=None):
+    loader = OrderDataLoader()
+    loader.client_manager = FakeClientManager(client)
+    if quota:
+        # Stay just under the fake backend's per-minute limit
+        loader.scheduler = SheetsRequestScheduler(quota_per_minute=quota * 0.9, backoff_base=0.5)
+    return loader
+
+
+def report(label, client, seconds, rows):
+    calls = sum(client.call_counts.values())
+    print(f"{label:<28} {seconds:7.2f}s  {rows / max(seconds, 1e-9):>12,.0f} rows/s  "
+          f"{client.bytes_served / 1024**2:8.1f} MB  {calls:4d} calls  {client.quota_errors} quota errors")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--append', type=int, default=500, help='rows appended before the incremental refresh')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds per API call')
+    parser.add_argument('--quota', type=int, default=None, help='API calls allowed per minute')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--sessions', type=int, default=8, help='concurrent readers in the burst test')
+    args = parser.parse_args()
+
+    # Keep snapshots out of the working tree
+    os.chdir(tempfile.mkdtemp(prefix='cmpl_bench_'))
+
+    client = FakeSheetsClient(latency=args.latency, quota_per_minute=args.quota, error_rate=args.error_rate, seed=1)
+    worksheet = client.add_order_sheet(n_rows=args.rows)
+    print(f"rows: {args.rows:,}  latency: {args.latency}s  quota/min: {args.quota}  error rate: {args.error_rate}")
+
+    for mode in ['full', 'ranges']:
+        data_loader.FETCH_MODE = mode
+        client.reset_stats()
+        loader = fresh_loader(client, args.quota)
+        start = time.perf_counter()
+        df = loader.sync_data(full=True)
+        report(f"cold load ({mode})", client, time.perf_counter() - start, args.rows)
+
+    # Incremental refresh after new orders arrive
+    worksheet.append_rows(synthetic_order_rows(args.append, seed=99)[1:])
+    client.reset_stats()
+    start = time.perf_counter()
+    df = loader.sync_data()
+    report(f"refresh (+{args.append} rows)", client, time.perf_counter() - start, args.append)
+
+    # Brush-sheet writer
+    brush_df = loader.calculate_followup_dates(loader.identify_brush_products(df))
+    client.reset_stats()
+    start = time.perf_counter()
+    ok, message = loader.store_to_brush_sheet(brush_df)
+    report("store_to_brush_sheet", client, time.perf_counter() - start, len(brush_df))
+    print(f"  -> {message}")
+
+    # Many sessions asking for the same columns at once share one request
+    client.reset_stats()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.sessions) as pool:
+        list(pool.map(lambda _: loader.read_order_rows(worksheet), range(args.sessions)))
+    report(f"burst ({args.sessions} sessions)", client, time.perf_counter() - start, args.rows * args.sessions)
+
+    print(f"scheduler: {loader.scheduler.stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Out-of-core report queries streamed from the partitioned snapshot vs the in-memory frame.
+
+Peak memory is what the query allocates on top of what's already held:
+numpy/pandas through tracemalloc, Arrow buffers through its memory pool.
+Run from the repo root:
+    python benchmarks/bench_out_of_core.py [rows] [chunk rows]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_query_backend import order_frame, report_queries  # noqa: E402
+from data_loader import OrderDataLoader  # noqa: E402
+from fake_sheets import synthetic_order_rows  # noqa: E402
+from filter_index import OrderFilterIndex  # noqa: E402
+from order_store import PartitionedOrderStore  # noqa: E402
+from query_backend import ChunkedBackend, PandasBackend  # noqa: E402
+
+BASE_ROWS = 1_000_000
+
+
+def measured(fn):
+    """(ms, peak MB) of one call; timed untraced, tracemalloc slows allocation down"""
+    start = time.perf_counter()
+    fn()
+    elapsed = (time.perf_counter() - start) * 1000
+
+    tracemalloc.start()
+    pool_before = pa.total_allocated_bytes()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] + max(0, pa.default_memory_pool().max_memory() - pool_before)
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    chunk_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    loader = OrderDataLoader()
+    base, _ = loader.clean_and_validate(loader.parse_order_rows(synthetic_order_rows(min(n_rows, BASE_ROWS))[1:]))
+    df = order_frame(n_rows, base)
+    df.index = range(len(df))  # Stacked copies repeat sheet rows, the store needs them unique
+
+    with tempfile.TemporaryDirectory() as root:
+        store = PartitionedOrderStore(root)
+        manifest = store.write(df, {'schema_version': 1})
+        queries = report_queries(df)
+        in_memory = PandasBackend(df, OrderFilterIndex(df))
+        chunked = ChunkedBackend(store, manifest, chunk_rows)
+
+        print(f"rows: {len(df):,}  in-memory frame: {df.memory_usage(deep=True).sum() / 2**20:,.0f} MB  "
+              f"chunk: {chunk_rows:,} rows")
+        print(f"{'':34}{'pandas ms':>12}{'peak MB':>10}{'chunked ms':>12}{'peak MB':>10}")
+        for label, by, measures, filters in queries:
+            results = [measured(lambda: backend.aggregate(by, measures, **filters)) for backend in (in_memory, chunked)]
+            print(f"{label:34}" + ''.join(f"{ms:12.1f}{mb:10.1f}" for ms, mb in results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Partitioned snapshot store: full save, incremental save and pruned reads.
+
+Compares the single-file snapshot (rewritten and read whole every time)
+with the Year/Month partitioned store. Run from the repo root:
+    python benchmarks/bench_partitions.py [rows] [appended rows]
+"""
+import os
+import sys
+import tempfile
+import time
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_loader import OrderDataLoader  # noqa: E402
+from fake_sheets import synthetic_order_rows  # noqa: E402
+from order_store import PartitionedOrderStore  # noqa: E402
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_new = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    loader = OrderDataLoader()
+    df, _ = loader.clean_and_validate(loader.parse_order_rows(synthetic_order_rows(n_rows)[1:]))
+    watermark = len(df) - n_new
+    cut = int(df.index[watermark])  # Sheet row of the first appended order
+    year = int(df['Year'].mode()[0])
+
+    with tempfile.TemporaryDirectory() as root:
+        single = os.path.join(root, 'orders.parquet')
+        store = PartitionedOrderStore(os.path.join(root, 'orders'))
+        info = {'schema_version': 1, 'synced_rows': watermark, 'tail_hash': 'a'}
+
+        _, single_save = timed(lambda: pq.write_table(pa.Table.from_pandas(df, preserve_index=True), single))
+        _, full_save = timed(lambda: store.write(df.iloc[:watermark], info))
+        # New orders land in the newest month; that partition is the only one written
+        _, delta_save = timed(lambda: store.write(df, dict(info, synced_rows=len(df), tail_hash='b'),
+                                                  cut=cut, base=(watermark, 'a')))
+        counts = store.last_write
+
+        _, single_read = timed(lambda: pq.read_table(single).to_pandas())
+        _, full_read = timed(lambda: store.read())
+        one_year, year_read = timed(lambda: store.read(years=year))
+
+    print(f"rows: {len(df):,}  appended: {n_new}  partitions: {sum(counts.values())}")
+    print(f"single file save:        {single_save:8.1f} ms")
+    print(f"partitioned full save:   {full_save:8.1f} ms")
+    print(f"partitioned delta save:  {delta_save:8.1f} ms  ({counts['kept']} kept, "
+          f"{counts['appended']} appended, {counts['rewritten']} rewritten)")
+    print(f"single file read:        {single_read:8.1f} ms")
+    print(f"partitioned full read:   {full_read:8.1f} ms")
+    print(f"partitioned {year} read:   {year_read:8.1f} ms  ({len(one_year):,} rows)")
+
+
+if __name__ == '__main__':
+    main()
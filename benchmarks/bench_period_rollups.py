@@ -0,0 +1,42 @@
+"""Folding appended orders into PeriodRollups vs rebuilding them from the full frame.
+
+Run from the repo root:
+    python benchmarks/bench_period_rollups.py [rows] [appended rows]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import SYNC_RECHECK_ROWS  # noqa: E402
+from data_loader import OrderDataLoader  # noqa: E402
+from fake_sheets import synthetic_order_rows  # noqa: E402
+from period_rollups import PeriodRollups  # noqa: E402
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_new = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    loader = OrderDataLoader()
+    df, _ = loader.clean_and_validate(loader.parse_order_rows(synthetic_order_rows(n_rows)[1:]))
+
+    # A sync re-reads the recheck window before the watermark plus the appended rows
+    watermark = len(df) - n_new
+    cut = watermark - SYNC_RECHECK_ROWS
+    before = PeriodRollups(df.iloc[:watermark])
+
+    start = time.perf_counter()
+    PeriodRollups(df)
+    rebuild = time.perf_counter() - start
+
+    start = time.perf_counter()
+    folded = before.apply(removed=df.iloc[cut:watermark], added=df.iloc[cut:])
+    fold = time.perf_counter() - start
+
+    print(f"rows: {len(df):,}  re-read: {len(df) - cut:,}  months: {len(folded.monthly)}")
+    print(f"rebuild: {rebuild * 1000:8.1f} ms")
+    print(f"fold:    {fold * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
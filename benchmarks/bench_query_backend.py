@@ -0,0 +1,83 @@
+"""Heavy report queries on the pandas and DuckDB query backends.
+
+Sizes above the generated base frame are made by stacking copies of it
+(the 10M case needs several GB of memory). Run from the repo root:
+    python benchmarks/bench_query_backend.py [rows ...]   # default 100000 1000000 10000000
+"""
+import os
+import sys
+import time
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_loader import OrderDataLoader  # noqa: E402
+from fake_sheets import synthetic_order_rows  # noqa: E402
+from filter_index import OrderFilterIndex  # noqa: E402
+from query_backend import DuckDBBackend, PandasBackend, duckdb  # noqa: E402
+
+BASE_ROWS = 1_000_000
+
+
+def order_frame(n_rows, base):
+    copies = -(-n_rows // len(base))
+    df = pd.concat([base] * copies, ignore_index=True).iloc[:n_rows]
+    for col in base.select_dtypes('category').columns:
+        df[col] = df[col].astype(base[col].dtype)
+    return df
+
+
+def report_queries(df):
+    """(label, by, measures, filters) modelled on the four heavy reports"""
+    year = int(df['Year'].mode()[0])
+    states = df['State'].value_counts().index[:2].tolist()
+    products = df['Product'].value_counts().index[:5].tolist()
+    return [
+        ("Company Analysis metrics", 'Company', {
+            'Total_Revenue': ('Total_Amount', 'sum'), 'Total_Orders': ('Total_Amount', 'count'),
+            'Avg_Order_Value': ('Total_Amount', 'mean'), 'Order_StdDev': ('Total_Amount', 'std'),
+            'Total_Qty': ('Qty', 'sum'), 'Unique_Orders': ('Inquiry_No', 'nunique'),
+            'First_Order': ('Date', 'min'), 'Last_Order': ('Date', 'max'),
+            'Unique_Products': ('Product', 'nunique'), 'Primary_State': ('State', 'mode'),
+        }, dict(Year=year)),
+        ("Customer Segmentation revenue", 'Company', {'Total_Amount': ('Total_Amount', 'sum')}, {}),
+        ("Product Trends monthly series", ['Year_Month', 'Product'], {'Value': ('Total_Amount', 'sum')},
+         dict(Product=products)),
+        ("Regional Comparison metrics", 'State', {
+            'revenue': ('Total_Amount', 'sum'), 'orders': ('Inquiry_No', 'nunique'),
+            'active_months': ('Year_Month', 'nunique'), 'unique_products': ('Product', 'nunique'),
+        }, dict(State=states)),
+    ]
+
+
+def timed(fn, repeat=3):
+    fn()  # Warm-up (DuckDB registers the frame on first use)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000, 10_000_000]
+    if duckdb is None:
+        print("duckdb is not installed, only the pandas backend will run")
+
+    loader = OrderDataLoader()
+    base, _ = loader.clean_and_validate(
+        loader.parse_order_rows(synthetic_order_rows(min(max(sizes), BASE_ROWS))[1:]))
+
+    for n_rows in sizes:
+        df = order_frame(n_rows, base)
+        index = OrderFilterIndex(df)
+        backends = [PandasBackend(df, index)] + ([DuckDBBackend(df, index)] if duckdb is not None else [])
+
+        print(f"\n{len(df):,} rows")
+        print(f"{'':34}" + ''.join(f"{backend.name + ' ms':>12}" for backend in backends))
+        for label, by, measures, filters in report_queries(df):
+            times = [timed(lambda: backend.aggregate(by, measures, **filters)) for backend in backends]
+            print(f"{label:34}" + ''.join(f"{t:12.1f}" for t in times))
+        del df, index, backends
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Per-interaction rerun time of the dashboard script, report by report.
+
+Drives app.py headlessly (streamlit's AppTest) against the offline fake Sheets
+backend: selects each report once (first visit, imports its module), then
+reruns it as a widget interaction would. Reports with fragments also get
+the time to rerun each fragment alone, what a widget inside one costs. Pass
+another copy of the script to compare, e.g. the app before a change:
+    git show HEAD~1:app.py > app_before.py
+    python benchmarks/bench_rerun.py --app app_before.py
+Run from the repo root:
+    python benchmarks/bench_rerun.py [--rows 50000] [--reruns 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import data_loader  # noqa: E402
+from fake_sheets import FakeClientManager, FakeSheetsClient  # noqa: E402
+from streamlit.testing.v1 import AppTest, local_script_runner  # noqa: E402
+
+_RerunData = local_script_runner.RerunData
+
+
+def timed_run(app):
+    start = time.perf_counter()
+    app.run()
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+    return (time.perf_counter() - start) * 1000
+
+
+def timed_fragment_run(app, fragment_id):
+    """Rerun one fragment of the current page, as a widget inside it would (AppTest only does full runs)"""
+    local_script_runner.RerunData = lambda **kwargs: _RerunData(fragment_id_queue=[fragment_id], **kwargs)
+    try:
+        return timed_run(app)
+    finally:
+        local_script_runner.RerunData = _RerunData
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--app', default=os.path.join(ROOT, 'app.py'))
+    parser.add_argument('--rows', type=int, default=50_000)
+    parser.add_argument('--reruns', type=int, default=5, help='reruns timed per report after its first visit')
+    args = parser.parse_args()
+    app_path = os.path.abspath(args.app)
+
+    # Keep snapshots out of the working tree
+    os.chdir(tempfile.mkdtemp(prefix='cmpl_bench_'))
+    client = FakeSheetsClient(seed=1)
+    client.add_order_sheet(n_rows=args.rows)
+    data_loader.SheetsClientManager = lambda: FakeClientManager(client)
+
+    app = AppTest.from_file(app_path, default_timeout=600)
+    start_ms = timed_run(app)
+    reports = app.sidebar.radio[0].options
+    print(f"app: {os.path.relpath(app_path)}  rows: {args.rows:,}  cold start: {start_ms:,.0f} ms")
+    print(f"{'':34}{'first visit ms':>16}{'rerun ms':>12}{'fragment ms':>14}")
+
+    reruns = []
+    for report in reports:
+        app.sidebar.radio[0].set_value(report)
+        first = timed_run(app)
+        times = [timed_run(app) for _ in range(args.reruns)]
+        reruns.extend(times)
+
+        # Fragments registered by the last full run, each rerun on its own (then a full run restores the page)
+        fragment_ids = list(app._fragment_storage._fragments)
+        fragments = [timed_fragment_run(app, fragment_id) for fragment_id in fragment_ids]
+        if fragments:
+            timed_run(app)
+        fragment_ms = f"{statistics.median(fragments):14.1f}" if fragments else f"{'-':>14}"
+        print(f"{report:34}{first:16.1f}{statistics.median(times):12.1f}{fragment_ms}")
+    print(f"{'median rerun, all reports':34}{'':16}{statistics.median(reruns):12.1f}")
+
+
+if __name__ == '__main__':
+    main()
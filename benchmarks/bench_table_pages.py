@@ -0,0 +1,90 @@
+"""Raw Data Explorer per-interaction cost: whole filtered frame vs server-side pages.
+
+"frame" is what every rerun did before: materialize the filtered rows, size
+them deep, build the CSV export and the statistics, then slice the page.
+"pages" filters row positions, orders them by a cached full-snapshot sort
+and materializes only the page (statistics are memoized per filter, the CSV
+is built on click). The last line styles a follow-up table whole vs one page.
+Run from the repo root:
+    python benchmarks/bench_table_pages.py [rows]
+"""
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_query_backend import order_frame  # noqa: E402
+from data_loader import OrderDataLoader  # noqa: E402
+from fake_sheets import synthetic_order_rows  # noqa: E402
+from filter_index import OrderFilterIndex  # noqa: E402
+from reports.brush_followup import color_status  # noqa: E402
+from table_pages import in_order, sort_order  # noqa: E402
+
+BASE_ROWS = 1_000_000
+PAGE = slice(100, 150)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def frame_interaction(df, index, filters, low, high):
+    filtered = index.select(df, **filters)
+    filtered = filtered[(filtered['Date'] >= low) & (filtered['Date'] <= high)]
+    filtered.memory_usage(deep=True).sum()
+    filtered.to_csv(index=False).encode('utf-8')
+    filtered['Total_Amount'].sum(), filtered['Inquiry_No'].nunique()
+    return filtered.sort_values('Total_Amount', ascending=False).iloc[PAGE]
+
+
+def page_interaction(df, index, filters, low, high, order):
+    rows = index.rows(**filters)
+    dates = df['Date'].to_numpy()
+    rows = np.flatnonzero((dates >= low) & (dates <= high)) if rows is None \
+        else rows[(dates[rows] >= low) & (dates[rows] <= high)]
+    return df.iloc[in_order(order, rows, len(df))[PAGE]]
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    loader = OrderDataLoader()
+    base, _ = loader.clean_and_validate(loader.parse_order_rows(synthetic_order_rows(min(n_rows, BASE_ROWS))[1:]))
+    df = order_frame(n_rows, base)
+    index = OrderFilterIndex(df)
+    low, high = df['Date'].min().to_datetime64(), df['Date'].max().to_datetime64()
+    states = df['State'].value_counts().index.tolist()
+    products = df['Product'].value_counts().index[:5].tolist()
+
+    order_ms = timed(lambda: sort_order(df['Total_Amount'], ascending=False))
+    order = sort_order(df['Total_Amount'], ascending=False)
+    print(f"rows: {len(df):,}  full-snapshot sort by Total_Amount (once per snapshot): {order_ms:,.0f} ms")
+    print(f"{'':34}{'rows':>10}{'frame ms':>12}{'pages ms':>12}")
+    for label, filters in [
+        ("All rows", {}),
+        ("Two states", {'State': states[:2]}),
+        ("One state, five products", {'State': states[:1], 'Product': products}),
+    ]:
+        expected = frame_interaction(df, index, filters, low, high)
+        got = page_interaction(df, index, filters, low, high, order)
+        if not got['Total_Amount'].reset_index(drop=True).equals(expected['Total_Amount'].reset_index(drop=True)):
+            raise AssertionError(f"{label}: pages differ")
+        frame = timed(lambda: frame_interaction(df, index, filters, low, high))
+        pages = timed(lambda: page_interaction(df, index, filters, low, high, order))
+        matched = len(index.select(df, **filters))
+        print(f"{label:34}{matched:10,}{frame:12.1f}{pages:12.1f}")
+
+    table = pd.DataFrame({
+        'Company': df['Company'].astype(str).to_numpy()[:50_000],
+        'Status': np.random.default_rng(0).choice(['🔴 Overdue', '🟠 Due This Week', '🟢 Future'], 50_000),
+    })
+    whole = timed(lambda: table.style.applymap(color_status, subset=['Status']).to_html())
+    page = timed(lambda: table.iloc[PAGE].style.applymap(color_status, subset=['Status']).to_html())
+    print(f"{'Styled follow-up table':34}{len(table):10,}{whole:12.1f}{page:12.1f}")
+
+
+if __name__ == '__main__':
+    main()
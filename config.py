@@ -4,6 +4,28 @@
 SHEET_ID = "169hKphPMANY80czkxcAZvqtvQMqfagC_jVnEuOZqhwk"  # Replace with your actual Sheet ID
 SHEET_NAME = "Order Confirmation"  # Your sub-sheet name
 CREDENTIALS_FILE = "service_account.json"
+SHEETS_POOL_SIZE = 10  # Keep-alive HTTPS connections shared by all dashboard sessions
+TOKEN_REFRESH_MARGIN = 300  # Refresh the OAuth token this many seconds before it expires
+SHEETS_QUOTA_PER_MINUTE = 60  # Sheets API calls per minute shared by all sessions (Google default per user)
+SHEETS_MAX_RETRIES = 5  # Retries on quota/server errors, with jittered exponential backoff
+SHEETS_BACKOFF_BASE = 1.0  # Seconds before the first retry
+FETCH_MODE = "ranges"  # "ranges" = only the used columns via batch_get, "full" = get_all_values
+SYNC_RECHECK_ROWS = 50  # Trailing rows re-read on every refresh to pick up edits
+
+# Local snapshot of the cleaned data (served on cold start)
+SNAPSHOT_DIR = ".cache/orders"  # Year=YYYY/Month=MM Parquet partitions; past months are never rewritten
+REJECTS_PATH = ".cache/order_rejects.parquet"  # Quarantined rows that failed validation
+SNAPSHOT_SCHEMA_VERSION = 5  # Bump when clean_data output columns/types change
+
+# Out-of-core mode: the full history stays in the partitioned snapshot and is streamed in chunks
+OUT_OF_CORE = False  # Hold only the newest months in memory (needs pyarrow)
+MEMORY_LIMIT_MB = 1024  # Out-of-core: ceiling for order rows in memory (recent months + one scan chunk)
+SCAN_CHUNK_ROWS = 200_000  # Out-of-core: rows per chunk when streaming the snapshot
+
+# Report aggregates memoized across sessions (per snapshot version + filters)
+AGGREGATE_CACHE_MB = 256  # Least recently used aggregates are dropped past this size
+QUERY_BACKEND = "auto"  # "duckdb", "pandas", or "auto" (DuckDB when installed)
+FIGURE_CACHE_MB = 64  # Built Plotly figures (as JSON) reused while their data is unchanged
 
 # Brush/Sweeper/Broomer Data Sheet
 BRUSH_SHEET_NAME = "Brommer Brush Data"  # Target sheet for brush data
@@ -11,4 +33,4 @@ BRUSH_SHEET_NAME = "Brommer Brush Data"  # Target sheet for brush data
 # Dashboard Settings
 DASHBOARD_TITLE = "📊 Order Confirmation Live Dashboard"
 CURRENCY = "₹"
-REFRESH_INTERVAL = 3600  # 5 minutes
+REFRESH_INTERVAL = 300  # 5 minutes, background re-pull of the order sheet
@@ -1,108 +1,808 @@
+import hashlib
+import os
+import threading
+import time
+from collections import namedtuple
 import gspread
-from google.oauth2.service_account import Credentials
+from gspread.utils import a1_to_rowcol
 import pandas as pd
 import numpy as np
 import streamlit as st
-from config import SHEET_ID, SHEET_NAME, CREDENTIALS_FILE, BRUSH_SHEET_NAME
+from config import (
+    SHEET_ID, SHEET_NAME, BRUSH_SHEET_NAME, FETCH_MODE,
+    SYNC_RECHECK_ROWS, REFRESH_INTERVAL, REJECTS_PATH, SNAPSHOT_SCHEMA_VERSION,
+    OUT_OF_CORE, MEMORY_LIMIT_MB, SCAN_CHUNK_ROWS,
+)
+from aggregate_cache import AggregateCache
+from filter_index import OrderFilterIndex
+from order_cube import CUBE_COLUMNS, OrderCube
+from order_store import PartitionedOrderStore, month_codes, recent_months, row_bytes
+from period_rollups import PeriodRollups, SOURCE_COLUMNS
+from query_backend import ChunkedBackend, create_backend
+from sheets_client import SheetsClientManager, SheetsRequestScheduler, is_quota_error
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # Local snapshots and fast date parsing need pyarrow
+    pa = None
+    pc = None
+    pq = None
+
+OrderField = namedtuple('OrderField', ['name', 'column', 'brush_header'])
+
+# Sheet layout: DataFrame field, source column in the order sheet and the
+# header it is stored under in the brush sheet (None = not stored)
+ORDER_FIELDS = [
+    OrderField('Date', 'A', 'Purchase Date'),            # Timestamp
+    OrderField('Inquiry_No', 'B', 'Inquiry No'),         # Inquiry No
+    OrderField('Company', 'F', 'Company Name'),          # Company Name
+    OrderField('Client_Name', 'G', 'Client Name'),       # Client Name
+    OrderField('Product', 'H', 'Product'),               # Product Description
+    OrderField('Qty', 'I', 'Quantity'),                  # Quantity
+    OrderField('City', 'J', 'City'),                     # City
+    OrderField('State', 'K', 'State'),                   # State
+    OrderField('Total_Amount', 'P', 'Total Amount (₹)'), # Total Amount
+    OrderField('EDD', 'U', None),                        # Delivery Date
+]
+
+# Brush sheet column order: readers take the columns by position, State before City
+BRUSH_COLUMNS = ['Date', 'Inquiry_No', 'Company', 'Client_Name', 'Product', 'Qty', 'State', 'City', 'Total_Amount']
+
+
+def column_index(letter):
+    """0-based position of a sheet column letter"""
+    return a1_to_rowcol(f"{letter}1")[1] - 1
+
+
+def order_column_ranges(first_row=2):
+    """Group ORDER_FIELDS into contiguous A1 column ranges starting at first_row"""
+    groups = []
+    for field in sorted(ORDER_FIELDS, key=lambda f: column_index(f.column)):
+        if groups and column_index(field.column) == column_index(groups[-1][-1].column) + 1:
+            groups[-1].append(field)
+        else:
+            groups.append([field])
+    
+    return [
+        (f"{group[0].column}{first_row}:{group[-1].column}", group)
+        for group in groups
+    ]
+
+
+# Sheet date formats, tried in order before falling back to per-value inference
+DATE_FORMATS = [
+    '%d/%m/%Y %H:%M:%S',  # Form timestamp
+    '%d/%m/%Y',
+    '%d-%m-%Y',
+    '%d/%m/%Y %H:%M',
+    '%Y-%m-%d',
+]
+
+# Low-cardinality dimensions stored as categoricals in the cleaned frame
+CATEGORY_COLUMNS = ['State', 'Product', 'Company', 'Client_Name', 'City', 'Month_Name']
+
+MONTH_NAMES = [
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+]
+
+# State values that mean "no state given" (after title-casing)
+STATE_PLACEHOLDERS = {'N/A': 'Not Specified', 'Na': 'Not Specified', '': 'Not Specified'}
+
+
+def parse_sheet_dates(values):
+    """Parse day-first sheet dates, trying DATE_FORMATS before inference"""
+    # Each distinct string is parsed once (delivery dates repeat a lot)
+    codes, uniques = pd.factorize(values.astype(str).str.strip())
+    strings = np.asarray(uniques, dtype=object)
+    parsed = np.full(len(strings), np.datetime64('NaT'), dtype='datetime64[ns]')
+    pending = strings != ''
+    
+    for fmt in DATE_FORMATS:
+        if not pending.any():
+            break
+        rows = np.flatnonzero(pending)
+        attempt = _strptime(strings[rows], fmt)
+        hit = ~np.isnat(attempt)
+        parsed[rows[hit]] = attempt[hit]
+        pending[rows[hit]] = False
+    
+    # Whatever is left matches no known format: infer value by value
+    if pending.any():
+        rows = np.flatnonzero(pending)
+        parsed[rows] = pd.to_datetime(
+            pd.Series(strings[rows]), format='mixed', dayfirst=True, errors='coerce'
+        ).to_numpy(dtype='datetime64[ns]')
+    
+    return pd.Series(parsed[codes], index=values.index)
+
+
+def _strptime(strings, fmt):
+    """Parse strings with one explicit format, NaT where they don't match"""
+    if pc is None:
+        return pd.to_datetime(
+            pd.Series(strings), format=fmt, errors='coerce'
+        ).to_numpy(dtype='datetime64[ns]')
+    
+    parsed = pc.strptime(pa.array(strings, type=pa.string()), format=fmt, unit='s', error_is_null=True)
+    parsed = parsed.to_numpy(zero_copy_only=False)
+    
+    # Arrow also takes 2-digit and far-off years (1/2/23 is year 23), which a plain
+    # cast to datetime64[ns] silently wraps: outside its range is no match
+    in_range = (parsed >= np.datetime64(pd.Timestamp.min)) & (parsed <= np.datetime64(pd.Timestamp.max))
+    parsed = np.where(in_range, parsed, np.datetime64('NaT')).astype('datetime64[ns]')
+    
+    # Arrow rolls impossible days (31/04) over into day 1-3 of the next
+    # month, so re-check just those rows with the strict pandas parser
+    day = (parsed.astype('datetime64[D]') - parsed.astype('datetime64[M]')).astype(int) + 1
+    suspect = np.flatnonzero(~np.isnat(parsed) & (day <= 3))
+    if len(suspect):
+        parsed[suspect] = pd.to_datetime(
+            pd.Series(strings[suspect]), format=fmt, errors='coerce'
+        ).to_numpy(dtype='datetime64[ns]')
+    
+    return parsed
+
+
+def normalize_text(values, title=False, replace=None):
+    """Strip (and optionally title-case) each distinct value once, as a categorical"""
+    codes, uniques = pd.factorize(values)
+    cleaned = pd.Series(uniques, dtype=object).str.strip()
+    if title:
+        cleaned = cleaned.str.title()
+    if replace:
+        cleaned = cleaned.replace(replace)
+    
+    # Several raw spellings can clean to the same value: recode onto the
+    # sorted distinct cleaned values
+    categories = pd.Index(cleaned.dropna().unique()).sort_values()
+    recode = categories.get_indexer(cleaned)
+    codes = np.where(codes >= 0, recode[codes], -1)
+    
+    return pd.Series(pd.Categorical.from_codes(codes, categories), index=values.index)
+
+
+def concat_rejects(frames):
+    """Concatenate quarantine tables, skipping empty ones"""
+    frames = [frame for frame in frames if frame is not None and not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=['Reason'])
+    return pd.concat(frames)
+
+
+def concat_orders(frames):
+    """Concatenate cleaned order frames without losing the categorical columns"""
+    frames = [frame for frame in frames if not frame.empty]
+    if len(frames) < 2:
+        return frames[0] if frames else pd.DataFrame()
+    
+    # Shallow copies: only columns whose categories differ from the union are recoded,
+    # the history frame keeps its arrays unless a sync brings a new value
+    frames = [frame.copy(deep=False) for frame in frames]
+    for col in CATEGORY_COLUMNS:
+        categories = frames[0][col].cat.categories
+        for frame in frames[1:]:
+            categories = categories.union(frame[col].cat.categories)
+        for frame in frames:
+            if not frame[col].cat.categories.equals(categories):
+                frame[col] = frame[col].cat.set_categories(categories)
+    
+    return pd.concat(frames)
+
+
+def missing_key_values(df):
+    """Empty cells in the key columns (Data Integrity panel)"""
+    key_cols = [col for col in ['Inquiry_No', 'Date', 'State', 'Product'] if col in df.columns]
+    return int(df[key_cols].isnull().sum().sum())
+
+
+class RowHashes:
+    """Content hash per cleaned row (by sheet row), kept to count duplicate rows per sync
+
+    apply() swaps the rows from a sheet row on for re-read ones, touching only
+    those hashes and the distinct-hash table instead of re-hashing the frame.
+    """
+    
+    def __init__(self, df=None, _state=None):
+        if _state is not None:
+            self.positions, self.hashes, self.distinct, self.counts = _state
+            return
+        self.positions = df.index.to_numpy(dtype=np.int64)
+        self.hashes = _hash_frame(df)
+        self.distinct, self.counts = np.unique(self.hashes, return_counts=True)
+    
+    @property
+    def duplicates(self):
+        """Rows identical to an earlier row"""
+        return len(self.hashes) - len(self.distinct)
+    
+    def apply(self, cut, added):
+        """New instance with the rows from sheet row cut on replaced by added"""
+        keep = np.searchsorted(self.positions, cut)
+        removed = self.hashes[keep:]
+        new = _hash_frame(added)
+        
+        counts = self.counts.copy()
+        np.subtract.at(counts, np.searchsorted(self.distinct, removed), 1)
+        found = np.searchsorted(self.distinct, new).clip(max=max(len(self.distinct) - 1, 0))
+        known = (self.distinct[found] == new) if len(self.distinct) else np.zeros(len(new), dtype=bool)
+        np.add.at(counts, found[known], 1)
+        
+        # Hashes not seen before go in at their sorted place
+        fresh, fresh_counts = np.unique(new[~known], return_counts=True)
+        at = np.searchsorted(self.distinct, fresh)
+        distinct = np.insert(self.distinct, at, fresh)
+        counts = np.insert(counts, at, fresh_counts)
+        present = counts > 0
+        
+        return RowHashes(_state=(
+            np.concatenate([self.positions[:keep], added.index.to_numpy(dtype=np.int64)]),
+            np.concatenate([self.hashes[:keep], new]),
+            distinct[present], counts[present],
+        ))
+
+
+def _hash_frame(df):
+    if df.empty:
+        return np.empty(0, dtype=np.uint64)
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+class OrderSnapshot(namedtuple('OrderSnapshot', [
+    'df', 'rejects', 'ingest_report', 'version', 'synced_at', 'filter_index', 'cube', 'rollups', 'queries',
+])):
+    """Published loader state: replaced as a whole on every sync, never modified in place"""
+    __slots__ = ()
+    
+    def view(self):
+        """Order frame for one render; shares the column data, added columns stay local"""
+        return self.df.copy(deep=False)
+
+
+# Rows shorter than this are incomplete and skipped ("full" fetch mode)
+MIN_ROW_LENGTH = 21
 
 class OrderDataLoader:
     def __init__(self):
-        self.df = None
+        # Current OrderSnapshot, swapped (never mutated) by each sync
+        self.snapshot = None
+        
+        # Incremental sync state: data rows ingested so far and a hash of
+        # the last SYNC_RECHECK_ROWS of them, used to spot edits
+        self.synced_rows = 0
+        self.tail_hash = None
+        self.row_hashes = None  # RowHashes of the frame the last sync reported on
+        self._sync_lock = threading.Lock()
+        self.last_sync_error = None
+        
+        # Single-flight loading shared by every session of the process
+        self._load_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread = None
         
+        # Periodic background refresh (start_refresh_worker)
+        self._worker = None
+        self._stop = threading.Event()
+        self.refresh_interval = REFRESH_INTERVAL
+        self.next_refresh_at = None
+        
+        # Credentials, token and HTTP pool are reused across calls
+        self.client_manager = SheetsClientManager()
+        
+        # Every Sheets API call goes through this queue (quota, retries, metrics)
+        self.scheduler = SheetsRequestScheduler()
+        self._handles = {}
+
+        # Report aggregates shared by every session, keyed on snapshot version + filters
+        self.aggregates = AggregateCache()
+        self.store = PartitionedOrderStore()
+        
+        # Out-of-core: memory keeps the newest months, the partitioned snapshot the history
+        self.out_of_core = OUT_OF_CORE and pq is not None
+        
+    @property
+    def df(self):
+        return self.snapshot.df if self.snapshot is not None else None
+    
+    @property
+    def rejects(self):
+        """Quarantined sheet rows (with a Reason)"""
+        return self.snapshot.rejects if self.snapshot is not None else None
+    
+    @property
+    def ingest_report(self):
+        return self.snapshot.ingest_report if self.snapshot is not None else {}
+    
+    @property
+    def synced_at(self):
+        return self.snapshot.synced_at if self.snapshot is not None else None
+    
     def connect(self):
-        """Connect to Google Sheets"""
+        """Connect to Google Sheets (one shared, pooled client)"""
         try:
-            scope = [
-                'https://spreadsheets.google.com/feeds',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            creds = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=scope)
-            client = gspread.authorize(creds)
-            return client
+            return self.client_manager.get_client()
         except Exception as e:
             st.error(f"Connection Error: {e}")
             return None
     
-    @st.cache_data(ttl=300)
-    def fetch_data(_self):
-        """Fetch data from Google Sheet"""
+    def fetch_data(self):
+        """Fetch data from Google Sheet (loaded once, kept fresh by the refresh worker)"""
+        if self.df is None:
+            # First session loads, concurrent sessions wait for it instead of downloading too
+            with self._load_lock:
+                if self.df is None:
+                    return self._load()
+        return self.df
+    
+    def reload(self):
+        """Blocking full re-read of the sheet"""
+        with self._load_lock:
+            return self._load(full=True)
+    
+    def refresh(self):
+        """Start a background sync unless one is already running"""
+        with self._refresh_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return False
+            self._refresh_thread = threading.Thread(target=self._reconcile, daemon=True)
+            self._refresh_thread.start()
+            return True
+    
+    def _load(self, full=False):
+        """Synchronous load: local snapshot if there is one, otherwise the sheet"""
         try:
-            client = _self.connect()
-            if not client:
-                return None
-                
-            sheet = client.open_by_key(SHEET_ID)
-            worksheet = sheet.worksheet(SHEET_NAME)
-            
-            # Get all values
-            all_values = worksheet.get_all_values()
-            data_rows = all_values[1:]  # Skip header
+            if not full and self.load_snapshot():
+                # Serve the local snapshot now, catch up with the sheet in the background
+                self.refresh()
+                return self.df
+            return self.sync_data(full=full)
+        except Exception as e:
+            if is_quota_error(e):
+                st.error("Data Fetch Error: Google Sheets quota exceeded, please retry in a minute")
+            else:
+                st.error(f"Data Fetch Error: {e}")
+            return None
+    
+    def sync_data(self, full=False):
+        """Bring self.df up to date, cleaning only rows appended since the last sync; raises on failure"""
+        with self._sync_lock:
+            # Not connect(): this also runs on the refresh thread, where st.error can't
+            # be shown, and a failed connection has to reach last_sync_error
+            client = self.client_manager.get_client()
             
-            # Extract columns: A=0, B=1, D=3, E=4, G=6, H=7, I=8, O=14, S=18
-            processed_data = []
-            for row in data_rows:
-                if len(row) >= 21:
-                    try:
-                        processed_data.append({
-                            'Date': row[0],           # A: Timestamp
-    'Inquiry_No': row[1],     # B: Inquiry No
-    'Company': row[5],        # F: Company Name
-    'Client_Name': row[6],    # G: Client Name ✅ Correct
-    'Product': row[7],        # H: Product Description
-    'Qty': row[8],            # I: Quantity
-    'City': row[9],           # J: City ✅
-    'State': row[10],          # H: State ✅ 
-    'Total_Amount': row[15],  # P: Total Amount
-    'EDD': row[20]            # U: Delivery Date
-                        })
-                    except:
-                        continue
+            try:
+                worksheet = self.open_worksheet(client, SHEET_NAME)
+                return self._sync_worksheet(worksheet, full)
+            except Exception:
+                self._handles.clear()
+                raise
+    
+    def _sync_worksheet(self, worksheet, full):
+        """Incremental (or full) sync against an open order worksheet"""
+        # Out-of-core, the saved snapshot holds rows memory doesn't and must be at the watermark
+        stale_store = self.out_of_core and not self.store.holds(self.synced_rows, self.tail_hash)
+        if full or self.df is None or stale_store:
+            raw = self.read_order_rows(worksheet)
+            self._ingest(raw, cut=0, total_rows=self._end_row(raw, 0))
+            return self.df
+        
+        # Re-read a small window before the watermark to catch edits
+        start = max(0, self.synced_rows - SYNC_RECHECK_ROWS)
+        raw = self.read_order_rows(worksheet, first_row=start + 2)
+        total_rows = self._end_row(raw, start)
+        
+        if total_rows < self.synced_rows:
+            # Rows were deleted, the watermark is no longer valid
+            raw = self.read_order_rows(worksheet)
+            self._ingest(raw, cut=0, total_rows=self._end_row(raw, 0))
+            return self.df
+        
+        if self._hash_rows(raw[raw.index < self.synced_rows]) == self.tail_hash:
+            # Window unchanged, only the appended rows are new
+            cut = self.synced_rows
+        else:
+            cut = start
+        
+        self._ingest(raw, cut=cut, total_rows=total_rows)
+        return self.df
+    
+    def start_refresh_worker(self, interval=None):
+        """Re-pull the sheet every interval seconds on a daemon thread"""
+        with self._refresh_lock:
+            if self._worker is not None and self._worker.is_alive():
+                return False
+            self.refresh_interval = interval or REFRESH_INTERVAL
+            self.next_refresh_at = time.time() + self.refresh_interval
+            self._stop.clear()
+            self._worker = threading.Thread(target=self._refresh_loop, name='order-refresh', daemon=True)
+            self._worker.start()
+            return True
+    
+    def stop_refresh_worker(self):
+        self._stop.set()
+    
+    def _refresh_loop(self):
+        """Sleep until the next refresh is due, sync, repeat"""
+        while not self._stop.wait(max(0.0, self.next_refresh_at - time.time())):
+            self.next_refresh_at = time.time() + self.refresh_interval
+            self._reconcile()
+    
+    def _reconcile(self):
+        """Background catch-up with the sheet"""
+        try:
+            self.sync_data()
+            self.last_sync_error = None
+        except Exception as e:
+            self.last_sync_error = str(e)
+    
+    def reset_sync(self):
+        """Forget the sync watermark so the next sync re-reads the whole sheet"""
+        with self._sync_lock:
+            if self.snapshot is not None:
+                self.snapshot.queries.close()
+            self.snapshot = None
+            self.synced_rows = 0
+            self.tail_hash = None
+            self.row_hashes = None
+    
+    def _ingest(self, raw, cut, total_rows):
+        """Re-clean raw rows from position cut onward, splice them in and move the watermark"""
+        delta = raw[raw.index >= cut]
+        cleaned, rejects = self.clean_and_validate(delta.copy())
+        
+        # Rows dropped by the row-length guard ("full" fetch mode)
+        short_rows = [pos for pos in raw.attrs.get('short_rows', []) if pos >= cut]
+        if short_rows:
+            short = pd.DataFrame({'Reason': 'Short row'}, index=short_rows)
+            rejects = concat_rejects([rejects, short]).sort_index()
+        
+        if cut and cut == self.synced_rows and delta.empty and not short_rows:
+            # Nothing appended: keep the published snapshot (and every cache keyed on its version)
+            self.snapshot = self.snapshot._replace(synced_at=time.time())
+            return
+        
+        removed = kept = None
+        if cut == 0 or self.df is None:
+            df = cleaned
+            rollups = cube = None
+            row_hashes = RowHashes(cleaned)
+            missing = missing_key_values(cleaned)
+        else:
+            # Rows before cut stay as they are, the index and query backend only take in the rest
+            kept = int(self.df.index.searchsorted(cut))
+            # Out-of-core, re-read rows of months not in memory are only in the saved snapshot
+            removed = self.store.read(since=cut) if self.out_of_core else self.df.iloc[kept:]
+            df = concat_orders([self.df.iloc[:kept], cleaned])
+            rejects = concat_rejects([self.rejects[self.rejects.index < cut], rejects])
+            # Period rollups only take in the re-read rows, not the whole frame
+            rollups = self.snapshot.rollups.apply(removed=removed, added=cleaned)
+            # Same for the cube; months that lost rows are re-aggregated from the spliced frame
+            cube = None if self.out_of_core else self.snapshot.cube.apply(
+                removed=removed, added=cleaned, month_rows=lambda codes: df[np.isin(month_codes(df), codes)])
+            # Duplicates: only the re-read rows are hashed (after a restart, the loaded frame once)
+            row_hashes = (self.row_hashes or RowHashes(self.df)).apply(cut, cleaned)
+            missing = self.ingest_report.get('missing_key_values')
+            missing = missing_key_values(df) if missing is None else \
+                missing - missing_key_values(removed) + missing_key_values(cleaned)
+        report = self._build_ingest_report(df, rejects, row_hashes.duplicates, missing)
+        self.row_hashes = row_hashes
+        base = (self.synced_rows, self.tail_hash)
+        tail_hash = self._hash_rows(raw[raw.index >= total_rows - SYNC_RECHECK_ROWS])
+        
+        if self.out_of_core:
+            if cut and self.df is not None:
+                # df is only the months in memory, count the saved history instead
+                report['rows_loaded'] = self.snapshot.queries.rows + len(cleaned) - (len(removed) if removed is not None else 0)
+            self._ingest_out_of_core(df, rejects, report, rollups, removed, cleaned, cut, base, total_rows, tail_hash)
+            return
+        
+        # Everything is built off to the side, renders keep the old snapshot until this swap
+        self.publish(df, rejects, report, synced_at=time.time(), rollups=rollups, cube=cube, kept=kept)
+        self.synced_rows = total_rows
+        self.tail_hash = tail_hash
+        
+        if not delta.empty or cut == 0:
+            self.save_snapshot(cut, base)
+    
+    def _ingest_out_of_core(self, df, rejects, report, rollups, removed, added, cut, base, total_rows, tail_hash):
+        """Save first (the snapshot is the history), then publish only the newest months"""
+        synced_at = time.time()
+        if rollups is None:
+            rollups = PeriodRollups(df)  # Full sync, the whole cleaned sheet is at hand anyway
+        history = self.store.write(df, self._snapshot_info(total_rows, tail_hash, report, synced_at), cut=cut, base=base)
+        self._save_rejects(rejects)
+        if cut and self.df is not None:
+            # Months that lost rows are re-aggregated from the snapshot just written
+            cube = self.snapshot.cube.apply(removed, added, month_rows=lambda codes: self.store.read_months(
+                codes, columns=CUBE_COLUMNS, manifest=history))
+        else:
+            cube = OrderCube(df)
+        
+        # Months already dropped from memory stay out, then trim to MEMORY_LIMIT_MB beside one scan chunk
+        codes = month_codes(df)
+        if cut and self.df is not None and not self.df.empty:
+            keep = codes >= month_codes(self.df).min()
+            df, codes = df[keep], codes[keep]
+        if not df.empty:
+            start = recent_months(pd.Series(codes).value_counts(), row_bytes(df), MEMORY_LIMIT_MB * 2**20, SCAN_CHUNK_ROWS)
+            df = df[codes >= start]
+        
+        self.publish(df, rejects, report, synced_at=synced_at, rollups=rollups, history=history, cube=cube)
+        self.synced_rows = total_rows
+        self.tail_hash = tail_hash
+    
+    def publish(self, df, rejects, report, synced_at, rollups=None, history=None, cube=None, kept=None):
+        """Swap in a new OrderSnapshot (index, cube, rollups and query backend built here, off the render path)
+        
+        Out-of-core, df holds only the newest months and history is the saved
+        manifest; the cube, rollups and query backend then cover the full history.
+        When the first kept rows of df are the current snapshot's, its filter
+        index and query backend are carried over and only take in the rest.
+        """
+        version = self.snapshot.version + 1 if self.snapshot is not None else 1
+        incremental = kept and history is None and self.snapshot is not None
+        filter_index = self.snapshot.filter_index.apply(kept, df) if incremental else OrderFilterIndex(df)
+        if history is not None:
+            queries = ChunkedBackend(self.store, history)
+            if rollups is None:
+                rollups = PeriodRollups.from_chunks(self.store.scan(columns=SOURCE_COLUMNS, manifest=history))
+            if cube is None:
+                cube = OrderCube.from_chunks(self.store.scan(columns=CUBE_COLUMNS, manifest=history))
+        elif incremental:
+            queries = self.snapshot.queries.apply(df, filter_index)
+        else:
+            queries = create_backend(df, filter_index)
+        previous = self.snapshot
+        self.snapshot = OrderSnapshot(
+            df, rejects, report, version, synced_at, filter_index, cube if cube is not None else OrderCube(df),
+            rollups if rollups is not None else PeriodRollups(df), queries,
+        )
+        if previous is not None:
+            previous.queries.close()
+    
+    def _build_ingest_report(self, df, rejects, duplicate_rows, missing):
+        """Counts shown in the Data Integrity panel, computed once per sync"""
+        return {
+            'rows_loaded': len(df),
+            'rows_rejected': len(rejects),
+            'reject_counts': {str(k): int(v) for k, v in rejects['Reason'].value_counts().items()},
+            'duplicate_rows': int(duplicate_rows),
+            'missing_key_values': int(missing),
+            'synced_at': pd.Timestamp.now().isoformat(),
+        }
+    
+    # ==================== LOCAL SNAPSHOT ====================
+    
+    def save_snapshot(self, cut=0, base=None):
+        """Write the cleaned frame and sync watermark to the partitioned store
+        
+        Only partitions holding rows from cut onward are written when the store
+        still holds the base (synced_rows, tail_hash) state; cut=0 rewrites all.
+        """
+        if pq is None or self.df is None:
+            return False
+        
+        try:
+            self._save_rejects(self.rejects)
+            self.store.write(self.df, self._snapshot_info(self.synced_rows, self.tail_hash,
+                                                          self.ingest_report, self.synced_at), cut=cut, base=base)
+            return True
+        except Exception:
+            return False
+    
+    def _snapshot_info(self, synced_rows, tail_hash, report, synced_at):
+        """Manifest fields a restart needs to resume syncing"""
+        return {
+            'schema_version': SNAPSHOT_SCHEMA_VERSION,
+            'synced_rows': synced_rows,
+            'tail_hash': tail_hash,
+            'ingest_report': report,
+            'synced_at': synced_at,
+        }
+    
+    def _save_rejects(self, rejects):
+        rejects_table = pa.Table.from_pandas(concat_rejects([rejects]).astype(str), preserve_index=True)
+        
+        # Write next to the target and swap, so readers never see half a file
+        os.makedirs(os.path.dirname(REJECTS_PATH) or '.', exist_ok=True)
+        tmp_path = f"{REJECTS_PATH}.tmp"
+        pq.write_table(rejects_table, tmp_path)
+        os.replace(tmp_path, REJECTS_PATH)
+    
+    def load_snapshot(self):
+        """Restore the cleaned frame (out-of-core: its newest months) and sync watermark from the store"""
+        if pq is None:
+            return False
+        
+        try:
+            info = self.store.manifest()
+            if info is None or info.get('schema_version') != SNAPSHOT_SCHEMA_VERSION:
+                return False
+            if self.out_of_core:
+                df = self.store.read_recent(MEMORY_LIMIT_MB * 2**20, SCAN_CHUNK_ROWS, manifest=info)
+            else:
+                df = self.store.read(manifest=info)
+            if df is None:
+                return False
             
-            df = pd.DataFrame(processed_data)
-            df = _self.clean_data(df)
-            return df
+            rejects = pq.read_table(REJECTS_PATH).to_pandas() if os.path.exists(REJECTS_PATH) else None
             
-        except Exception as e:
-            st.error(f"Data Fetch Error: {e}")
+            with self._sync_lock:
+                self.publish(df, concat_rejects([rejects]), info.get('ingest_report', {}),
+                             synced_at=info.get('synced_at'), history=info if self.out_of_core else None)
+                self.synced_rows = info['synced_rows']
+                self.tail_hash = info['tail_hash']
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _end_row(raw, start):
+        """Data row position just past the last row of a raw frame read from start"""
+        positions = list(raw.index[-1:]) + raw.attrs.get('short_rows', [])[-1:]
+        return int(max(positions)) + 1 if positions else start
+    
+    @staticmethod
+    def _hash_rows(raw):
+        """Content hash of raw sheet rows"""
+        if raw.empty:
             return None
+        hashes = pd.util.hash_pandas_object(raw, index=True).values
+        return hashlib.sha1(hashes.tobytes()).hexdigest()
+    
+    def open_spreadsheet(self, client):
+        """Spreadsheet handle, opened once per client"""
+        key = (id(client), SHEET_ID)
+        if key not in self._handles:
+            self._handles[key] = self.scheduler.call(client.open_by_key, SHEET_ID, key=('open_by_key', SHEET_ID))
+        return self._handles[key]
+    
+    def open_worksheet(self, client, title):
+        """Worksheet handle, opened once per client and title"""
+        key = (id(client), title)
+        if key not in self._handles:
+            sheet = self.open_spreadsheet(client)
+            self._handles[key] = self.scheduler.call(sheet.worksheet, title, key=('worksheet', title))
+        return self._handles[key]
+    
+    def read_order_rows(self, worksheet, first_row=2):
+        """Raw (uncleaned) order rows from first_row down, indexed by data row position"""
+        if FETCH_MODE == "full":
+            # Get all values
+            all_values = self.scheduler.call(
+                worksheet.get_all_values, key=('get_all_values', worksheet.title)
+            )
+            data_rows = all_values[first_row - 1:]  # Skip header and synced rows
+            return self.parse_order_rows(data_rows, start=first_row - 2)
+        
+        # Only the columns in ORDER_FIELDS, one batch_get call
+        return self.read_order_columns(worksheet, first_row=first_row)
+    
+    def parse_order_rows(self, data_rows, start=0):
+        """Build the order frame column by column from raw sheet rows"""
+        positions = [start + i for i, row in enumerate(data_rows) if len(row) >= MIN_ROW_LENGTH]
+        rows = [row for row in data_rows if len(row) >= MIN_ROW_LENGTH]
+        short_rows = [start + i for i, row in enumerate(data_rows) if len(row) < MIN_ROW_LENGTH]
+        if not rows:
+            frame = pd.DataFrame(columns=[field.name for field in ORDER_FIELDS])
+            frame.attrs['short_rows'] = short_rows
+            return frame
+        
+        # Transpose once in C instead of building a dict per row
+        sheet_columns = list(zip(*rows))
+        columns = {
+            field.name: np.array(sheet_columns[column_index(field.column)], dtype=object)
+            for field in ORDER_FIELDS
+        }
+        frame = pd.DataFrame(columns, index=positions)
+        frame.attrs['short_rows'] = short_rows
+        return frame
+    
+    def read_order_columns(self, worksheet, first_row=2):
+        """Read only the ORDER_FIELDS columns from first_row down in one batch_get"""
+        ranges = order_column_ranges(first_row)
+        range_names = [rng for rng, _ in ranges]
+        blocks = self.scheduler.call(
+            worksheet.batch_get, range_names, major_dimension='COLUMNS',
+            key=('batch_get', worksheet.title, tuple(range_names)),
+        )
+        
+        # The API trims trailing blanks per column, pad back to the tallest one
+        n_rows = max((len(col) for block in blocks for col in block), default=0)
+        if n_rows == 0:
+            return pd.DataFrame(columns=[field.name for field in ORDER_FIELDS])
+        
+        columns = {}
+        for (_, fields), block in zip(ranges, blocks):
+            for pos, field in enumerate(fields):
+                values = list(block[pos]) if pos < len(block) else []
+                values.extend([''] * (n_rows - len(values)))
+                columns[field.name] = np.array(values, dtype=object)
+        
+        return pd.DataFrame(
+            {field.name: columns[field.name] for field in ORDER_FIELDS},
+            index=pd.RangeIndex(first_row - 2, first_row - 2 + n_rows)
+        )
     
     def clean_data(self, df):
         """Clean and format data"""
+        df, _ = self.clean_and_validate(df)
+        return df
+    
+    def clean_and_validate(self, df):
+        """Clean raw rows; returns (clean frame, rejected rows with a Reason)"""
         if df.empty:
-            return df
-            
-        # Clean Date
-        df['Date'] = pd.to_datetime(df['Date'], errors='coerce', dayfirst=True)
+            return df, pd.DataFrame(columns=['Reason'] + list(df.columns))
         
-        # Clean Amount (remove ₹ and commas)
-        df['Total_Amount'] = df['Total_Amount'].astype(str).str.replace(r'[₹,]', '', regex=True)
-        df['Total_Amount'] = pd.to_numeric(df['Total_Amount'], errors='coerce')
+        # Parse the two required fields first and drop invalid rows up front,
+        # so the remaining cleaning only touches rows that are kept
+        dates = parse_sheet_dates(df['Date'])
         
-        # Clean Quantity
-        df['Qty'] = pd.to_numeric(df['Qty'], errors='coerce').fillna(1)
+        # Clean Amount (remove ₹, commas and spaces in one pass)
+        amount_text = df['Total_Amount'].astype(str).str.replace(r'[₹,\s]', '', regex=True)
+        amounts = pd.to_numeric(amount_text, errors='coerce')
         
-        # Clean State
-        df['State'] = df['State'].str.strip().str.title()
-        df['State'] = df['State'].replace({'N/A': 'Not Specified', 'Na': 'Not Specified', '': 'Not Specified'})
+        valid = dates.notna() & amounts.notna()
+        rejects = self._quarantine(df, valid, dates, amount_text)
         
-        # Clean Product & Company & Client
-        df['Product'] = df['Product'].str.strip()
-        df['Company'] = df['Company'].str.strip().str.title()
-        df['Client_Name'] = df['Client_Name'].str.strip().str.title()
+        df = df[valid].copy()
+        df['Date'] = dates[valid]
+        df['Total_Amount'] = amounts[valid]
+        
+        # Clean Quantity (whole numbers fit int32, otherwise float32)
+        codes, uniques = pd.factorize(df['Qty'], use_na_sentinel=False)
+        qty = pd.to_numeric(pd.Series(uniques), errors='coerce').fillna(1)
+        qty = qty.astype('int32') if (qty % 1 == 0).all() else qty.astype('float32')
+        df['Qty'] = qty.to_numpy()[codes]
+        
+        # Clean State, Product, Company & Client (once per distinct value)
+        df['State'] = normalize_text(df['State'], title=True, replace=STATE_PLACEHOLDERS)
+        df['Product'] = normalize_text(df['Product'])
+        df['Company'] = normalize_text(df['Company'], title=True)
+        df['Client_Name'] = normalize_text(df['Client_Name'], title=True)
+        df['City'] = df['City'].astype('category')
         
         # Process EDD
-        df['EDD'] = pd.to_datetime(df['EDD'], errors='coerce', dayfirst=True)
-        df['Lead_Time_Days'] = (df['EDD'] - df['Date']).dt.days
+        df['EDD'] = parse_sheet_dates(df['EDD'])
+        df['Lead_Time_Days'] = (df['EDD'] - df['Date']).dt.days.astype('float32')
         
-        # Add derived columns
-        df['Year'] = df['Date'].dt.year
-        df['Month'] = df['Date'].dt.month
-        df['Month_Name'] = df['Date'].dt.month_name()
+        # Add derived columns (compact ints, month names in calendar order)
+        df['Year'] = df['Date'].dt.year.astype('int16')
+        df['Month'] = df['Date'].dt.month.astype('int8')
+        df['Month_Name'] = pd.Categorical.from_codes(df['Month'].to_numpy() - 1, MONTH_NAMES)
         
-        # Remove invalid rows
-        df = df.dropna(subset=['Date', 'Total_Amount'])
+        # Period keys the reports group by, computed once here instead of per render
+        df['Quarter'] = df['Date'].dt.quarter.astype('int8')
+        df['Year_Quarter'] = df['Date'].dt.to_period('Q')
+        df['Year_Month'] = df['Date'].dt.to_period('M')
         
-        return df
+        return df, rejects
+    
+    def _quarantine(self, raw, valid, dates, amount_text):
+        """Rejected raw rows with the first failing check as Reason"""
+        rejected = ~valid.to_numpy()
+        if not rejected.any():
+            return pd.DataFrame(columns=['Reason'] + list(raw.columns))
+        
+        raw = raw[rejected]
+        date_text = raw['Date'].astype(str).str.strip()
+        blank_row = (raw.astype(str).apply(lambda col: col.str.strip()) == '').all(axis=1)
+        reason = np.select(
+            [
+                blank_row,
+                date_text == '',
+                dates[rejected].isna(),
+                amount_text[rejected] == '',
+            ],
+            ['Blank row', 'Missing Date', 'Invalid Date', 'Missing Total_Amount'],
+            default='Invalid Total_Amount'
+        )
+        
+        rejects = raw.astype(object)
+        rejects.insert(0, 'Reason', reason)
+        return rejects
     
     def get_stats(self, df):
         """Calculate summary statistics"""
@@ -114,7 +814,7 @@ class OrderDataLoader:
             'total_revenue': df['Total_Amount'].sum(),
             'total_qty': df['Qty'].sum(),
             'avg_order': df['Total_Amount'].mean(),
-            'top_state': df.groupby('State')['Total_Amount'].sum().idxmax() if not df.empty else "N/A",
+            'top_state': df.groupby('State', observed=True)['Total_Amount'].sum().idxmax() if not df.empty else "N/A",
             'date_range': {
                 'start': df['Date'].min(),
                 'end': df['Date'].max()
@@ -135,6 +835,10 @@ class OrderDataLoader:
         mask = df['Product'].str.contains(pattern, case=False, na=False)
         brush_df = df[mask].copy()
         
+        # Keep value_counts/groupby on the subset to brush products only
+        for col in brush_df.select_dtypes('category').columns:
+            brush_df[col] = brush_df[col].cat.remove_unused_categories()
+        
         return brush_df
     
     def calculate_followup_dates(self, brush_df):
@@ -199,23 +903,25 @@ class OrderDataLoader:
             if not client:
                 return False, "Connection failed"
             
-            # Open the spreadsheet
-            sheet = client.open_by_key(SHEET_ID)
-            
             # Try to get or create the worksheet
             try:
-                worksheet = sheet.worksheet(BRUSH_SHEET_NAME)
+                worksheet = self.open_worksheet(client, BRUSH_SHEET_NAME)
                 # Clear existing data if updating
-                worksheet.clear()
+                self.scheduler.call(worksheet.clear)
             except gspread.WorksheetNotFound:
                 # Create new Worksheet 
-                worksheet = sheet.add_worksheet(title=BRUSH_SHEET_NAME, rows=1000, cols=20)
+                sheet = self.open_spreadsheet(client)
+                worksheet = self.scheduler.call(
+                    sheet.add_worksheet, title=BRUSH_SHEET_NAME, rows=1000, cols=20
+                )
+                self._handles[(id(client), BRUSH_SHEET_NAME)] = worksheet
             
-            # Prepare data for storage
-            storage_df = brush_df[[
-                'Date', 'Inquiry_No', 'Company', 'Client_Name', 'Product', 
-                'Qty', 'State', 'City', 'Total_Amount', 'Follow_Up_Date', 'Urgency'
-            ]].copy()
+            # Prepare data for storage (the brush sheet's own column order)
+            fields = {field.name: field for field in ORDER_FIELDS}
+            brush_fields = [fields[name] for name in BRUSH_COLUMNS]
+            storage_df = brush_df[
+                [field.name for field in brush_fields] + ['Follow_Up_Date', 'Urgency']
+            ].copy()
             
             # Format dates
             storage_df['Date'] = storage_df['Date'].dt.strftime('%d-%m-%Y')
@@ -226,34 +932,35 @@ class OrderDataLoader:
             storage_df['Data_Source'] = 'Order Confirmation Automation'
             
             # Prepare headers and values
-            headers = [
-                'Purchase Date', 'Inquiry No', 'Company Name', 'Client Name', 'Product',
-                'Quantity', 'City', 'State', 'Total Amount (₹)', 'Follow Up Date', 
-                'Urgency Status', 'Last Updated', 'Data Source'
+            headers = [field.brush_header for field in brush_fields] + [
+                'Follow Up Date', 'Urgency Status', 'Last Updated', 'Data Source'
             ]
             
             values = [headers] + storage_df.values.tolist()
             
             # Update worksheet
-            worksheet.update(values, value_input_option='RAW')
-            
-            # Formatt header row (make it bold)
-            worksheet.format('A1:M1', {
-                'textFormat': {'bold': True},
-                'backgroundColor': {'red': 0.2, 'green': 0.4, 'blue': 0.6}
-            })
+            self.scheduler.call(worksheet.update, values, value_input_option='RAW')
             
-            # Auto-resize columns
-            for i, header in enumerate(headers, 1):
-                col_letter = chr(64 + i) if i <= 26 else 'A' + chr(64 + i - 26)
-                worksheet.format(f'{col_letter}1:{col_letter}{len(values)}', {
-                    'wrapStrategy': 'WRAP',
-                    'verticalAlignment': 'MIDDLE'
-                })
+            # Header row (bold) and wrapped cells in one batchUpdate
+            last_col = chr(64 + len(headers)) if len(headers) <= 26 else 'A' + chr(64 + len(headers) - 26)
+            self.scheduler.call(worksheet.batch_format, [
+                {
+                    'range': f'A1:{last_col}1',
+                    'format': {
+                        'textFormat': {'bold': True},
+                        'backgroundColor': {'red': 0.2, 'green': 0.4, 'blue': 0.6}
+                    }
+                },
+                {
+                    'range': f'A1:{last_col}{len(values)}',
+                    'format': {'wrapStrategy': 'WRAP', 'verticalAlignment': 'MIDDLE'}
+                },
+            ])
             
             return True, f"Successfully stored {len(storage_df)} records to {BRUSH_SHEET_NAME}"
             
         except Exception as e:
+            self._handles.clear()
             return False, f"Error storing data: {str(e)}"
     
     def fetch_existing_brush_data(self):
@@ -263,10 +970,11 @@ class OrderDataLoader:
             if not client:
                 return None
             
-            sheet = client.open_by_key(SHEET_ID)
-            worksheet = sheet.worksheet(BRUSH_SHEET_NAME)
+            worksheet = self.open_worksheet(client, BRUSH_SHEET_NAME)
             
-            data = worksheet.get_all_records()
+            data = self.scheduler.call(
+                worksheet.get_all_records, key=('get_all_records', BRUSH_SHEET_NAME)
+            )
             if data:
                 return pd.DataFrame(data)
             return pd.DataFrame()
@@ -0,0 +1,277 @@
+"""Offline stand-in for the parts of gspread the dashboard uses.
+
+Plug it into a loader to benchmark or regression-test ingestion and the
+brush-sheet writer without network access:
+
+    client = FakeSheetsClient(latency=0.05, quota_per_minute=60)
+    client.add_order_sheet(n_rows=100_000)
+    loader = OrderDataLoader()
+    loader.client_manager = FakeClientManager(client)
+"""
+import json
+import random
+import threading
+import time
+from collections import Counter, deque
+import numpy as np
+import pandas as pd
+import requests
+from gspread.exceptions import APIError, WorksheetNotFound
+from gspread.utils import a1_range_to_grid_range
+from config import SHEET_ID, SHEET_NAME
+
+STATES = [
+    'Maharashtra', 'gujarat ', 'KARNATAKA', 'Tamil Nadu', 'Delhi', 'Uttar Pradesh',
+    'Rajasthan', 'West Bengal', 'Telangana', 'Kerala', 'N/A', '',
+]
+CITIES = ['Pune', 'Mumbai', 'Surat', 'Bengaluru', 'Chennai', 'Delhi', 'Lucknow', 'Jaipur', 'Kolkata']
+PRODUCTS = [f'Industrial Product {i}' for i in range(250)] + [
+    'Broomer Brush Set', 'Road Sweeper Brush', 'Sweeper Main Brush', 'Side Brush Set',
+]
+
+
+def synthetic_order_rows(n_rows, seed=7, start='2019-01-01', years=6):
+    """Order Confirmation rows (21 columns, header first) with realistic mess mixed in"""
+    rng = np.random.default_rng(seed)
+    seconds = np.sort(rng.integers(0, years * 365 * 86400, n_rows))
+    stamps = pd.Timestamp(start) + pd.to_timedelta(seconds, unit='s')
+
+    dates = stamps.strftime('%d/%m/%Y %H:%M:%S').to_numpy(dtype=object)
+    edd = (stamps + pd.to_timedelta(rng.integers(1, 60, n_rows), unit='D')).strftime('%d/%m/%Y').to_numpy(dtype=object)
+
+    # ~2% hand-typed dates, ~0.5% blank and a few junk values
+    odd = rng.random(n_rows)
+    dates[odd < 0.02] = stamps[odd < 0.02].strftime('%d-%m-%Y')
+    dates[odd < 0.005] = ''
+    dates[(odd > 0.5) & (odd < 0.502)] = 'pending'
+
+    amounts = rng.integers(500, 500000, n_rows)
+    with_symbol = rng.random(n_rows) < 0.5
+    amount_text = [f'₹{a:,}' if sym else str(a) for a, sym in zip(amounts, with_symbol)]
+
+    companies = rng.integers(0, 400, n_rows)
+    clients = rng.integers(0, 2000, n_rows)
+    products = rng.integers(0, len(PRODUCTS), n_rows)
+    states = rng.integers(0, len(STATES), n_rows)
+    cities = rng.integers(0, len(CITIES), n_rows)
+    qty = rng.integers(1, 50, n_rows)
+
+    rows = [[f'Col {c}' for c in range(21)]]
+    for i in range(n_rows):
+        rows.append([
+            dates[i], f'INQ-{i + 1:07d}', '', '', '',
+            f'company {companies[i]} pvt ltd', f' client {clients[i]} ', PRODUCTS[products[i]],
+            str(qty[i]), CITIES[cities[i]], STATES[states[i]],
+            '', '', '', '', amount_text[i], '', '', '', '', edd[i],
+        ])
+    return rows
+
+
+def quota_error(message='Quota exceeded for quota metric \'Read requests\''):
+    """The APIError gspread raises for HTTP 429"""
+    response = requests.Response()
+    response.status_code = 429
+    response._content = json.dumps({
+        'error': {'code': 429, 'message': message, 'status': 'RESOURCE_EXHAUSTED'}
+    }).encode()
+    return APIError(response)
+
+
+class FakeWorksheet:
+    """In-memory grid with the Worksheet methods the loader calls"""
+
+    def __init__(self, client, title, rows=None, n_rows=1000, n_cols=26):
+        self.client = client
+        self.title = title
+        self.rows = rows if rows is not None else []
+        self.row_count = max(n_rows, len(self.rows))
+        self.col_count = n_cols
+        self.formats = []
+
+    # ---- reads ----
+    def get_all_values(self):
+        self.client._call('get_all_values')
+        width = max((len(row) for row in self.rows), default=0)
+        values = [list(row) + [''] * (width - len(row)) for row in self._trimmed_rows()]
+        self.client._served(values)
+        return values
+
+    def get_values(self, range_name=None, **kwargs):
+        if range_name is None:
+            return self.get_all_values()
+        return self.batch_get([range_name])[0]
+
+    def get_all_records(self):
+        values = self.get_all_values()
+        if not values:
+            return []
+        header, *body = values
+        return [dict(zip(header, row)) for row in body]
+
+    def batch_get(self, ranges, major_dimension=None, **kwargs):
+        self.client._call('batch_get')
+        result = [self._read_range(rng, major_dimension) for rng in ranges]
+        self.client._served(result)
+        return result
+
+    # ---- writes ----
+    def update(self, values, range_name=None, **kwargs):
+        self.client._call('update')
+        grid = a1_range_to_grid_range(range_name.split('!')[-1]) if range_name else {}
+        top = grid.get('startRowIndex', 0)
+        left = grid.get('startColumnIndex', 0)
+        for r, row in enumerate(values):
+            while len(self.rows) <= top + r:
+                self.rows.append([])
+            target = self.rows[top + r]
+            target.extend([''] * (left + len(row) - len(target)))
+            target[left:left + len(row)] = ['' if v is None else str(v) for v in row]
+        return {'updatedRows': len(values)}
+
+    def format(self, ranges, format):
+        self.client._call('format')
+        self.formats.append((ranges, format))
+        return {}
+
+    def batch_format(self, formats):
+        self.client._call('batch_format')
+        self.formats.extend((item['range'], item['format']) for item in formats)
+        return {}
+
+    def clear(self):
+        self.client._call('clear')
+        self.rows = []
+        self.formats = []
+        return {}
+
+    def append_rows(self, values, **kwargs):
+        """Append rows at the bottom, like new form submissions"""
+        self.client._call('append_rows')
+        self.rows.extend([list(row) for row in values])
+        return {}
+
+    # ---- helpers ----
+    def _trimmed_rows(self):
+        """Rows with trailing empty rows dropped, as the API returns them"""
+        end = len(self.rows)
+        while end and not any(self.rows[end - 1]):
+            end -= 1
+        return self.rows[:end]
+
+    def _read_range(self, range_name, major_dimension):
+        grid = a1_range_to_grid_range(range_name.split('!')[-1])
+        top = grid.get('startRowIndex', 0)
+        bottom = grid.get('endRowIndex', len(self.rows))
+        left = grid.get('startColumnIndex', 0)
+        right = grid.get('endColumnIndex', self.col_count)
+
+        rows = self.rows[top:bottom]
+        if str(major_dimension).upper() == 'COLUMNS':
+            block = [[row[c] if c < len(row) else '' for row in rows] for c in range(left, right)]
+        else:
+            block = [list(row[left:right]) for row in rows]
+
+        # The API drops trailing blanks per major line and trailing empty lines
+        for line in block:
+            while line and line[-1] == '':
+                line.pop()
+        while block and not block[-1]:
+            block.pop()
+        return block
+
+
+class FakeSpreadsheet:
+    def __init__(self, client, key):
+        self.client = client
+        self.id = key
+        self.worksheets_by_title = {}
+
+    def worksheet(self, title):
+        self.client._call('worksheet')
+        if title not in self.worksheets_by_title:
+            raise WorksheetNotFound(title)
+        return self.worksheets_by_title[title]
+
+    def add_worksheet(self, title, rows, cols, index=None):
+        self.client._call('add_worksheet')
+        worksheet = FakeWorksheet(self.client, title, n_rows=rows, n_cols=cols)
+        self.worksheets_by_title[title] = worksheet
+        return worksheet
+
+
+class FakeSheetsClient:
+    """Stand-in for gspread.Client with injectable latency and quota errors
+
+    latency           seconds added to every API call (plus up to `jitter`)
+    quota_per_minute  calls allowed in any 60s window before HTTP 429
+    error_rate        probability of a random 429 on any call
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, quota_per_minute=None, error_rate=0.0, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.quota_per_minute = quota_per_minute
+        self.error_rate = error_rate
+        self.spreadsheets = {}
+        self.call_counts = Counter()
+        self.quota_errors = 0
+        self.bytes_served = 0
+        self._recent_calls = deque()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def open_by_key(self, key):
+        self._call('open_by_key')
+        if key not in self.spreadsheets:
+            self.spreadsheets[key] = FakeSpreadsheet(self, key)
+        return self.spreadsheets[key]
+
+    def add_order_sheet(self, n_rows=10_000, seed=7, key=SHEET_ID, title=SHEET_NAME):
+        """Fill the order sheet with synthetic orders"""
+        spreadsheet = self.spreadsheets.setdefault(key, FakeSpreadsheet(self, key))
+        worksheet = FakeWorksheet(self, title, rows=synthetic_order_rows(n_rows, seed=seed), n_cols=26)
+        spreadsheet.worksheets_by_title[title] = worksheet
+        return worksheet
+
+    def reset_stats(self):
+        with self._lock:
+            self.call_counts.clear()
+            self.quota_errors = 0
+            self.bytes_served = 0
+
+    def _call(self, name):
+        """Account for one API call: latency, quota window and random errors"""
+        with self._lock:
+            now = time.monotonic()
+            self.call_counts[name] += 1
+
+            while self._recent_calls and now - self._recent_calls[0] > 60:
+                self._recent_calls.popleft()
+            over_quota = self.quota_per_minute is not None and len(self._recent_calls) >= self.quota_per_minute
+            if over_quota or self._random.random() < self.error_rate:
+                self.quota_errors += 1
+                raise quota_error()
+            self._recent_calls.append(now)
+
+            delay = self.latency + self._random.random() * self.jitter
+
+        if delay:
+            time.sleep(delay)
+
+    def _served(self, payload):
+        """Approximate JSON payload size of a read response"""
+        with self._lock:
+            self.bytes_served += len(json.dumps(payload, ensure_ascii=False))
+
+
+class FakeClientManager:
+    """Drop-in for SheetsClientManager that hands out a FakeSheetsClient"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def get_client(self):
+        return self.client
+
+    def reset(self):
+        pass
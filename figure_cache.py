@@ -0,0 +1,140 @@
+import hashlib
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+from config import FIGURE_CACHE_MB
+
+
+class FigureCache:
+    """Plotly figures shared by every session, keyed on a fingerprint of the chart's data and parameters
+
+    Entries hold the built figure as JSON: a hit turns it back into a Figure
+    without running plotly express or re-validating it. Least recently used
+    entries are evicted once the JSON passes the budget.
+    """
+
+    def __init__(self, max_mb=FIGURE_CACHE_MB):
+        self.max_bytes = int(max_mb * 1024 ** 2)
+        self.nbytes = 0
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (figure JSON, build seconds)
+        self.counters = Counter()
+        self.build_seconds = 0.0
+        self.saved_seconds = 0.0  # Build time hits didn't have to spend
+
+    def get(self, name, build, data, **params):
+        """build() as a Figure, reused while name, data and params fingerprint the same
+
+        build may only read data and params (and constants); anything else it
+        depends on has to be passed as a param so it is part of the key.
+        """
+        key = (name, fingerprint(data), fingerprint(params))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.counters['hits'] += 1
+                self.saved_seconds += entry[1]
+                spec = entry[0]
+            else:
+                self.counters['misses'] += 1
+                spec = None
+
+        if spec is not None:
+            # Serialized from a validated figure, so it's trusted as is
+            return go.Figure(json.loads(spec), _validate=False)
+
+        start = time.perf_counter()
+        figure = build()
+        spec = pio.to_json(figure, validate=False)
+        seconds = time.perf_counter() - start
+        self._store(key, spec, seconds)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def stats(self):
+        """Hit/miss counters, build times and current memory use"""
+        with self._lock:
+            lookups = self.counters['hits'] + self.counters['misses']
+            return {
+                'entries': len(self._entries),
+                'size_mb': round(self.nbytes / 1024 ** 2, 2),
+                'budget_mb': round(self.max_bytes / 1024 ** 2, 2),
+                'hits': self.counters['hits'],
+                'misses': self.counters['misses'],
+                'evictions': self.counters['evictions'],
+                'hit_rate': round(self.counters['hits'] / lookups, 3) if lookups else 0.0,
+                'avg_build_ms': round(self.build_seconds * 1000 / self.counters['misses'], 1)
+                if self.counters['misses'] else 0.0,
+                'saved_ms': round(self.saved_seconds * 1000),
+            }
+
+    def _store(self, key, spec, seconds):
+        size = len(spec)
+        with self._lock:
+            self.build_seconds += seconds
+            if size > self.max_bytes:
+                return
+            if key in self._entries:
+                self.nbytes -= len(self._entries.pop(key)[0])
+            self._entries[key] = (spec, seconds)
+            self.nbytes += size
+
+            while self.nbytes > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.nbytes -= len(evicted)
+                self.counters['evictions'] += 1
+
+
+def fingerprint(value):
+    """Digest of a chart input: frames and arrays by content, containers element by element"""
+    digest = hashlib.blake2b(digest_size=16)
+    _feed(digest, value)
+    return digest.hexdigest()
+
+
+def _feed(digest, value):
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr((type(value).__name__, list(value.columns), list(value.dtypes))).encode())
+        _feed(digest, value.index)
+        for col in range(value.shape[1]):
+            digest.update(_hash_values(value.iloc[:, col]))
+    elif isinstance(value, pd.Series):
+        digest.update(repr((type(value).__name__, value.name, value.dtype)).encode())
+        _feed(digest, value.index)
+        digest.update(_hash_values(value))
+    elif isinstance(value, pd.Index):
+        digest.update(repr((type(value).__name__, value.names, value.dtype if value.nlevels == 1 else None)).encode())
+        digest.update(_hash_values(value))
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.dtype, value.shape)).encode())
+        digest.update(_hash_values(pd.Series(value.ravel())))
+    elif isinstance(value, (list, tuple)):
+        digest.update(f'{type(value).__name__}[{len(value)}]'.encode())
+        for item in value:
+            _feed(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f'dict[{len(value)}]'.encode())
+        for name, item in sorted(value.items(), key=lambda kv: repr(kv[0])):
+            _feed(digest, name)
+            _feed(digest, item)
+    else:
+        digest.update(repr((type(value).__name__, value)).encode())
+
+
+def _hash_values(values):
+    try:
+        hashed = pd.util.hash_pandas_object(values, index=False)
+    except TypeError:  # Unhashable cells (lists, dicts), their text stands in
+        hashed = pd.util.hash_pandas_object(values.astype(str), index=False)
+    return hashed.to_numpy().tobytes()
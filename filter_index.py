@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+
+# Columns reports slice the order frame by
+INDEX_DIMENSIONS = ['State', 'Product', 'Company', 'Year', 'Month']
+
+_NO_ROWS = np.empty(0, dtype=np.int32)
+
+
+class OrderFilterIndex:
+    """Inverted index over an order frame: sorted row positions per dimension value
+
+    Filters on several values of one dimension are OR-ed, filters on different
+    dimensions are AND-ed. Built once per published snapshot, so a widget change
+    costs work proportional to the rows selected, not to the whole frame.
+    """
+
+    def __init__(self, df, dimensions=INDEX_DIMENSIONS, _postings=None):
+        self.n_rows = len(df)
+        self.labels = df.index
+        self.postings = {}
+        if _postings is not None:
+            self.postings = _postings
+            return
+
+        for dim in dimensions:
+            if dim not in df.columns:
+                continue
+            column = df[dim]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                codes, values = column.cat.codes.to_numpy(), column.cat.categories
+            else:
+                codes, values = pd.factorize(column, sort=True)
+
+            # One stable sort groups row positions by value, ascending within each value
+            order = np.argsort(codes, kind='stable').astype(np.int32)
+            counts = np.bincount(codes[codes >= 0], minlength=len(values))
+            bounds = np.concatenate([[0], np.cumsum(counts)]) + np.count_nonzero(codes < 0)
+
+            self.postings[dim] = {
+                value: order[bounds[i]:bounds[i + 1]]
+                for i, value in enumerate(values.tolist())
+                if counts[i]
+            }
+
+    def apply(self, kept, df):
+        """Index of df, whose first kept rows are this index's first kept rows
+
+        Only the rows after them are indexed; each posting list is cut at kept
+        (a view, the positions are sorted) and gets the new positions appended.
+        """
+        delta = OrderFilterIndex(df.iloc[kept:], list(self.postings))
+        offset = np.int32(kept)
+        postings = {}
+        for dim, current in self.postings.items():
+            added = delta.postings.get(dim, {})
+            merged = {}
+            for value, rows in current.items():
+                rows = rows[:np.searchsorted(rows, kept)]
+                if value in added:
+                    rows = np.concatenate([rows, added[value] + offset])
+                if len(rows):
+                    merged[value] = rows
+            new_values = [value for value in added if value not in current]
+            for value in new_values:
+                merged[value] = added[value] + offset
+            # values() lists a dimension in sorted order
+            postings[dim] = dict(sorted(merged.items())) if new_values else merged
+        return OrderFilterIndex(df, _postings=postings)
+
+    def values(self, dim):
+        """Values of a dimension that occur in the frame"""
+        return list(self.postings[dim])
+
+    def rows(self, **filters):
+        """Sorted row positions matching every filter, or None when nothing filters
+
+        Each filter is a value or a list of values; None or an empty list means
+        "no filter" for that dimension (like an untouched multiselect).
+        """
+        selected = []
+        for dim, wanted in filters.items():
+            if wanted is None:
+                continue
+            if isinstance(wanted, (str, bytes)) or not hasattr(wanted, '__iter__'):
+                wanted = [wanted]
+            wanted = set(wanted)
+            if not wanted:
+                continue
+
+            postings = self.postings[dim]
+            if wanted.issuperset(postings):
+                # Every value selected ("Select All"), the filter removes nothing
+                continue
+            selected.append(self._union([postings[v] for v in wanted if v in postings]))
+
+        if not selected:
+            return None
+
+        # Intersect smallest first: binary-search few rows in the larger sorted list,
+        # probe a dense position mask when both sides are large
+        selected.sort(key=len)
+        rows = selected[0]
+        for other in selected[1:]:
+            if not len(rows):
+                break
+            if len(rows) * 16 < self.n_rows:
+                found = np.searchsorted(other, rows)
+                found[found == len(other)] = 0
+                rows = rows[other[found] == rows]
+            else:
+                mask = np.zeros(self.n_rows, dtype=bool)
+                mask[other] = True
+                rows = rows[mask[rows]]
+        return rows
+
+    def select(self, df, **filters):
+        """Rows of df (the indexed frame or a view of it) matching the filters"""
+        rows = self.rows(**filters)
+        return df if rows is None else df.iloc[rows]
+
+    def row_labels(self, **filters):
+        """Index labels matching the filters, for frames derived from the indexed one"""
+        rows = self.rows(**filters)
+        return self.labels if rows is None else self.labels[rows]
+
+    def _union(self, lists):
+        if not lists:
+            return _NO_ROWS
+        if len(lists) == 1:
+            return lists[0]
+
+        total = sum(len(rows) for rows in lists)
+        if total * 8 < self.n_rows:
+            return np.sort(np.concatenate(lists))
+        mask = np.zeros(self.n_rows, dtype=bool)
+        for rows in lists:
+            mask[rows] = True
+        return np.flatnonzero(mask).astype(np.int32)
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from config import CURRENCY
+
+# Divisors for compact amounts: thousand, lakh, crore
+UNITS = {'K': 1e3, 'L': 1e5, 'Cr': 1e7}
+
+_POWERS_OF_TEN = 10 ** np.arange(19, dtype=np.int64)
+# Largest scaled value (x * 10**decimals) written digit by digit, int64 holds it after rounding
+_MAX_SCALED = 1e18
+_TRIPLES = np.array([[ord(c) for c in f'{i:03d}'] for i in range(1000)], dtype=np.uint32)
+
+
+def number(values, decimals=0, prefix='', suffix='', sign=False, grouping=True, na='-'):
+    """f"{prefix}{x:,.{decimals}f}{suffix}" for a whole column (or frame) at once, na for missing values
+
+    sign adds '+' to non-negative values; grouping=False leaves out the
+    thousands separators. Returns the same kind of object it was given.
+    """
+    array = _as_float(values)
+    flat = array.ravel()
+    missing = np.isnan(flat)
+
+    # inf and values with more digits than int64 holds are left to format() below
+    unscaled = ~missing & ~(np.abs(flat) * 10 ** decimals < _MAX_SCALED)
+    blank = missing | unscaled
+
+    # Rounded once, then split: the fraction can't carry into the whole part
+    scaled = _round_scaled(np.abs(np.where(blank, 0.0, flat)), decimals)
+    whole, fraction = np.divmod(scaled, 10 ** decimals)
+    negative = np.signbit(flat) & ~blank  # Like format(): -0.04 -> "-0.0"
+    signed = negative | sign
+
+    # Every row is written as codepoints into one fixed-width grid,
+    # [prefix + sign slack][zero-padded digits, commas][.fraction][suffix],
+    # with as many NULs again after it to shift rows into
+    ndigits = np.maximum(np.searchsorted(_POWERS_OF_TEN, whole, side='right'), 1)
+    groups = -(-int(ndigits.max()) // 3) if len(flat) else 1
+    step = 4 if grouping else 3
+    slack = len(prefix) + 1
+    digits_width = groups * step - (step - 3)
+    width = slack + digits_width + (decimals + 1 if decimals else 0) + len(suffix)
+    chars = np.zeros((len(flat), 2 * width), dtype=np.uint32)
+
+    # One division per group of three digits, looked up as their codepoints
+    for group in range(groups):
+        column = slack + group * step
+        chars[:, column:column + 3] = _TRIPLES.take(whole // _POWERS_OF_TEN[3 * (groups - 1 - group)] % 1000, axis=0)
+        if grouping and group:
+            chars[:, column - 1] = ord(',')
+    column = slack + digits_width
+    if decimals:
+        chars[:, column] = ord('.')
+        chars[:, column + 1:column + 1 + decimals] = \
+            (fraction[:, None] // _POWERS_OF_TEN[decimals - 1::-1] % 10 + ord('0')).astype(np.uint32)
+        column += decimals + 1
+    chars[:, column:column + len(suffix)] = [ord(c) for c in suffix]
+
+    # Sign and prefix go just in front of the first significant digit...
+    rows = np.arange(len(flat))
+    first = slack + digits_width - (ndigits + (ndigits - 1) // 3 if grouping else ndigits)
+    chars[rows[signed], first[signed] - 1] = np.where(negative, ord('-'), ord('+'))[signed]
+    start = first - len(prefix) - signed
+    for offset, c in enumerate(prefix):
+        chars[rows, start + offset] = ord(c)
+
+    # ...and each row is read back from there (numpy drops the trailing NULs)
+    index = (rows * (2 * width) + start)[:, None] + np.arange(width)
+    text = chars.ravel().take(index).view(f'U{width}').ravel().astype(object)
+    text[missing] = na
+    if unscaled.any():
+        spec = f"{'+' if sign else ''}{',' if grouping else ''}.{decimals}f"
+        text[unscaled] = [f"{prefix}{format(v, spec)}{suffix}" for v in flat[unscaled]]
+    return _like(values, text.reshape(array.shape))
+
+
+def inr(values, decimals=0, na='-'):
+    """Rupee amounts with thousands separators: ₹1,234,567"""
+    return number(values, decimals, prefix=CURRENCY, na=na)
+
+
+def compact(values, unit='L', decimals=1, prefix=CURRENCY, na='-'):
+    """Amounts in thousands, lakh or crore for chart labels, e.g. ₹12.5L"""
+    if not isinstance(values, (pd.Series, pd.Index, pd.DataFrame)):
+        values = _as_float(values)
+    return number(values / UNITS[unit], decimals, prefix=prefix, suffix=unit, grouping=False, na=na)
+
+
+def percent(values, decimals=1, na='-'):
+    """Shares already in percent: 12.3%"""
+    return number(values, decimals, suffix='%', grouping=False, na=na)
+
+
+def signed_percent(values, decimals=1, na='-'):
+    """Signed percent changes: +12.3%, -4.0%"""
+    return number(values, decimals, suffix='%', sign=True, grouping=False, na=na)
+
+
+# st.dataframe column configs: the numbers stay numeric (and sort as numbers), the browser formats them
+def inr_column(label=None, decimals=0):
+    return st.column_config.NumberColumn(label, format=f"{CURRENCY}%,.{decimals}f")
+
+
+def number_column(label=None, decimals=0):
+    return st.column_config.NumberColumn(label, format=f"%,.{decimals}f")
+
+
+def percent_column(label=None, decimals=1):
+    return st.column_config.NumberColumn(label, format=f"%.{decimals}f%%")
+
+
+def _round_scaled(values, decimals):
+    """values * 10**decimals rounded to int64 the way format() rounds values (its exact binary value)
+
+    values have to be finite and below _MAX_SCALED once scaled.
+    """
+    scaled = values * 10 ** decimals
+    size = np.abs(scaled)
+
+    # The product is off by up to half an ulp, so rint can take a near-.5 tie the
+    # wrong way (2.675 is 2.67499..., 43.15 is 43.14999...), and past 2**52 any
+    # value: format() decides those
+    inexact = (np.abs(size - np.floor(size) - 0.5) <= 2 * np.spacing(size)) | (size >= 2 ** 52)
+    rounded = np.rint(np.where(inexact, 0.0, scaled)).astype(np.int64)
+    if inexact.any():
+        unique, inverse = np.unique(values[inexact], return_inverse=True)
+        rounded[inexact] = np.array([int(format(v, f'.{decimals}f').replace('.', '')) for v in unique])[inverse]
+    return rounded
+
+
+def _as_float(values):
+    if isinstance(values, (pd.Series, pd.Index, pd.DataFrame)):
+        return values.to_numpy(dtype=float, na_value=np.nan)
+    return np.asarray(values, dtype=float)
+
+
+def _like(values, text):
+    if isinstance(values, pd.Series):
+        return pd.Series(text, index=values.index, name=values.name)
+    if isinstance(values, pd.Index):
+        return pd.Index(text, name=values.name)
+    if isinstance(values, pd.DataFrame):
+        return pd.DataFrame(text, index=values.index, columns=values.columns)
+    return text.item() if text.ndim == 0 else text
@@ -0,0 +1,257 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+from config import SNAPSHOT_DIR, SCAN_CHUNK_ROWS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # No local snapshot without pyarrow, the loader reads the sheet
+    pa = None
+    pq = None
+
+MANIFEST_NAME = '_manifest.json'
+
+
+class PartitionedOrderStore:
+    """Cleaned orders as Year=YYYY/Month=MM Parquet partitions listed in a JSON manifest
+
+    Months before the current one are frozen: their part files are never
+    rewritten, orders that arrive late for one are added as a new part file
+    next to the old ones. The current month (and any later one) is compacted
+    into a single file whenever it changes. Part files are immutable and the
+    manifest is swapped in last, so a reader only ever sees complete saves;
+    files a save drops are deleted one save later, after readers of the
+    previous manifest are done with them.
+    """
+
+    def __init__(self, root=SNAPSHOT_DIR):
+        self.root = root
+        self.last_write = {}  # Partition counts of the most recent write
+
+    def manifest(self):
+        """Saved manifest, None when there is no snapshot"""
+        path = os.path.join(self.root, MANIFEST_NAME)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def years(self, manifest=None):
+        """Years with saved partitions, newest first"""
+        manifest = manifest if manifest is not None else self.manifest()
+        if manifest is None:
+            return []
+        return sorted({entry['year'] for entry in manifest['partitions'].values()}, reverse=True)
+
+    def partitions(self, years=None, months=None, manifest=None):
+        """Saved partition keys ('YYYY-MM') left after pruning on year and month"""
+        manifest = manifest if manifest is not None else self.manifest()
+        if manifest is None:
+            return []
+        years = None if years is None else {int(year) for year in _as_list(years)}
+        months = None if months is None else {int(month) for month in _as_list(months)}
+        return [
+            key for key, entry in sorted(manifest['partitions'].items())
+            if (years is None or entry['year'] in years) and (months is None or entry['month'] in months)
+        ]
+
+    def holds(self, synced_rows, tail_hash, manifest=None):
+        """Whether the saved snapshot is at this sync watermark"""
+        manifest = manifest if manifest is not None else self.manifest()
+        return manifest is not None and (manifest.get('synced_rows'), manifest.get('tail_hash')) == (synced_rows, tail_hash)
+
+    def read(self, years=None, months=None, columns=None, since=None, manifest=None):
+        """Orders of the matching partitions only, indexed by sheet row; None without a snapshot
+
+        since keeps only rows from that sheet row on (skipping files entirely before it).
+        """
+        manifest = manifest if manifest is not None else self.manifest()
+        if pq is None or manifest is None:
+            return None
+        parts = [
+            part for key in self.partitions(years, months, manifest) for part in manifest['partitions'][key]['files']
+            if since is None or part['last_row'] >= since
+        ]
+        if not parts:
+            return None
+
+        df = _frame([self._read_part(part, columns) for part in parts])
+        return df[df.index >= since] if since is not None else df
+
+    def read_months(self, codes, columns=None, manifest=None):
+        """Orders of some year * 100 + month partitions, an empty frame when none is saved"""
+        codes = np.asarray(codes)
+        df = self.read(years=codes // 100, months=codes % 100, columns=columns, manifest=manifest)
+        return pd.DataFrame() if df is None else df[np.isin(month_codes(df), codes)]
+
+    def read_recent(self, max_bytes, reserve_rows=0, manifest=None):
+        """The newest months whose rows fit in max_bytes of memory, less reserve_rows rows of headroom"""
+        manifest = manifest if manifest is not None else self.manifest()
+        keys = self.partitions(manifest=manifest)
+        if pq is None or not keys:
+            return None
+
+        # Bytes per row measured on the newest month, the manifest has the row counts of the rest
+        entries = [manifest['partitions'][key] for key in keys]
+        sample = _frame([self._read_part(part) for part in entries[-1]['files']])
+        rows = {_month_code(entry): sum(part['rows'] for part in entry['files']) for entry in entries}
+        start = recent_months(rows, row_bytes(sample), max_bytes, reserve_rows)
+        return _frame([self._read_part(part) for entry in entries if _month_code(entry) >= start
+                       for part in entry['files']])
+
+    def scan(self, years=None, months=None, columns=None, chunk_rows=SCAN_CHUNK_ROWS, manifest=None):
+        """Orders of the matching partitions as frames of about chunk_rows rows, oldest month first"""
+        manifest = manifest if manifest is not None else self.manifest()
+        if pq is None or manifest is None:
+            return
+        pending, pending_rows = [], 0
+        for key in self.partitions(years, months, manifest):
+            for part in manifest['partitions'][key]['files']:
+                parquet = pq.ParquetFile(os.path.join(self.root, part['path']))
+                for batch in parquet.iter_batches(batch_size=chunk_rows, columns=columns, use_pandas_metadata=True):
+                    pending.append(pa.Table.from_batches([batch]))
+                    pending_rows += batch.num_rows
+                    if pending_rows >= chunk_rows:
+                        yield _frame(pending)
+                        pending, pending_rows = [], 0
+        if pending:
+            yield _frame(pending)
+
+    def write(self, df, info, cut=0, base=None):
+        """Save orders (indexed by sheet row) with info in the manifest, return the manifest
+
+        With cut > 0 and the saved snapshot at the base (synced_rows, tail_hash)
+        watermark, df only needs the rows from cut on: untouched partitions are
+        kept and rewritten ones take their earlier rows from the saved files.
+        Otherwise df must be the whole history and every partition is rewritten.
+        """
+        previous = self.manifest()
+        reuse = (
+            cut > 0 and base is not None and self.holds(*base, manifest=previous)
+            and previous.get('schema_version') == info.get('schema_version')
+        )
+        saved = previous['partitions'] if reuse else {}
+        cut = cut if reuse else 0
+        df = df[df.index >= cut] if cut else df
+        generation = previous.get('generation', 0) + 1 if previous is not None else 1
+        now = pd.Timestamp.now()
+        current = now.year * 100 + now.month
+
+        codes = month_codes(df)
+        fresh_rows = pd.Series(codes).groupby(codes).indices if len(df) else {}
+        stale = {key for key, entry in saved.items() if any(part['last_row'] >= cut for part in entry['files'])}
+        touched = sorted({f'{code // 100:04d}-{code % 100:02d}' for code in fresh_rows} | stale)
+
+        partitions = dict(saved)
+        counts = {'kept': len(set(saved) - set(touched)), 'appended': 0, 'rewritten': 0}
+        for key in touched:
+            entry = saved.get(key)
+            code = int(key[:4]) * 100 + int(key[5:])
+            fresh = df.iloc[fresh_rows[code]] if code in fresh_rows else df.iloc[:0]
+
+            if entry is not None and key not in stale and code < current:
+                # Frozen month: late orders go into a new part, existing files stay as they are
+                files = entry['files'] + [self._write_part(fresh, code, generation)]
+                counts['appended'] += 1
+            else:
+                rows = fresh
+                if entry is not None:
+                    earlier = _frame([self._read_part(part) for part in entry['files']])
+                    rows = _frame([pa.Table.from_pandas(frame, preserve_index=True)
+                                   for frame in (earlier[earlier.index < cut], fresh)])
+                counts['rewritten'] += 1
+                if rows.empty:
+                    partitions.pop(key, None)
+                    continue
+                files = [self._write_part(rows, code, generation)]
+            partitions[key] = {'year': code // 100, 'month': code % 100, 'files': files}
+
+        # Dropped files outlive this save by one, readers of the previous manifest may still scan them
+        listed = {part['path'] for entry in partitions.values() for part in entry['files']}
+        retired = [] if previous is None else [
+            part['path'] for entry in previous['partitions'].values() for part in entry['files']
+            if part['path'] not in listed
+        ]
+        manifest = dict(info, generation=generation, partitions=partitions, retired=retired,
+                        saved_at=now.isoformat())
+        path = os.path.join(self.root, MANIFEST_NAME)
+        os.makedirs(self.root, exist_ok=True)
+        with open(f"{path}.tmp", 'w') as f:
+            json.dump(manifest, f)
+        os.replace(f"{path}.tmp", path)
+
+        self._delete((previous or {}).get('retired', []))
+        self.last_write = dict(counts, partitions=touched)
+        return manifest
+
+    def _read_part(self, part, columns=None):
+        return pq.read_table(os.path.join(self.root, part['path']), columns=columns, use_pandas_metadata=True)
+
+    def _write_part(self, rows, code, generation):
+        path = f'Year={code // 100:04d}/Month={code % 100:02d}/part-{generation:06d}.parquet'
+        full_path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        pq.write_table(pa.Table.from_pandas(rows, preserve_index=True), full_path)
+        return {
+            'path': path, 'rows': len(rows),
+            'first_row': int(rows.index.min()), 'last_row': int(rows.index.max()),
+        }
+
+    def _delete(self, paths):
+        """Remove part files, and partition folders they leave empty"""
+        for path in paths:
+            full_path = os.path.join(self.root, path)
+            try:
+                os.remove(full_path)
+                os.removedirs(os.path.dirname(full_path))
+            except OSError:
+                pass  # Already gone, or the folder still has other parts
+
+
+def recent_months(rows_per_month, bytes_per_row, max_bytes, reserve_rows=0):
+    """year * 100 + month of the oldest of the newest months whose rows fit in max_bytes
+
+    reserve_rows rows' worth of the budget is left free; the newest month is always included.
+    """
+    rows = pd.Series(rows_per_month, dtype='int64').sort_index(ascending=False).cumsum()
+    fits = rows[(rows + reserve_rows) * bytes_per_row <= max_bytes]
+    return int(fits.index.min()) if len(fits) else int(rows.index[0])
+
+
+def row_bytes(df):
+    """Average in-memory bytes per order row (category dictionaries are shared, only codes count)"""
+    total = df.index.nbytes + sum(
+        df[col].cat.codes.nbytes if isinstance(df[col].dtype, pd.CategoricalDtype)
+        else df[col].memory_usage(deep=True, index=False) for col in df.columns
+    )
+    return total / max(len(df), 1)
+
+
+def month_codes(df):
+    """year * 100 + month per row, the partition of each order"""
+    if df.empty:
+        return np.array([], dtype='int32')
+    return df['Year'].to_numpy('int32') * 100 + df['Month'].to_numpy('int32')
+
+
+def _month_code(entry):
+    return entry['year'] * 100 + entry['month']
+
+
+def _frame(tables):
+    """Part tables as one frame sorted by sheet row, categories kept as the loader builds them"""
+    tables = [table for table in tables if table.num_rows] or tables[:1]
+    df = pa.concat_tables(tables, promote_options='permissive').to_pandas().sort_index()
+    for col in df.select_dtypes('category').columns:
+        # Arrow appends categories in file order, concat_orders sorts a union of differing ones
+        if len(df[col].cat.categories) > len(tables[0].column(col).combine_chunks().dictionary):
+            df[col] = df[col].cat.reorder_categories(df[col].cat.categories.sort_values())
+    return df
+
+
+def _as_list(values):
+    if isinstance(values, (str, bytes)) or not hasattr(values, '__iter__'):
+        return [values]
+    return list(values)
@@ -0,0 +1,226 @@
+import numpy as np
+import pandas as pd
+
+# Additive measures kept per State x Year x Month; Rows counts order lines
+MEASURES = ['Total_Amount', 'Inquiry_No', 'Qty', 'Rows']
+BASE_KEYS = ['State', 'Year', 'Month']
+SOURCE_COLUMNS = BASE_KEYS + ['Company', 'Total_Amount', 'Inquiry_No', 'Qty']  # Order columns the rollups read
+
+MONTHLY_GROWTH = {'Revenue_Growth': 'Total_Amount', 'Orders_Growth': 'Inquiry_No'}
+QUARTERLY_GROWTH = {'QoQ_Revenue_Growth': 'Total_Amount', 'QoQ_Orders_Growth': 'Inquiry_No'}
+QUARTERLY_CUMULATIVE = {'Cumulative_Revenue': 'Total_Amount'}
+YEARLY_GROWTH = {'Revenue_Growth_Pct': 'Total_Revenue', 'Orders_Growth_Pct': 'Total_Orders'}
+YOY_GROWTH = {'Revenue_Growth': 'Total_Amount', 'Orders_Growth': 'Inquiry_No', 'AOV_Growth': 'Avg_Order_Value'}
+
+
+class PeriodRollups:
+    """Monthly, quarterly and yearly order totals, maintained from delta rows
+
+    apply() folds removed and added order rows into a new instance: only the
+    periods they touch are re-aggregated, and growth / cumulative measures are
+    recomputed from the first touched period on. Instances are never modified
+    afterwards, so a published snapshot can hand one to every session.
+    """
+
+    def __init__(self, df=None, _tables=None):
+        if _tables is not None:
+            self.base, self.customers, self.monthly, self.quarterly, self.yearly = _tables
+            return
+
+        self.base = _aggregate(df)
+        self.customers = _customer_rows(df)
+        monthly = self.base.groupby(level=['Year', 'Month']).sum()
+        self.monthly = _derive(monthly, np.arange(len(monthly)), _monthly_columns, MONTHLY_GROWTH)
+        quarterly = _by_quarter(monthly)
+        self.quarterly = _derive(quarterly, np.arange(len(quarterly)), _quarterly_columns,
+                                 QUARTERLY_GROWTH, QUARTERLY_CUMULATIVE)
+        yearly = monthly[MEASURES].groupby(level='Year').sum()
+        self.yearly = _derive(yearly, np.arange(len(yearly)), self._yearly_columns, YEARLY_GROWTH)
+
+    @classmethod
+    def from_chunks(cls, chunks):
+        """Rollups of orders streamed chunk by chunk (out-of-core snapshots)"""
+        rollups = None
+        for chunk in chunks:
+            rollups = cls(chunk) if rollups is None else rollups.apply(removed=None, added=chunk)
+        return rollups if rollups is not None else cls(pd.DataFrame())
+
+    def apply(self, removed, added):
+        """New rollups with removed rows taken out and added rows folded in"""
+        delta = _aggregate(added).sub(_aggregate(removed), fill_value=0)
+        delta = delta[(delta != 0).any(axis=1)]
+        added_customers, removed_customers = _customer_rows(added), _customer_rows(removed)
+        customers = _fold_counts(self.customers, added_customers, removed_customers)
+        if delta.empty and customers.equals(self.customers):
+            return self
+
+        monthly_delta = delta.groupby(level=['Year', 'Month']).sum()
+        updated = PeriodRollups(_tables=(
+            _fold_measures(self.base, delta), customers, None, None, None,
+        ))
+        updated.monthly = _fold(self.monthly, monthly_delta, _monthly_columns, MONTHLY_GROWTH)
+        updated.quarterly = _fold(self.quarterly, _by_quarter(monthly_delta), _quarterly_columns,
+                                  QUARTERLY_GROWTH, QUARTERLY_CUMULATIVE)
+
+        # Distinct customers aren't additive, recount the years whose customers changed
+        yearly_delta = monthly_delta.groupby(level='Year').sum()
+        recount = added_customers.index.unique('Year').union(removed_customers.index.unique('Year'))
+        yearly_delta = yearly_delta.reindex(yearly_delta.index.union(recount), fill_value=0)
+        updated.yearly = _fold(self.yearly, yearly_delta, updated._yearly_columns, YEARLY_GROWTH)
+        return updated
+
+    def months(self, year=None):
+        """Revenue Trends monthly_data: every month, or one year's"""
+        return _slice(self.monthly, year, MONTHLY_GROWTH)
+
+    def quarters(self, year=None):
+        """Revenue Trends quarterly table: every quarter, or one year's"""
+        return _slice(self.quarterly, year, QUARTERLY_GROWTH, QUARTERLY_CUMULATIVE)
+
+    def years(self):
+        """Year-wise yearly stats with growth vs the previous year (index Year)"""
+        return self.yearly.drop(columns=MEASURES)
+
+    def year_summary(self, years, state=None):
+        """Monthly Insights per-year totals and YoY growth for the selected years/state"""
+        base = self.base
+        if state is not None:
+            base = base.xs(state, level='State', drop_level=False) if state in base.index.levels[0] else base.iloc[:0]
+        summary = base[base.index.get_level_values('Year').isin(years)].groupby(level='Year').sum()
+        # Growth is between the selected years, so it's derived per selection (a few rows)
+        summary = _derive(summary, np.arange(len(summary)), _summary_columns, YOY_GROWTH)
+        return summary.drop(columns='Rows').reset_index()
+
+    def _yearly_columns(self, table):
+        years = table.index
+        customers = self.customers.index.get_level_values('Year').value_counts()
+        return {
+            'Total_Revenue': table['Total_Amount'].round(2),
+            'Avg_Order_Value': (table['Total_Amount'] / table['Rows']).round(2),
+            'Total_Orders': table['Rows'],
+            'Total_Qty': table['Qty'],
+            'Unique_Customers': customers.reindex(years, fill_value=0).to_numpy(),
+        }
+
+
+def _aggregate(df):
+    """Measures per State x Year x Month (plain str states so frames align)"""
+    if df is None or df.empty or not set(BASE_KEYS).issubset(df.columns):
+        index = pd.MultiIndex.from_arrays([[], np.array([], dtype='int16'), np.array([], dtype='int8')],
+                                          names=BASE_KEYS)
+        return pd.DataFrame({col: np.array([], dtype='int64') for col in MEASURES}, index=index)
+
+    table = df.groupby(BASE_KEYS, observed=True).agg(
+        Total_Amount=('Total_Amount', 'sum'),
+        Inquiry_No=('Inquiry_No', 'count'),
+        Qty=('Qty', 'sum'),
+        Rows=('Total_Amount', 'size'),
+    )
+    return table.set_axis(table.index.set_levels(table.index.levels[0].astype(str), level='State'))
+
+
+def _customer_rows(df):
+    """Order lines per Year x Company, kept to count distinct customers per year"""
+    if df is None or df.empty or 'Company' not in df.columns:
+        index = pd.MultiIndex.from_arrays([np.array([], dtype='int16'), []], names=['Year', 'Company'])
+        return pd.Series(np.array([], dtype='int64'), index=index)
+    counts = df.groupby(['Year', 'Company'], observed=True).size()
+    return counts.set_axis(counts.index.set_levels(counts.index.levels[1].astype(str), level='Company'))
+
+
+def _fold_counts(counts, added, removed):
+    if added.empty and removed.empty:
+        return counts
+    counts = counts.add(added, fill_value=0).sub(removed, fill_value=0).astype('int64')
+    return counts[counts > 0].sort_index()
+
+
+def _fold_measures(table, delta):
+    """table + delta (measures only), dropping periods left without rows"""
+    dtypes = {col: np.result_type(table[col].dtype, delta[col].dtype) for col in MEASURES}
+    measures = table[MEASURES].add(delta[MEASURES], fill_value=0).astype(dtypes)
+    return measures[measures['Rows'] > 0].sort_index()
+
+
+def _fold(table, delta, columns, growth, cumulative=None):
+    """Fold delta into a period table and re-derive only what the touched periods affect"""
+    if delta.empty:
+        return table
+    measures = _fold_measures(table, delta)
+    derived = table.drop(columns=MEASURES).reindex(measures.index)
+    result = pd.concat([measures, derived], axis=1)
+
+    # Touched periods still present, or the period that now follows a removed one
+    touched = np.unique(result.index.searchsorted(delta.index))
+    return _derive(result, touched[touched < len(result)], columns, growth, cumulative)
+
+
+def _derive(table, touched, columns, growth, cumulative=None):
+    """Recompute per-period columns at the touched positions, growth there and one period
+    later, and cumulative sums from the first touched period on"""
+    full = len(touched) == len(table)
+    if not len(touched) and len(table):
+        return table
+
+    for col, values in columns(table.iloc[touched]).items():
+        _assign(table, touched, col, values, full)
+
+    following = np.unique(np.concatenate([touched, touched + 1]))
+    following = following[following < len(table)]
+    for col, source in growth.items():
+        values = table[source].to_numpy(dtype='float64')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change = (values[following] / values[np.maximum(following - 1, 0)] - 1) * 100
+        change[following == 0] = np.nan
+        _assign(table, following, col, change, full)
+
+    for col, source in (cumulative or {}).items():
+        start = touched.min() if len(touched) else 0
+        values = table[source].to_numpy()
+        offset = table[col].iloc[start - 1] if start > 0 else 0
+        _assign(table, np.arange(start, len(table)), col, offset + np.cumsum(values[start:]), full)
+    return table
+
+
+def _assign(table, positions, col, values, full):
+    if full:
+        table[col] = np.asarray(values)
+    else:
+        table.iloc[positions, table.columns.get_loc(col)] = np.asarray(values)
+
+
+def _slice(table, year, growth, cumulative=None):
+    """Flat copy of a period table, optionally one year with growth/cumulative restarting"""
+    if year is not None:
+        table = table[table.index.get_level_values('Year') == year]
+    table = table.drop(columns='Rows').reset_index()
+    if year is not None and not table.empty:
+        table.loc[table.index[0], list(growth)] = np.nan
+        for col, source in (cumulative or {}).items():
+            table[col] -= table[col].iloc[0] - table[source].iloc[0]
+    return table
+
+
+def _by_quarter(monthly):
+    years = monthly.index.get_level_values('Year')
+    quarters = ((monthly.index.get_level_values('Month') - 1) // 3 + 1).astype('int8')
+    return monthly[MEASURES].groupby([years, quarters.rename('Quarter')]).sum()
+
+
+def _monthly_columns(table):
+    return {'Period': pd.to_datetime(pd.DataFrame({
+        'year': table.index.get_level_values('Year'), 'month': table.index.get_level_values('Month'), 'day': 1,
+    })).to_numpy()}
+
+
+def _quarterly_columns(table):
+    years = table.index.get_level_values('Year').astype(str)
+    quarters = table.index.get_level_values('Quarter').astype(str)
+    return {
+        'Quarter_Label': ('Q' + quarters + ' ' + years).to_numpy(dtype=object),
+        'Avg_Order_Value': (table['Total_Amount'] / table['Inquiry_No']).to_numpy(),
+    }
+
+
+def _summary_columns(table):
+    return {'Avg_Order_Value': (table['Total_Amount'] / table['Inquiry_No']).to_numpy()}
@@ -0,0 +1,358 @@
+import threading
+import numpy as np
+import pandas as pd
+from config import QUERY_BACKEND, SCAN_CHUNK_ROWS
+
+try:
+    import duckdb
+except ImportError:  # Optional engine, reports fall back to pandas
+    duckdb = None
+
+# Measures: output name -> (column, function); functions both backends implement
+AGG_FUNCTIONS = ('sum', 'count', 'size', 'mean', 'std', 'min', 'max', 'nunique', 'mode')
+
+# Group keys computed from other columns (Year_Month comes back as month-start timestamps)
+MONTH_KEY = 'Year_Month'
+
+SQL_FUNCTIONS = {
+    'sum': 'sum({})',
+    'count': 'count({})',
+    'size': 'count(*)',
+    'mean': 'avg({})',
+    'std': 'stddev_samp({})',
+    'min': 'min({})',
+    'max': 'max({})',
+    'nunique': 'count(DISTINCT {})',
+}
+
+
+class PandasBackend:
+    """Grouped aggregates over a snapshot frame, filters applied through its filter index"""
+
+    name = 'pandas'
+
+    def __init__(self, df, filter_index=None):
+        self.df = df
+        self.filter_index = filter_index
+
+    def aggregate(self, by, measures, **filters):
+        """Measures per group of `by` (column or list), sorted by the keys
+
+        measures maps output names to (column, function), function one of
+        AGG_FUNCTIONS; 'mode' is the most frequent value, ties to the first
+        in sort order. Filters take a value or a list, None or [] means none.
+        """
+        keys = [by] if isinstance(by, str) else list(by)
+        data = self._select(filters)
+
+        groups = [data[MONTH_KEY].dt.to_timestamp() if key == MONTH_KEY else data[key] for key in keys]
+        grouped = data.groupby(groups, observed=True)
+        result = pd.DataFrame(index=grouped.size().index)
+        for name, (column, func) in measures.items():
+            if func == 'size':
+                result[name] = grouped.size()
+            elif func == 'mode':
+                result[name] = self._mode(data, groups, column)
+            else:
+                result[name] = grouped[column].agg(func)
+        return result
+
+    def distinct(self, column, **filters):
+        """Exact count of the distinct (non-null) values of a column after filters"""
+        return int(self._select(filters)[column].nunique())
+
+    def apply(self, df, filter_index=None):
+        """Backend for the next snapshot's frame, taking over what this one holds"""
+        return type(self)(df, filter_index)
+
+    def close(self):
+        """Release what the backend holds once a newer snapshot replaces it"""
+
+    def _select(self, filters):
+        if self.filter_index is not None:
+            return self.filter_index.select(self.df, **filters)
+        data = self.df
+        for column, wanted in filters.items():
+            wanted = _as_list(wanted)
+            if wanted:
+                data = data[data[column].isin(wanted)]
+        return data
+
+    @staticmethod
+    def _mode(data, groups, column):
+        # Count each (group, value) once instead of a Python mode() per group
+        counts = data.groupby(groups + [data[column]], observed=True).size()
+        counts = counts[counts > 0].rename('n').reset_index()
+        keys = list(counts.columns[:len(groups)])
+        counts = counts.sort_values(keys + ['n', column], ascending=[True] * len(keys) + [False, True])
+        return counts.drop_duplicates(keys).set_index(keys)[column]
+
+
+class DuckDBBackend(PandasBackend):
+    """Same queries pushed down to an embedded DuckDB scanning the snapshot frame in place"""
+
+    name = 'duckdb'
+
+    def __init__(self, df, filter_index=None):
+        super().__init__(df, filter_index)
+        self._lock = threading.Lock()  # One connection; registered views aren't visible to cursors
+        self._con = None
+        self._closed = False
+
+    def aggregate(self, by, measures, **filters):
+        keys = [by] if isinstance(by, str) else list(by)
+        key_sql = [self._key_sql(key) for key in keys]
+        where, params = self._where(filters)
+
+        select = list(key_sql)
+        for name, (column, func) in measures.items():
+            if func == 'mode':
+                continue
+            expr = SQL_FUNCTIONS[func].format(self._column_sql(column))
+            if func == 'sum' and pd.api.types.is_integer_dtype(self.df[column].dtype):
+                expr = f'CAST({expr} AS BIGINT)'
+            select.append(f'{expr} AS "{name}"')
+
+        group = ', '.join(str(i + 1) for i in range(len(keys)))
+        sql = f'SELECT {", ".join(select)} FROM orders {where} GROUP BY {group} ORDER BY {group}'
+        with self._lock:
+            if self._closed:
+                # A render still holding a replaced snapshot: answer from the frame, don't reopen
+                return super().aggregate(by, measures, **filters)
+            con = self._connect()
+            result = con.execute(sql, params).df()
+            modes = {
+                name: con.execute(self._mode_sql(keys, key_sql, column, where), params).df()
+                for name, (column, func) in measures.items() if func == 'mode'
+            }
+
+        result = self._restore_keys(result, keys).set_index(keys)
+        for name, mode in modes.items():
+            mode = self._restore_keys(mode, keys).set_index(keys)
+            result[name] = mode.iloc[:, 0].reindex(result.index)
+        return result[list(measures)]
+
+    def distinct(self, column, **filters):
+        where, params = self._where(filters)
+        with self._lock:
+            if self._closed:
+                return super().distinct(column, **filters)
+            sql = f'SELECT {SQL_FUNCTIONS["nunique"].format(self._column_sql(column))} FROM orders {where}'
+            return int(self._connect().execute(sql, params).fetchone()[0])
+
+    def apply(self, df, filter_index=None):
+        """Hand the open connection to the next snapshot's backend, its view re-registered over df
+
+        This backend is closed afterwards, like after close().
+        """
+        backend = DuckDBBackend(df, filter_index)
+        with self._lock:
+            self._closed = True
+            if self._con is not None:
+                backend._con, self._con = self._con, None
+                backend._register()
+        return backend
+
+    def close(self):
+        """Close the connection for good, later queries run on pandas"""
+        with self._lock:
+            self._closed = True
+            if self._con is not None:
+                self._con.close()
+                self._con = None
+
+    def _connect(self):
+        if self._con is None:
+            self._con = duckdb.connect()
+            self._register()
+        return self._con
+
+    def _register(self):
+        # Period columns have no DuckDB type, Year_Month is rebuilt from Year/Month.
+        # Under copy-on-write the column selection is a view of the snapshot's
+        # arrays (a plain df[columns] would copy all of them)
+        columns = [col for col in self.df.columns if not isinstance(self.df[col].dtype, pd.PeriodDtype)]
+        with pd.option_context('mode.copy_on_write', True):
+            orders = self.df[columns]
+        self._con.register('orders', orders)
+
+    def _key_sql(self, key):
+        if key == MONTH_KEY:
+            return f'make_date(Year, Month, 1) AS "{MONTH_KEY}"'
+        return f'"{key}"'
+
+    def _column_sql(self, column):
+        return 'make_date(Year, Month, 1)' if column == MONTH_KEY else f'"{column}"'
+
+    def _where(self, filters):
+        clauses, params = [], []
+        for column, wanted in filters.items():
+            wanted = [value.item() if hasattr(value, 'item') else value for value in _as_list(wanted)]
+            if not wanted:
+                continue
+            clauses.append(f'"{column}" IN ({", ".join("?" * len(wanted))})')
+            params.extend(wanted)
+        return ('WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def _mode_sql(self, keys, key_sql, column, where):
+        # Most frequent value per group, ties to the first in sort order (like Series.mode)
+        partition = ', '.join(str(i + 1) for i in range(len(keys)))
+        names = ', '.join(f'"{key}"' for key in keys)
+        return (
+            f'SELECT {names}, value FROM ('
+            f'SELECT {", ".join(key_sql)}, "{column}" AS value, '
+            f'row_number() OVER (PARTITION BY {names} ORDER BY count(*) DESC, "{column}") AS rn '
+            f'FROM orders {where} GROUP BY {partition}, {len(keys) + 1}'
+            f') WHERE rn = 1'
+        )
+
+    def _restore_keys(self, result, keys):
+        """Group keys back in the frame's dtypes (categoricals, int widths, ns timestamps)"""
+        for key in keys:
+            if key == MONTH_KEY:
+                result[key] = pd.to_datetime(result[key]).astype('datetime64[ns]')
+            else:
+                dtype = self.df[key].dtype
+                result[key] = result[key].astype(str).astype(dtype) if isinstance(dtype, pd.CategoricalDtype) \
+                    else result[key].astype(dtype)
+        return result
+
+
+class ChunkedBackend:
+    """Same queries streamed from the partitioned snapshot in chunks (out-of-core mode)
+
+    Each chunk is reduced to partial aggregates (sums, counts, min/max,
+    count/mean/M2 for std, distinct value hashes, value counts for mode)
+    that are combined once the scan is done, so memory stays at one chunk
+    plus the partials. Year/Month filters prune partitions before any read.
+    """
+
+    name = 'chunked'
+
+    def __init__(self, store, manifest, chunk_rows=SCAN_CHUNK_ROWS):
+        self.store = store
+        self.manifest = manifest  # The saved history this snapshot covers
+        self.chunk_rows = chunk_rows
+        self.rows = sum(part['rows'] for entry in manifest['partitions'].values() for part in entry['files'])
+
+    def close(self):
+        pass
+
+    def aggregate(self, by, measures, **filters):
+        keys = [by] if isinstance(by, str) else list(by)
+        filters = {column: _as_list(wanted) for column, wanted in filters.items() if _as_list(wanted)}
+        needed = set(keys) | {column for column, _ in measures.values()} | set(filters)
+        if MONTH_KEY in needed:
+            needed = (needed - {MONTH_KEY}) | {'Year', 'Month'}
+
+        partials = []
+        for chunk in self.store.scan(years=filters.get('Year'), months=filters.get('Month'),
+                                     columns=sorted(needed), chunk_rows=self.chunk_rows, manifest=self.manifest):
+            for column, wanted in filters.items():
+                chunk = chunk[chunk[column].isin(wanted)]
+            if MONTH_KEY in keys or any(column == MONTH_KEY for column, _ in measures.values()):
+                months = (chunk['Year'].to_numpy('int64') - 1970) * 12 + chunk['Month'].to_numpy('int64') - 1
+                chunk[MONTH_KEY] = months.astype('datetime64[M]').astype('datetime64[ns]')
+            if not chunk.empty:
+                partials.append(self._partial(chunk, keys, measures))
+        return self._combine(partials, keys, measures)
+
+    def distinct(self, column, **filters):
+        filters = {column: _as_list(wanted) for column, wanted in filters.items() if _as_list(wanted)}
+        hashes = []
+        for chunk in self.store.scan(years=filters.get('Year'), months=filters.get('Month'),
+                                     columns=sorted({column} | set(filters)), chunk_rows=self.chunk_rows,
+                                     manifest=self.manifest):
+            for name, wanted in filters.items():
+                chunk = chunk[chunk[name].isin(wanted)]
+            hashes.append(np.unique(pd.util.hash_pandas_object(chunk[column].dropna(), index=False).to_numpy()))
+        return len(np.unique(np.concatenate(hashes))) if hashes else 0
+
+    @staticmethod
+    def _partial(chunk, keys, measures):
+        """(additive table, {measure: keyed value table}) for one chunk"""
+        grouped = chunk.groupby(keys, observed=True)
+        table = pd.DataFrame({'_size': grouped.size()})
+        values = {}
+        for name, (column, func) in measures.items():
+            if func in ('sum', 'count', 'min', 'max'):
+                table[name] = grouped[column].agg(func)
+            elif func == 'mean':
+                table[f'{name}_sum'] = grouped[column].sum()
+                table[f'{name}_n'] = grouped[column].count()
+            elif func == 'std':
+                n = grouped[column].count()
+                table[f'{name}_n'] = n
+                table[f'{name}_mean'] = grouped[column].mean().fillna(0)
+                table[f'{name}_m2'] = (grouped[column].var(ddof=0) * n).fillna(0)
+            elif func == 'nunique':
+                # Distinct values as 64-bit hashes, deduplicated again when combining
+                present = chunk[chunk[column].notna()]
+                hashes = pd.util.hash_pandas_object(present[column], index=False).rename('_value')
+                values[name] = pd.concat([present[keys], hashes], axis=1).drop_duplicates()
+            elif func == 'mode':
+                values[name] = chunk.groupby(keys + [column], observed=True).size().rename('_n').reset_index()
+        return table.reset_index(), values
+
+    @staticmethod
+    def _combine(partials, keys, measures):
+        if not partials:
+            index = pd.MultiIndex.from_arrays([[]] * len(keys), names=keys) if len(keys) > 1 else pd.Index([], name=keys[0])
+            return pd.DataFrame({name: pd.Series(dtype='float64') for name in measures}, index=index)
+
+        # Chunks disagree on categories, keys are combined as plain values
+        categorical = [key for key in keys if isinstance(partials[0][0][key].dtype, pd.CategoricalDtype)]
+        table = pd.concat([table for table, _ in partials], ignore_index=True)
+        table[categorical] = table[categorical].astype(object)
+        grouped = table.groupby(keys)
+        result = pd.DataFrame(index=grouped['_size'].sum().index)
+        for name, (column, func) in measures.items():
+            if func in ('sum', 'count'):
+                result[name] = grouped[name].sum()
+            elif func == 'size':
+                result[name] = grouped['_size'].sum()
+            elif func in ('min', 'max'):
+                result[name] = grouped[name].agg(func)
+            elif func == 'mean':
+                result[name] = grouped[f'{name}_sum'].sum() / grouped[f'{name}_n'].sum().replace(0, np.nan)
+            elif func == 'std':
+                # Chan et al.: pool the chunks' M2 around the combined mean
+                n, mean, m2 = table[f'{name}_n'], table[f'{name}_mean'], table[f'{name}_m2']
+                groups = [table[key] for key in keys]
+                total = n.groupby(groups).transform('sum')
+                pooled = (n * mean).groupby(groups).transform('sum') / total.replace(0, np.nan)
+                m2 = (m2 + n * (mean - pooled) ** 2).groupby(groups).sum()
+                count = grouped[f'{name}_n'].sum()
+                result[name] = np.sqrt(m2 / (count - 1).where(count > 1))
+            elif func == 'nunique':
+                pairs = pd.concat([values[name] for _, values in partials], ignore_index=True)
+                pairs[categorical] = pairs[categorical].astype(object)
+                result[name] = pairs.drop_duplicates().groupby(keys).size().reindex(result.index, fill_value=0)
+            elif func == 'mode':
+                counts = pd.concat([values[name] for _, values in partials], ignore_index=True)
+                counts[categorical] = counts[categorical].astype(object)
+                counts = counts.groupby(keys + [column], observed=True).sum().reset_index()
+                counts = counts.sort_values(keys + ['_n', column], ascending=[True] * len(keys) + [False, True])
+                result[name] = counts.drop_duplicates(keys).set_index(keys)[column].reindex(result.index)
+
+        if categorical:
+            # Back to categoricals, sorted like the loader's
+            levels = result.index.to_frame(index=False)
+            levels[categorical] = levels[categorical].astype('category')
+            result.index = pd.MultiIndex.from_frame(levels) if len(keys) > 1 else pd.CategoricalIndex(levels[keys[0]])
+        return result[list(measures)]
+
+
+def create_backend(df, filter_index=None, kind=QUERY_BACKEND):
+    """DuckDB when asked for (or "auto" and installed), pandas otherwise"""
+    if kind in ('duckdb', 'auto') and duckdb is not None:
+        return DuckDBBackend(df, filter_index)
+    return PandasBackend(df, filter_index)
+
+
+def _as_list(wanted):
+    if wanted is None:
+        return []
+    if isinstance(wanted, (str, bytes)) or not hasattr(wanted, '__iter__'):
+        return [wanted]
+    return list(wanted)
@@ -0,0 +1,51 @@
+"""Report registry: every report is a module with render(ctx), imported the first time it is selected"""
+import importlib
+from collections import namedtuple
+
+# Sidebar sections: report title -> module in this package
+REPORT_CATEGORIES = {
+    "📊 Overview": {
+        "🏠 Executive Dashboard": 'executive_dashboard',
+        "📈 Performance Metrics": 'performance_metrics',
+    },
+    "🗺️ Geographic": {
+        "🗺️ State-wise Deep Dive": 'state_deep_dive',
+        "🗺️ State vs Product Matrix": 'state_product_matrix',
+        "🗺️ Regional Comparison": 'regional_comparison',
+        "🗺️ Map Analytics": 'map_analytics',
+    },
+    "💰 Financial": {
+        "💰 Revenue Trends": 'revenue_trends',
+        "💰 Year-wise Analysis": 'yearwise_analysis',
+        "💰 Monthly Insights": 'monthly_insights',
+        "💰 Top Revenue Sources": 'top_revenue_sources',
+    },
+    "🔧 Products": {
+        "🔧 Product Performance": 'product_performance',
+        "🔧 Product Trends": 'product_trends',
+        "🔧 Best Sellers by State": 'best_sellers',
+    },
+    "🏢 Companies": {
+        "🏢 Company Analysis": 'company_analysis',
+        "🏢 Customer Segmentation": 'customer_segmentation',
+    },
+    "⚡ Operations": {"⚡ Lead Time Analysis": 'lead_time'},
+    "🧹 Brush System": {"🧹 Brush Follow-up Dashboard": 'brush_followup'},
+    "📥 Export": {"📋 Raw Data Explorer": 'raw_data_explorer'},
+}
+
+REPORT_MODULES = {title: module for reports in REPORT_CATEGORIES.values() for title, module in reports.items()}
+
+
+class ReportContext(namedtuple('ReportContext', [
+    'loader', 'snapshot', 'df', 'order_index', 'order_cube', 'order_rollups', 'order_queries', 'memo', 'chart',
+    'stats', 'years', 'months',
+])):
+    """What app.py hands a report: the published snapshot's views and the shared filters"""
+    __slots__ = ()
+
+
+def render(report, ctx):
+    """Run the selected report only; its module is imported once per process, on first use"""
+    module = importlib.import_module(f'{__name__}.{REPORT_MODULES[report]}')
+    module.render(ctx)
@@ -0,0 +1,462 @@
+"""Best Sellers by State report"""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from config import CURRENCY
+from formatting import compact, inr, number, percent
+
+
+# Apply styling
+def highlight_top3(row):
+    if row['Rank'] == 1:
+        return ['background: linear-gradient(90deg, #FFD700, #FFA500)'] * len(row)
+    elif row['Rank'] == 2:
+        return ['background: linear-gradient(90deg, #C0C0C0, #A0A0A0)'] * len(row)
+    elif row['Rank'] == 3:
+        return ['background: linear-gradient(90deg, #CD7F32, #B87333)'] * len(row)
+    return [''] * len(row)
+
+
+def render(ctx):
+    order_cube, order_queries, memo, chart = ctx.order_cube, ctx.order_queries, ctx.memo, ctx.chart
+    st.markdown("## 🔧 Best Selling Products by State")
+    st.markdown("---")
+    
+    # Get available years
+    available_years = sorted(ctx.years)
+    
+    # Filters row
+    col_state, col_year, col_metric = st.columns([2, 1, 1])
+    
+    with col_state:
+        selected_state = st.selectbox(
+            "🗺️ Select State:", 
+            order_cube.values('State'),
+            help="Choose a state to analyze top products"
+        )
+    
+    with col_year:
+        year_options = ["All Years"] + [str(y) for y in available_years]
+        selected_year_option = st.selectbox(
+            "📅 Year:", 
+            year_options,
+            help="Filter by specific year or view all time data"
+        )
+    
+    with col_metric:
+        ranking_metric = st.selectbox(
+            "📊 Rank By:",
+            ["Revenue", "Quantity", "Orders"],
+            help="Choose metric to rank products"
+        )
+    
+    # Filter data
+    if selected_year_option != "All Years":
+        selected_year = int(selected_year_option)
+        year_label = f" ({selected_year})"
+    else:
+        selected_year = None
+        year_label = " (All Time)"
+    if not order_cube.totals(State=selected_state, Year=selected_year)['Transactions']:
+        st.warning(f"⚠️ No data available for {selected_state}{year_label}")
+        st.stop()
+    
+    # Calculate metrics based on selection
+    if ranking_metric == "Revenue":
+        metric_col = 'Total_Amount'
+        agg_func = 'sum'
+        currency_prefix = CURRENCY
+        chart_color_scale = 'Viridis'
+    elif ranking_metric == "Quantity":
+        metric_col = 'Qty'
+        agg_func = 'sum'
+        currency_prefix = ""
+        chart_color_scale = 'Plasma'
+    else:  # Orders
+        metric_col = 'Inquiry_No'
+        agg_func = 'count'
+        currency_prefix = ""
+        chart_color_scale = 'Inferno'
+    
+    # Aggregate data (cube roll-up for the selected state and year)
+    product_stats = order_cube.rollup('Product', State=selected_state, Year=selected_year).rename(
+        columns={'Revenue': 'Total_Amount', 'Transactions': 'Orders'}
+    )[['Total_Amount', 'Qty', 'Orders']]
+    
+    # Calculate additional metrics
+    product_stats['Avg_Order_Value'] = product_stats['Total_Amount'] / product_stats['Orders']
+    
+    # Calculate market share based on selected metric
+    if ranking_metric == "Orders":
+        total_metric = product_stats['Orders'].sum()
+        product_stats['Market_Share'] = (product_stats['Orders'] / total_metric * 100)
+    elif ranking_metric == "Quantity":
+        total_metric = product_stats['Qty'].sum()
+        product_stats['Market_Share'] = (product_stats['Qty'] / total_metric * 100)
+    else:
+        total_metric = product_stats['Total_Amount'].sum()
+        product_stats['Market_Share'] = (product_stats['Total_Amount'] / total_metric * 100)
+    
+    # Sort by selected metric
+    if ranking_metric == "Orders":
+        sort_col = 'Orders'
+    elif ranking_metric == "Quantity":
+        sort_col = 'Qty'
+    else:
+        sort_col = 'Total_Amount'
+    
+    top_products = product_stats.sort_values(sort_col, ascending=False).head(20)
+    
+    # Header with metrics
+    st.markdown(f"### 📈 Top Performing Products in **{selected_state}**{year_label}")
+    
+    # KPI Cards
+    col_kpi1, col_kpi2, col_kpi3, col_kpi4 = st.columns(4)
+    
+    state_totals = order_cube.totals(State=selected_state, Year=selected_year)
+    
+    with col_kpi1:
+        total_revenue = state_totals['Revenue']
+        st.metric(
+            "Total Revenue", 
+            f"{CURRENCY}{total_revenue:,.0f}",
+            help="Total revenue for selected state and period"
+        )
+    
+    with col_kpi2:
+        # Exact, the cube's Orders is an estimate
+        total_orders = memo('distinct_orders', lambda: order_queries.distinct(
+            'Inquiry_No', State=selected_state, Year=selected_year), State=selected_state, Year=selected_year)
+        st.metric("Total Orders", f"{total_orders:,}")
+    
+    with col_kpi3:
+        top_product = top_products.index[0] if not top_products.empty else "N/A"
+        st.metric("Top Product", top_product[:20] + "..." if len(str(top_product)) > 20 else top_product)
+    
+    with col_kpi4:
+        top_product_share = top_products.iloc[0]['Market_Share'] if not top_products.empty else 0
+        st.metric("Top Product Share", f"{top_product_share:.1f}%")
+    
+    st.markdown("---")
+    
+    # Main content tabs
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "🏆 Rankings", 
+        "📊 Visual Analysis", 
+        "📈 Trends", 
+        "🔍 Detailed Breakdown"
+    ])
+    
+    with tab1:
+        col_chart, col_table = st.columns([3, 2])
+        
+        with col_chart:
+            st.markdown(f"#### Top 15 Products by {ranking_metric}")
+            
+            # Create enhanced bar chart
+            display_df = top_products.head(15).reset_index()
+            display_df['Rank'] = range(1, len(display_df) + 1)
+            
+            # Determine color based on ranking metric
+            if ranking_metric == "Revenue":
+                color_col = 'Total_Amount'
+                hover_data = ['Qty', 'Orders', 'Avg_Order_Value']
+            elif ranking_metric == "Quantity":
+                color_col = 'Qty'
+                hover_data = ['Total_Amount', 'Orders', 'Avg_Order_Value']
+            else:
+                color_col = 'Orders'
+                hover_data = ['Total_Amount', 'Qty', 'Avg_Order_Value']
+            
+            fig = chart('best_sellers_bar', lambda: px.bar(
+                display_df,
+                y='Product',
+                x=sort_col,
+                orientation='h',
+                color=color_col,
+                color_continuous_scale=chart_color_scale,
+                title=f"Best Sellers - {selected_state}{year_label}",
+                labels={sort_col: ranking_metric, 'Product': ''},
+                hover_data=hover_data,
+                text=sort_col
+            ).update_traces(
+                texttemplate=f'{currency_prefix}' + '%{text:,.0f}',
+                textposition='outside',
+                textfont=dict(size=10)
+            ).update_layout(
+                height=600,
+                yaxis=dict(autorange="reversed", categoryorder='total ascending'),
+                xaxis_title=ranking_metric,
+                template='plotly_white',
+                coloraxis_colorbar=dict(title=ranking_metric)
+            ), display_df, sort_col=sort_col, color_col=color_col, chart_color_scale=chart_color_scale,
+                selected_state=selected_state, year_label=year_label, ranking_metric=ranking_metric,
+                hover_data=hover_data, currency_prefix=currency_prefix)
+            
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col_table:
+            st.markdown("#### 📋 Detailed Rankings")
+            
+            # Prepare display table
+            display_table = top_products.head(15).copy()
+            display_table['Rank'] = range(1, len(display_table) + 1)
+            
+            # Format columns
+            display_table['Revenue'] = inr(display_table['Total_Amount'])
+            display_table['Quantity'] = number(display_table['Qty'])
+            display_table['Orders'] = number(display_table['Orders'])
+            display_table['Avg_Order'] = inr(display_table['Avg_Order_Value'])
+            display_table['Market_Share'] = percent(display_table['Market_Share'])
+            
+            # Reorder columns
+            display_table = display_table[['Rank', 'Revenue', 'Quantity', 'Orders', 'Avg_Order', 'Market_Share']]
+            
+            st.dataframe(
+                display_table.style.apply(highlight_top3, axis=1),
+                use_container_width=True,
+                height=600,
+                hide_index=False
+            )
+    
+    with tab2:
+        col_treemap, col_pie = st.columns(2)
+        
+        with col_treemap:
+            st.markdown("#### 🗺️ Revenue Distribution (Treemap)")
+            
+            fig_treemap = px.treemap(
+                top_products.head(10).reset_index(),
+                path=[px.Constant(selected_state), 'Product'],
+                values='Total_Amount',
+                color='Total_Amount',
+                color_continuous_scale='RdYlBu',
+                title=f"Top 10 Products Revenue Share"
+            )
+            fig_treemap.update_layout(height=500, template='plotly_white')
+            fig_treemap.update_traces(
+                textinfo="label+value+percent parent",
+                texttemplate='<b>%{label}</b><br>%{value:,.0f}<br>(%{percentParent:.1%})'
+            )
+            st.plotly_chart(fig_treemap, use_container_width=True)
+        
+        with col_pie:
+            st.markdown("#### 🥧 Market Share (Top 10)")
+            
+            pie_data = top_products.head(10).reset_index()
+            others_revenue = product_stats['Total_Amount'].sum() - pie_data['Total_Amount'].sum()
+            
+            if others_revenue > 0:
+                pie_data = pd.concat([
+                    pie_data,
+                    pd.DataFrame([{'Product': 'Others', 'Total_Amount': others_revenue}])
+                ], ignore_index=True)
+            
+            fig_pie = chart('best_sellers_share_pie', lambda: px.pie(
+                pie_data,
+                values='Total_Amount',
+                names='Product',
+                hole=0.4,
+                color_discrete_sequence=px.colors.qualitative.Set3
+            ).update_traces(
+                textposition='outside',
+                textinfo='percent+label',
+                pull=[0.02 if i < 3 else 0 for i in range(len(pie_data))],
+                marker=dict(line=dict(color='#ffffff', width=2))
+            ).update_layout(
+                height=500,
+                template='plotly_white',
+                showlegend=False,
+                annotations=[dict(text=f'Top 10<br>+Others', x=0.5, y=0.5, font_size=14, showarrow=False)]
+            ), pie_data)
+            
+            st.plotly_chart(fig_pie, use_container_width=True)
+        
+        # Pareto Chart
+        st.markdown("#### 📊 Pareto Analysis (80/20 Rule)")
+        
+        pareto_data = top_products.copy()
+        pareto_data['Cumulative_Revenue'] = pareto_data['Total_Amount'].cumsum()
+        pareto_data['Cumulative_Percentage'] = (pareto_data['Cumulative_Revenue'] / 
+                                                pareto_data['Total_Amount'].sum() * 100)
+        
+        fig_pareto = go.Figure()
+        
+        # Bar chart
+        fig_pareto.add_trace(go.Bar(
+            x=list(range(len(pareto_data.head(15)))),
+            y=pareto_data.head(15)['Total_Amount'],
+            name='Revenue',
+            marker_color='royalblue',
+            text=compact(pareto_data.head(15)['Total_Amount'], 'K', 0),
+            textposition='auto'
+        ))
+        
+        # Line chart for cumulative percentage
+        fig_pareto.add_trace(go.Scatter(
+            x=list(range(len(pareto_data.head(15)))),
+            y=pareto_data.head(15)['Cumulative_Percentage'],
+            name='Cumulative %',
+            yaxis='y2',
+            line=dict(color='red', width=3),
+            marker=dict(size=8)
+        ))
+        
+        # 80% line
+        fig_pareto.add_hline(y=80, line_dash="dash", line_color="green", 
+                            annotation_text="80% Threshold", yref='y2')
+        
+        fig_pareto.update_layout(
+            title="Pareto Chart: Product Contribution Analysis",
+            xaxis=dict(
+                tickmode='array',
+                tickvals=list(range(len(pareto_data.head(15)))),
+                ticktext=[p[:15] + "..." if len(p) > 15 else p for p in pareto_data.head(15).index],
+                tickangle=-45
+            ),
+            yaxis=dict(title='Revenue', side='left'),
+            yaxis2=dict(
+                title='Cumulative %',
+                side='right',
+                overlaying='y',
+                range=[0, 100],
+                ticksuffix='%'
+            ),
+            height=500,
+            template='plotly_white',
+            legend=dict(orientation="h", yanchor="bottom", y=1.02)
+        )
+        
+        st.plotly_chart(fig_pareto, use_container_width=True)
+        
+        # Find products contributing to 80%
+        products_80 = pareto_data[pareto_data['Cumulative_Percentage'] <= 80]
+        if not products_80.empty:
+            st.success(f"🎯 **Insight:** Top {len(products_80)} products ({len(products_80)/len(pareto_data)*100:.1f}%) "
+                      f"contribute to 80% of total revenue in {selected_state}")
+    
+    with tab3:
+        st.markdown(f"#### 📈 Monthly Trends for Top 5 Products")
+        
+        # Get top 5 products
+        top_5_products = top_products.head(5).index.tolist()
+        
+        # Prepare monthly data (cube roll-up)
+        monthly_agg = order_cube.rollup(
+            ['Year_Month', 'Product'], State=selected_state, Year=selected_year, Product=top_5_products,
+        )['Revenue'].rename('Total_Amount').reset_index()
+        monthly_agg['Month'] = monthly_agg.pop('Year_Month').dt.to_timestamp()
+        
+        fig_trends = px.line(
+            monthly_agg,
+            x='Month',
+            y='Total_Amount',
+            color='Product',
+            markers=True,
+            title=f"Monthly Revenue Trends - Top 5 Products",
+            template='plotly_white'
+        )
+        
+        fig_trends.update_layout(
+            height=450,
+            xaxis_title="Month",
+            yaxis_title=f"Revenue ({CURRENCY})",
+            hovermode='x unified',
+            legend=dict(orientation="h", yanchor="bottom", y=-0.3)
+        )
+        
+        st.plotly_chart(fig_trends, use_container_width=True)
+        
+        # Seasonality analysis
+        st.markdown("#### 🗓️ Seasonality Pattern")
+        
+        seasonal_data = monthly_agg.copy()
+        seasonal_data['Month_Name'] = seasonal_data['Month'].dt.strftime('%B')
+        seasonal_data['Month_Num'] = seasonal_data['Month'].dt.month
+        
+        seasonal_agg = seasonal_data.groupby(['Month_Num', 'Month_Name'], observed=True)['Total_Amount'].sum().reset_index()
+        seasonal_agg = seasonal_agg.sort_values('Month_Num')
+        
+        fig_seasonal = chart('best_sellers_seasonal_bar', lambda: px.bar(
+            seasonal_agg,
+            x='Month_Name',
+            y='Total_Amount',
+            color='Total_Amount',
+            color_continuous_scale='Viridis',
+            title="Seasonal Revenue Distribution (All Products)",
+            template='plotly_white'
+        ).update_layout(height=400, xaxis_title="Month", yaxis_title=f"Revenue ({CURRENCY})"), seasonal_agg)
+        st.plotly_chart(fig_seasonal, use_container_width=True)
+    
+    with tab4:
+        st.markdown("#### 🔍 Product Performance Matrix")
+        
+        # Scatter plot: Quantity vs Revenue
+        scatter_data = top_products.head(20).reset_index()
+        
+        fig_scatter = px.scatter(
+            scatter_data,
+            x='Qty',
+            y='Total_Amount',
+            size='Orders',
+            color='Avg_Order_Value',
+            hover_name='Product',
+            text='Product',
+            title="Product Performance Matrix (Top 20)",
+            labels={
+                'Qty': 'Total Quantity Sold',
+                'Total_Amount': f'Total Revenue ({CURRENCY})',
+                'Orders': 'Number of Orders',
+                'Avg_Order_Value': f'Avg Order Value ({CURRENCY})'
+            },
+            template='plotly_white',
+            color_continuous_scale='Plasma'
+        )
+        
+        fig_scatter.update_traces(
+            textposition='top center',
+            textfont=dict(size=9),
+            marker=dict(line=dict(width=1, color='DarkSlateGrey'))
+        )
+        
+        fig_scatter.update_layout(height=550)
+        st.plotly_chart(fig_scatter, use_container_width=True)
+        
+        # Product comparison table with all metrics
+        st.markdown("#### 📊 Complete Product Metrics")
+        
+        complete_metrics = top_products.copy()
+        
+        # Only calculate if columns exist
+        if 'Qty' in complete_metrics.columns and complete_metrics['Qty'].sum() > 0:
+            complete_metrics['Revenue_per_Unit'] = complete_metrics['Total_Amount'] / complete_metrics['Qty']
+        else:
+            complete_metrics['Revenue_per_Unit'] = 0
+            
+        complete_metrics['Revenue_per_Order'] = complete_metrics['Total_Amount'] / complete_metrics['Orders']
+        
+        # Format for display
+        display_complete = complete_metrics.copy()
+        display_complete['Total_Amount'] = inr(display_complete['Total_Amount'])
+        display_complete['Qty'] = number(display_complete['Qty'])
+        display_complete['Orders'] = number(display_complete['Orders'])
+        display_complete['Avg_Order_Value'] = inr(display_complete['Avg_Order_Value'])
+        display_complete['Market_Share'] = percent(display_complete['Market_Share'], 2)
+        display_complete['Revenue_per_Unit'] = inr(display_complete['Revenue_per_Unit'])
+        display_complete['Revenue_per_Order'] = inr(display_complete['Revenue_per_Order'])
+        
+        st.dataframe(
+            display_complete[['Total_Amount', 'Qty', 'Orders', 'Avg_Order_Value', 
+                             'Market_Share', 'Revenue_per_Unit', 'Revenue_per_Order']],
+            use_container_width=True,
+            height=500
+        )
+        
+        # Export option
+        st.download_button(
+            label="📥 Download Product Analysis (CSV)",
+            data=top_products.to_csv().encode('utf-8'),
+            file_name=f'best_sellers_{selected_state}_{selected_year_option.replace(" ", "_")}.csv',
+            mime='text/csv'
+        )
@@ -0,0 +1,285 @@
+"""Brush Follow-up Dashboard report"""
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+from config import CURRENCY, BRUSH_SHEET_NAME
+from formatting import inr_column
+from table_pages import page_bounds
+
+
+# Color coding for status
+def color_status(val):
+    if '🔴' in val:
+        return 'background-color: #ffebee; color: #c62828; font-weight: bold;'
+    elif '🟠' in val:
+        return 'background-color: #fff3e0; color: #ef6c00; font-weight: bold;'
+    elif '🟡' in val:
+        return 'background-color: #fffde7; color: #f9a825; font-weight: bold;'
+    else:
+        return 'background-color: #e8f5e9; color: #2e7d32; font-weight: bold;'
+
+
+@st.fragment
+def _advanced_search(brush_df, order_index):
+    """Search & Filter tab; its filters rerun only this tab"""
+    st.markdown("### 🔍 Advanced Search")
+
+    # Advanced filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        filter_state = st.multiselect("Select States:", options=sorted(brush_df['State'].unique()))
+    with col2:
+        filter_product = st.multiselect("Select Products:", options=sorted(brush_df['Product'].unique()))
+    with col3:
+        date_range = st.date_input("Purchase Date Range:", 
+                                  [brush_df['Date'].min(), brush_df['Date'].max()])
+
+    # Apply advanced filters (State/Product resolved on the order index)
+    search_result = brush_df
+    if filter_state or filter_product:
+        matching = order_index.row_labels(State=filter_state, Product=filter_product)
+        search_result = search_result[search_result.index.isin(matching)]
+    if len(date_range) == 2:
+        search_result = search_result[(search_result['Date'] >= pd.Timestamp(date_range[0])) & 
+                                     (search_result['Date'] <= pd.Timestamp(date_range[1]))]
+
+    if not search_result.empty:
+        st.success(f"Found {len(search_result)} records matching your criteria")
+        st.dataframe(search_result[[
+            'Date', 'Company', 'Client_Name', 'Product', 'State', 
+            'Total_Amount', 'Follow_Up_Date', 'Urgency'
+        ]], column_config={
+            'Date': st.column_config.DateColumn(format='DD-MM-YYYY'),
+            'Follow_Up_Date': st.column_config.DateColumn(format='DD-MM-YYYY'),
+            'Total_Amount': inr_column(),
+        }, use_container_width=True)
+
+        # Export option for filtered data
+        csv = search_result.to_csv(index=False).encode('utf-8')
+        st.download_button(
+            label="📥 Download Filtered Data as CSV",
+            data=csv,
+            file_name=f"brush_followups_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime='text/csv'
+        )
+    else:
+        st.warning("No records found matching your criteria.")
+
+
+@st.fragment
+def _followup_reminders(brush_df):
+    """Follow-up Reminders tab; the status filter and company search rerun only this tab"""
+    st.markdown("### 📋 Follow-up Reminder Table")
+    st.info("Brush sets need replacement after 90 days. Below is the automatic follow-up schedule based on purchase dates.")
+
+    # Sort by urgency (overdue first)
+    urgency_order = {'🔴 Overdue': 0, '🟠 Due This Week': 1, '🟡 Due This Month': 2, '🟢 Future': 3}
+    statuses = sorted(brush_df['Urgency'].unique(), key=lambda status: urgency_order.get(status, len(urgency_order)))
+
+    # Filter options
+    col1, col2 = st.columns(2)
+    with col1:
+        status_filter = st.multiselect("Filter by Status:", 
+                                      options=statuses,
+                                      default=statuses)
+    with col2:
+        search_company = st.text_input("Search Company:", placeholder="Type company name...")
+
+    # Apply filters and the sort on row positions; only the page shown is formatted and styled
+    keep = brush_df['Urgency'].isin(status_filter).to_numpy()
+    if search_company:
+        keep &= brush_df['Company'].astype(str).str.contains(search_company, case=False, regex=False).to_numpy()
+    rows = np.flatnonzero(keep)
+    priority = brush_df['Urgency'].map(urgency_order).to_numpy(dtype=float)[rows]
+    rows = rows[np.argsort(priority, kind='stable')]
+
+    # Display styled table
+    if len(rows):
+        start, stop = page_bounds(len(rows), key="brush_followups")
+
+        # Create display table
+        display_df = brush_df.iloc[rows[start:stop]][[
+            'Date', 'Company', 'Client_Name', 'Product', 'State', 
+            'Follow_Up_Date', 'Days_Until_Followup', 'Urgency', 'Inquiry_No'
+        ]].copy()
+
+        # Rename columns for display
+        display_df.columns = [
+            'Purchase Date', 'Company Name', 'Client Name', 'Product', 'State',
+            'Follow-up Date', 'Days Left', 'Status', 'Inquiry No'
+        ]
+
+        # Format dates
+        display_df['Purchase Date'] = display_df['Purchase Date'].dt.strftime('%d-%m-%Y')
+        display_df['Follow-up Date'] = display_df['Follow-up Date'].dt.strftime('%d-%m-%Y')
+
+        styled_df = display_df.style.applymap(color_status, subset=['Status'])
+        st.dataframe(styled_df, use_container_width=True, height=500)
+
+        # Summary for filtered view
+        st.caption(f"Showing {len(rows)} of {len(brush_df)} total records")
+    else:
+        st.warning("No records match your filter criteria.")
+
+
+def render(ctx):
+    loader, df, order_index, chart = ctx.loader, ctx.df, ctx.order_index, ctx.chart
+    st.markdown("""
+    <div class="brush-header">
+        <h2>🧹 Broomer / Sweeper / Brush Set - Follow-up System</h2>
+        <p>Track brush set purchases and manage 3-month replacement follow-ups</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Process brush data
+    brush_df = loader.identify_brush_products(df)
+    
+    if brush_df.empty:
+        st.warning("No Broomer, Sweeper, or Brush products found in the current dataset.")
+        st.stop()
+    
+    # Calculate follow-up dates
+    brush_df = loader.calculate_followup_dates(brush_df)
+    brush_stats = loader.get_brush_summary_stats(brush_df)
+    
+    # ==================== MINI DASHBOARD METRICS ====================
+    st.markdown("### 📊 Quick Overview")
+    
+    metric_cols = st.columns(5)
+    with metric_cols[0]:
+        st.metric("🧹 Total Units", f"{brush_stats['total_units']:,}")
+    with metric_cols[1]:
+        st.metric("💰 Total Revenue", f"{CURRENCY}{brush_stats['total_revenue']:,.0f}")
+    with metric_cols[2]:
+        st.metric("🏢 Unique Companies", f"{brush_stats['unique_companies']}")
+    with metric_cols[3]:
+        st.metric("⚠️ Overdue Follow-ups", f"{brush_stats['overdue_count']}", 
+                 delta="Action Needed" if brush_stats['overdue_count'] > 0 else None,
+                 delta_color="inverse")
+    with metric_cols[4]:
+        st.metric("📅 Due This Month", f"{brush_stats['upcoming_count']}")
+    
+    st.markdown("---")
+    
+    # ==================== TABS FOR ORGANIZATION ====================
+    tab1, tab2, tab3, tab4 = st.tabs(["📋 Follow-up Reminders", "📈 Analytics", "🔍 Search & Filter", "💾 Data Management"])
+    
+    # ==================== TAB 1: FOLLOW-UP REMINDERS ====================
+    with tab1:
+        _followup_reminders(brush_df)
+    
+    # ==================== TAB 2: ANALYTICS ====================
+    with tab2:
+        st.markdown("### 📈 Brush Product Analytics")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Urgency Distribution
+            st.markdown("#### ⏰ Follow-up Status Distribution")
+            urgency_data = brush_df['Urgency'].value_counts().reset_index()
+            urgency_data.columns = ['Status', 'Count']
+            
+            fig_urgency = chart('brush_urgency_pie', lambda: px.pie(
+                urgency_data, values='Count', names='Status',
+                color_discrete_map={
+                    '🔴 Overdue': '#c62828',
+                    '🟠 Due This Week': '#ef6c00',
+                    '🟡 Due This Month': '#f9a825',
+                    '🟢 Future': '#2e7d32'
+                },
+                hole=0.4,
+            ).update_traces(textinfo='percent+label', textposition='outside'), urgency_data)
+            st.plotly_chart(fig_urgency, use_container_width=True)
+        
+        with col2:
+            # Top Products
+            st.markdown("#### 🏆 Top Brush Products")
+            top_products = brush_df['Product'].value_counts().head(10).reset_index()
+            top_products.columns = ['Product', 'Units Sold']
+            
+            fig_products = chart('brush_products_bar', lambda: px.bar(
+                top_products, y='Product', x='Units Sold', orientation='h', color='Units Sold',
+                color_continuous_scale='Viridis',
+            ).update_layout(yaxis=dict(autorange="reversed")), top_products)
+            st.plotly_chart(fig_products, use_container_width=True)
+        
+        # Timeline view
+        st.markdown("#### 📅 Follow-up Timeline")
+        timeline_df = brush_df.copy()
+        timeline_df['Month'] = timeline_df['Follow_Up_Date'].dt.strftime('%Y-%m')
+        monthly_followups = timeline_df.groupby(['Month', 'Urgency'], observed=True).size().reset_index(name='Count')
+        
+        fig_timeline = chart('brush_timeline_bar', lambda: px.bar(
+            monthly_followups, x='Month', y='Count', color='Urgency',
+            color_discrete_map={
+                '🔴 Overdue': '#c62828',
+                '🟠 Due This Week': '#ef6c00',
+                '🟡 Due This Month': '#f9a825',
+                '🟢 Future': '#2e7d32'
+            },
+            barmode='stack',
+        ).update_layout(xaxis_title="Follow-up Month", yaxis_title="Number of Follow-ups"), monthly_followups)
+        st.plotly_chart(fig_timeline, use_container_width=True)
+        
+        # State-wise analysis
+        st.markdown("#### 🗺️ State-wise Brush Sales")
+        state_brush = brush_df.groupby('State', observed=True).agg({
+            'Total_Amount': 'sum',
+            'Company': 'nunique',
+            'Inquiry_No': 'count'
+        }).reset_index()
+        state_brush.columns = ['State', 'Revenue', 'Companies', 'Units']
+        
+        fig_state = px.scatter(state_brush, x='Companies', y='Revenue', size='Units',
+                              color='Revenue', hover_name='State',
+                              color_continuous_scale='Plasma')
+        fig_state.update_layout(xaxis_title="Number of Companies", yaxis_title=f"Revenue ({CURRENCY})")
+        st.plotly_chart(fig_state, use_container_width=True)
+    
+    # ==================== TAB 3: SEARCH & FILTER ====================
+    with tab3:
+        _advanced_search(brush_df, order_index)
+    
+    # ==================== TAB 4: DATA MANAGEMENT ====================
+    with tab4:
+        st.markdown("### 💾 Store to Google Sheets")
+        st.info(f"This will store all {len(brush_df)} brush product records to the '{BRUSH_SHEET_NAME}' sheet in your Google Spreadsheet.")
+        
+        # Show preview of what will be stored
+        with st.expander("👁️ Preview Data to be Stored"):
+            preview_df = brush_df[[
+                'Date', 'Inquiry_No', 'Company', 'Client_Name', 'Product', 
+                'State', 'Total_Amount', 'Follow_Up_Date', 'Urgency'
+            ]].copy()
+            preview_df['Date'] = preview_df['Date'].dt.strftime('%d-%m-%Y')
+            preview_df['Follow_Up_Date'] = preview_df['Follow_Up_Date'].dt.strftime('%d-%m-%Y')
+            st.dataframe(preview_df.head(10), use_container_width=True)
+            st.caption(f"Showing first 10 of {len(brush_df)} records")
+        
+        # Store button
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            if st.button("🚀 Store to Sheet", type="primary", use_container_width=True):
+                with st.spinner("Storing data to Google Sheets..."):
+                    success, message = loader.store_to_brush_sheet(brush_df)
+                    if success:
+                        st.success(message)
+                        st.balloons()
+                    else:
+                        st.error(message)
+        
+        with col2:
+            # Check existing data
+            existing_data = loader.fetch_existing_brush_data()
+            if existing_data is not None and not existing_data.empty:
+                st.info(f"ℹ️ Sheet currently contains {len(existing_data)} records. Storing will update with latest data from Order Confirmation sheet.")
+            else:
+                st.info("ℹ️ No existing data found in the sheet. This will create a new entry.")
+        
+        # Show existing data if available
+        if existing_data is not None and not existing_data.empty:
+            st.markdown("### 📋 Currently Stored Data")
+            st.dataframe(existing_data, use_container_width=True, height=300)
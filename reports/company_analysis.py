@@ -0,0 +1,547 @@
+"""Company Analysis report"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from config import CURRENCY
+from formatting import compact, inr, number, percent
+
+
+# Customer Tier Classification
+def classify_customer(row):
+    if row['Monetary_Score'] >= 4 and row['Frequency_Score'] >= 4:
+        return '💎 Champion'
+    elif row['Monetary_Score'] >= 4:
+        return '🥇 Loyal Customer'
+    elif row['Frequency_Score'] >= 4:
+        return '📈 Potential Loyalist'
+    elif row['Recency_Score'] >= 4:
+        return '🆕 New Customer'
+    elif row['Recency_Score'] <= 2 and row['Monetary_Score'] >= 3:
+        return '⚠️ At Risk'
+    elif row['Recency_Score'] <= 2:
+        return '😴 Hibernating'
+    else:
+        return '📊 Needs Attention'
+
+
+def highlight_segment(val):
+    if 'Champion' in val:
+        return 'background-color: gold; color: black; font-weight: bold'
+    elif 'Loyal' in val:
+        return 'background-color: silver; color: black'
+    elif 'At Risk' in val:
+        return 'background-color: #ff6b6b; color: white'
+    elif 'Hibernating' in val:
+        return 'background-color: #4ecdc4; color: white'
+    return ''
+
+
+@st.fragment
+def _company_profile(display_df, analysis_df, chart):
+    """Detailed Profiles tab: switching company reruns only the profile"""
+    st.markdown("#### 📋 Individual Company Profile")
+
+    selected_company = st.selectbox(
+        "Select Company to View Profile:",
+        options=display_df.index.tolist(),
+        index=0 if len(display_df) > 0 else None
+    )
+
+    if selected_company:
+        company_data = display_df.loc[selected_company]
+        company_transactions = analysis_df[analysis_df['Company'] == selected_company].copy()
+
+        col_prof1, col_prof2, col_prof3 = st.columns([2, 2, 1])
+
+        with col_prof1:
+            st.markdown(f"### 🏢 {selected_company}")
+            st.caption(f"Primary State: {company_data['Primary_State']}")
+            st.caption(f"Customer Since: {pd.to_datetime(company_data['First_Order']).strftime('%b %Y')}")
+
+        with col_prof2:
+            segment = company_data['Customer_Segment']
+            st.markdown(f"**Segment:** {segment}")
+
+            rfm_score = int(company_data['Recency_Score']) + int(company_data['Frequency_Score']) + int(company_data['Monetary_Score'])
+            st.progress(rfm_score / 15, text=f"RFM Score: {rfm_score}/15")
+
+        with col_prof3:
+            st.metric("Total Revenue", f"{CURRENCY}{company_data['Total_Revenue']:,.0f}")
+            st.metric("Total Orders", f"{int(company_data['Total_Orders'])}")
+
+        st.markdown("#### 📜 Transaction History")
+
+        trans_display = company_transactions[[
+            'Date', 'Inquiry_No', 'Product', 'Qty', 'Total_Amount', 'State'
+        ]].sort_values('Date', ascending=False)
+
+        trans_display['Date'] = pd.to_datetime(trans_display['Date']).dt.strftime('%Y-%m-%d')
+        trans_display['Total_Amount'] = inr(trans_display['Total_Amount'])
+
+        st.dataframe(trans_display, use_container_width=True, height=300)
+
+        st.markdown("#### 🏷️ Product Preferences")
+
+        product_pref = company_transactions.groupby('Product', observed=True).agg({
+            'Total_Amount': 'sum',
+            'Qty': 'sum',
+            'Inquiry_No': 'count'
+        }).rename(columns={'Inquiry_No': 'Orders'}).sort_values('Total_Amount', ascending=False).head(10)
+
+        fig_pref = chart('company_product_pref_bar', lambda: px.bar(
+            product_pref.reset_index(),
+            x='Total_Amount',
+            y='Product',
+            orientation='h',
+            color='Orders',
+            color_continuous_scale='Blues',
+            title=f"Top Products for {selected_company}",
+            labels={'Total_Amount': f'Revenue ({CURRENCY})'}
+        ).update_layout(height=350, template='plotly_white', yaxis=dict(autorange="reversed")),
+            product_pref, selected_company=selected_company)
+        st.plotly_chart(fig_pref, use_container_width=True)
+
+        if len(company_transactions) > 1:
+            st.markdown("#### 📈 Purchase Trend")
+
+            monthly_company = company_transactions.groupby(
+                company_transactions['Year_Month'].rename('Date'), observed=True
+            )['Total_Amount'].sum().reset_index()
+            monthly_company['Date'] = monthly_company['Date'].dt.to_timestamp()
+
+            fig_trend = px.line(
+                monthly_company,
+                x='Date',
+                y='Total_Amount',
+                markers=True,
+                title="Monthly Purchase History",
+                template='plotly_white'
+            )
+            fig_trend.update_layout(height=300)
+            st.plotly_chart(fig_trend, use_container_width=True)
+
+
+@st.fragment
+def _company_panel(company_metrics, filtered_metrics, segmentation, period_label, year_option, analysis_df,
+                   chart):
+    """Filter controls, KPIs and tabs over the shared company metrics; a filter change reruns only this panel"""
+    # Additional filters
+    st.markdown("### 🔍 Filter Controls")
+
+    col_f1, col_f2, col_f3, col_f4 = st.columns(4)
+
+    with col_f1:
+        # FIXED: Removed currency symbol from format
+        min_revenue = st.number_input(
+            "Min Revenue:",
+            min_value=0.0,
+            value=0.0,
+            step=1000.0,
+            format="%.0f",
+            help=f"Minimum revenue threshold (in {CURRENCY})"
+        )
+        # Show currency indicator below
+        st.caption(f"Currency: {CURRENCY}")
+
+    with col_f2:
+        min_orders = st.number_input(
+            "Min Orders:",
+            min_value=1,
+            value=1,
+            step=1
+        )
+
+    with col_f3:
+        max_days_inactive = st.slider(
+            "Max Days Inactive:",
+            min_value=0,
+            max_value=int(company_metrics['Days_Since_Last_Order'].max()),
+            value=int(company_metrics['Days_Since_Last_Order'].max())
+        )
+
+    with col_f4:
+        selected_segments = st.multiselect(
+            "Customer Segments:",
+            options=sorted(company_metrics['Customer_Segment'].unique()),
+            default=sorted(company_metrics['Customer_Segment'].unique())
+        )
+
+    # Apply filters
+    display_df = filtered_metrics[
+        (filtered_metrics['Total_Revenue'] >= min_revenue) &
+        (filtered_metrics['Total_Orders'] >= min_orders) &
+        (filtered_metrics['Days_Since_Last_Order'] <= max_days_inactive) &
+        (filtered_metrics['Customer_Segment'].isin(selected_segments))
+    ].copy()
+
+    # Sort based on segmentation selection
+    if segmentation == "Revenue":
+        display_df = display_df.sort_values('Total_Revenue', ascending=False)
+    elif segmentation == "Order Frequency":
+        display_df = display_df.sort_values('Order_Frequency', ascending=False)
+    elif segmentation == "Order Value":
+        display_df = display_df.sort_values('Avg_Order_Value', ascending=False)
+    else:
+        display_df['Growth_Score'] = (
+            display_df['Frequency_Score'] + 
+            display_df['Monetary_Score'] - 
+            (5 - display_df['Recency_Score'])
+        )
+        display_df = display_df.sort_values('Growth_Score', ascending=False)
+
+    # KPI Cards
+    st.markdown("---")
+    st.markdown(f"### 📊 Overview{period_label}")
+
+    col_kpi1, col_kpi2, col_kpi3, col_kpi4, col_kpi5 = st.columns(5)
+
+    with col_kpi1:
+        st.metric("Total Companies", f"{len(display_df):,}")
+
+    with col_kpi2:
+        total_revenue = display_df['Total_Revenue'].sum()
+        st.metric("Total Revenue", f"{CURRENCY}{total_revenue:,.0f}")
+
+    with col_kpi3:
+        total_orders = display_df['Total_Orders'].sum()
+        st.metric("Total Orders", f"{total_orders:,}")
+
+    with col_kpi4:
+        avg_order_value = display_df['Avg_Order_Value'].mean()
+        st.metric("Avg Order Value", f"{CURRENCY}{avg_order_value:,.0f}")
+
+    with col_kpi5:
+        avg_recency = display_df['Days_Since_Last_Order'].mean()
+        st.metric("Avg Days Inactive", f"{avg_recency:.0f}")
+
+    # Main content tabs
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "🏆 Company Rankings", 
+        "📈 Visual Analytics", 
+        "🎯 Segment Analysis", 
+        "📋 Detailed Profiles"
+    ])
+
+    with tab1:
+        st.markdown(f"#### Top Companies by {segmentation}")
+
+        top_50 = display_df.head(50).copy()
+
+        display_table = top_50[[
+            'Customer_Segment', 'Total_Revenue', 'Total_Orders', 
+            'Avg_Order_Value', 'Total_Qty', 'Days_Since_Last_Order',
+            'Order_Frequency', 'Unique_Products', 'Primary_State'
+        ]].copy()
+
+        display_table['Total_Revenue'] = inr(display_table['Total_Revenue'])
+        display_table['Avg_Order_Value'] = inr(display_table['Avg_Order_Value'])
+        display_table['Order_Frequency'] = number(display_table['Order_Frequency'], 1, suffix='/month', grouping=False)
+        days = display_table['Days_Since_Last_Order']
+        display_table['Days_Since_Last_Order'] = (
+            np.select([days <= 30, days <= 90], ['', '⚠️ '], '🔴 ') + number(days, grouping=False, suffix=' days')
+        )
+
+        st.dataframe(
+            display_table.style.applymap(highlight_segment, subset=['Customer_Segment']),
+            use_container_width=True,
+            height=600
+        )
+
+        col_exp1, col_exp2 = st.columns([4, 1])
+        with col_exp2:
+            csv = top_50.to_csv().encode('utf-8')
+            st.download_button(
+                "📥 Export",
+                csv,
+                f"company_analysis_{year_option.replace(' ', '_')}.csv",
+                "text/csv"
+            )
+
+    with tab2:
+        col_viz1, col_viz2 = st.columns(2)
+
+        with col_viz1:
+            st.markdown("#### 💰 Revenue vs Orders Scatter")
+
+            fig_scatter = px.scatter(
+                display_df.reset_index().head(100),
+                x='Total_Orders',
+                y='Total_Revenue',
+                size='Total_Qty',
+                color='Customer_Segment',
+                hover_name='Company',
+                hover_data=['Avg_Order_Value', 'Days_Since_Last_Order'],
+                title="Customer Segmentation Map",
+                template='plotly_white',
+                height=500
+            )
+
+            fig_scatter.update_traces(
+                marker=dict(line=dict(width=1, color='DarkSlateGrey')),
+                selector=dict(mode='markers')
+            )
+
+            st.plotly_chart(fig_scatter, use_container_width=True)
+
+        with col_viz2:
+            st.markdown("#### 📊 Customer Segment Distribution")
+
+            segment_counts = display_df['Customer_Segment'].value_counts().reset_index()
+            segment_counts.columns = ['Segment', 'Count']
+
+            fig_pie = chart('company_segment_pie', lambda: px.pie(
+                segment_counts,
+                values='Count',
+                names='Segment',
+                hole=0.4,
+                color_discrete_sequence=px.colors.qualitative.Set3,
+                title="Segment Breakdown"
+            ).update_traces(
+                textposition='outside',
+                textinfo='percent+label',
+                pull=[0.05 if 'Champion' in seg or 'At Risk' in seg else 0 for seg in segment_counts['Segment']]
+            ).update_layout(height=500, template='plotly_white', showlegend=False), segment_counts)
+            st.plotly_chart(fig_pie, use_container_width=True)
+
+        st.markdown("#### 📈 Pareto Analysis (80/20 Rule)")
+
+        pareto_df = display_df.sort_values('Total_Revenue', ascending=False).copy()
+        pareto_df['Cumulative_Revenue'] = pareto_df['Total_Revenue'].cumsum()
+        pareto_df['Cumulative_Percentage'] = (
+            pareto_df['Cumulative_Revenue'] / pareto_df['Total_Revenue'].sum() * 100
+        )
+
+        fig_pareto = go.Figure()
+
+        fig_pareto.add_trace(go.Bar(
+            x=list(range(min(20, len(pareto_df)))),
+            y=pareto_df.head(20)['Total_Revenue'],
+            name='Revenue',
+            marker_color='royalblue',
+            text=compact(pareto_df.head(20)['Total_Revenue'], 'K', 0),
+            textposition='auto'
+        ))
+
+        fig_pareto.add_trace(go.Scatter(
+            x=list(range(min(20, len(pareto_df)))),
+            y=pareto_df.head(20)['Cumulative_Percentage'],
+            name='Cumulative %',
+            yaxis='y2',
+            line=dict(color='red', width=3),
+            marker=dict(size=8)
+        ))
+
+        fig_pareto.add_hline(y=80, line_dash="dash", line_color="green", 
+                            annotation_text="80% Line", yref='y2')
+
+        fig_pareto.update_layout(
+            title="Top 20 Companies - Pareto Analysis",
+            xaxis=dict(
+                tickmode='array',
+                tickvals=list(range(min(20, len(pareto_df)))),
+                ticktext=[c[:10] + "..." if len(c) > 10 else c for c in pareto_df.head(20).index],
+                tickangle=-45
+            ),
+            yaxis=dict(title='Revenue', side='left'),
+            yaxis2=dict(
+                title='Cumulative %',
+                side='right',
+                overlaying='y',
+                range=[0, 100],
+                ticksuffix='%'
+            ),
+            height=450,
+            template='plotly_white',
+            legend=dict(orientation="h", yanchor="bottom", y=1.02)
+        )
+
+        st.plotly_chart(fig_pareto, use_container_width=True)
+
+        top_80 = pareto_df[pareto_df['Cumulative_Percentage'] <= 80]
+        if not top_80.empty:
+            st.success(f"🎯 **80/20 Insight:** Top {len(top_80)} companies ({len(top_80)/len(pareto_df)*100:.1f}%) "
+                      f"generate 80% of total revenue ({CURRENCY}{pareto_df['Total_Revenue'].sum()*0.8:,.0f})")
+
+    with tab3:
+        st.markdown("#### 🎯 Segment Deep Dive")
+
+        segment_analysis = display_df.groupby('Customer_Segment', observed=True).agg({
+            'Total_Revenue': ['sum', 'mean', 'count'],
+            'Total_Orders': ['sum', 'mean'],
+            'Avg_Order_Value': 'mean',
+            'Days_Since_Last_Order': 'mean',
+            'Order_Frequency': 'mean'
+        }).round(2)
+
+        segment_analysis.columns = [
+            'Total_Revenue', 'Avg_Revenue', 'Company_Count',
+            'Total_Orders', 'Avg_Orders_Per_Company',
+            'Avg_Order_Value', 'Avg_Days_Inactive', 'Avg_Frequency_Per_Month'
+        ]
+
+        segment_analysis['Revenue_Share'] = (
+            segment_analysis['Total_Revenue'] / segment_analysis['Total_Revenue'].sum() * 100
+        ).round(1)
+
+        segment_analysis = segment_analysis.sort_values('Total_Revenue', ascending=False)
+
+        display_segment = segment_analysis.copy()
+        display_segment['Total_Revenue'] = inr(display_segment['Total_Revenue'])
+        display_segment['Avg_Revenue'] = inr(display_segment['Avg_Revenue'])
+        display_segment['Avg_Order_Value'] = inr(display_segment['Avg_Order_Value'])
+        display_segment['Revenue_Share'] = percent(display_segment['Revenue_Share'])
+        display_segment['Avg_Frequency_Per_Month'] = number(display_segment['Avg_Frequency_Per_Month'], 1, grouping=False)
+
+        st.dataframe(display_segment, use_container_width=True)
+
+        st.markdown("#### 💡 Strategic Recommendations")
+
+        recommendations = {
+            '💎 Champion': "Reward them. Early adopter of new products. Will promote brand.",
+            '🥇 Loyal Customer': "Upsell higher value products. Ask for reviews/referrals.",
+            '📈 Potential Loyalist': "Offer membership/loyalty program. Keep engaged.",
+            '🆕 New Customer': "Provide onboarding support. Early stage of relationship.",
+            '⚠️ At Risk': "Send personalized reactivation campaigns. Special offers.",
+            '😴 Hibernating': "Offer win-back deals. Survey to understand needs.",
+            '📊 Needs Attention': "Don't lose them. Monitor for at-risk signals."
+        }
+
+        for segment, rec in recommendations.items():
+            if segment in display_df['Customer_Segment'].values:
+                with st.container():
+                    col_seg, col_rec = st.columns([1, 3])
+                    with col_seg:
+                        st.markdown(f"**{segment}**")
+                    with col_rec:
+                        st.info(rec)
+
+    with tab4:
+        _company_profile(display_df, analysis_df, chart)
+
+
+def render(ctx):
+    df, order_index, order_queries, memo, chart = ctx.df, ctx.order_index, ctx.order_queries, ctx.memo, ctx.chart
+    st.markdown("## 🏢 Customer/Company Deep Dive")
+    st.markdown("---")
+    
+    # Get available years
+    available_years = sorted(df['Year'].unique())
+    
+    # Header filters
+    col_year, col_segment, col_metric = st.columns([1, 1, 1])
+    
+    with col_year:
+        year_option = st.selectbox(
+            "📅 Select Period:",
+            ["All Years"] + [str(y) for y in available_years],
+            help="Analyze companies across specific time period"
+        )
+    
+    # Filter data based on year (metrics below push the filter down to the query backend)
+    if year_option != "All Years":
+        selected_year = int(year_option)
+        period_label = f" ({selected_year})"
+    else:
+        selected_year = None
+        period_label = " (All Time)"
+    analysis_df = order_index.select(df, Year=selected_year)
+    
+    with col_segment:
+        segmentation = st.selectbox(
+            "🎯 Segment By:",
+            ["Revenue", "Order Frequency", "Order Value", "Growth Potential"],
+            help="Choose segmentation strategy for customer analysis"
+        )
+    
+    with col_metric:
+        view_type = st.selectbox(
+            "👁️ View:",
+            ["Top Performers", "At-Risk Customers", "New Opportunities", "Complete List"],
+            help="Filter companies by performance category"
+        )
+    
+    st.markdown("---")
+    
+    # Calculate comprehensive company metrics
+    company_metrics = memo('company_metrics', lambda: order_queries.aggregate('Company', {
+        'Total_Revenue': ('Total_Amount', 'sum'),
+        'Total_Orders': ('Total_Amount', 'count'),
+        'Avg_Order_Value': ('Total_Amount', 'mean'),
+        'Order_StdDev': ('Total_Amount', 'std'),
+        'Total_Qty': ('Qty', 'sum'),
+        'Avg_Qty_Per_Order': ('Qty', 'mean'),
+        'Unique_Orders': ('Inquiry_No', 'nunique'),
+        'First_Order': ('Date', 'min'),
+        'Last_Order': ('Date', 'max'),
+        'Unique_Products': ('Product', 'nunique'),
+        'Primary_State': ('State', 'mode'),
+    }, Year=selected_year).round(2), Year=year_option)
+    
+    # Calculate additional metrics
+    company_metrics['Days_Since_Last_Order'] = (
+        pd.Timestamp.now() - pd.to_datetime(company_metrics['Last_Order'])
+    ).dt.days
+    
+    company_metrics['Customer_Lifespan_Days'] = (
+        pd.to_datetime(company_metrics['Last_Order']) - 
+        pd.to_datetime(company_metrics['First_Order'])
+    ).dt.days + 1
+    
+    company_metrics['Order_Frequency'] = (
+        company_metrics['Total_Orders'] / company_metrics['Customer_Lifespan_Days'] * 30
+    ).fillna(0)
+    
+    company_metrics['Revenue_Per_Day'] = (
+        company_metrics['Total_Revenue'] / company_metrics['Customer_Lifespan_Days']
+    ).fillna(0)
+    
+    # Customer Segmentation (RFM-style analysis)
+    company_metrics['Recency_Score'] = pd.qcut(
+        company_metrics['Days_Since_Last_Order'], 
+        q=5, 
+        labels=[5,4,3,2,1],
+        duplicates='drop'
+    ).astype(int)
+    
+    company_metrics['Frequency_Score'] = pd.qcut(
+        company_metrics['Total_Orders'].rank(method='first'), 
+        q=5, 
+        labels=[1,2,3,4,5],
+        duplicates='drop'
+    ).astype(int)
+    
+    company_metrics['Monetary_Score'] = pd.qcut(
+        company_metrics['Total_Revenue'].rank(method='first'), 
+        q=5, 
+        labels=[1,2,3,4,5],
+        duplicates='drop'
+    ).astype(int)
+    
+    company_metrics['RFM_Score'] = (
+        company_metrics['Recency_Score'].astype(str) + 
+        company_metrics['Frequency_Score'].astype(str) + 
+        company_metrics['Monetary_Score'].astype(str)
+    )
+    
+    company_metrics['Customer_Segment'] = company_metrics.apply(classify_customer, axis=1)
+    
+    # Filter based on view type
+    if view_type == "Top Performers":
+        filtered_metrics = company_metrics[company_metrics['Monetary_Score'] >= 4].copy()
+    elif view_type == "At-Risk Customers":
+        filtered_metrics = company_metrics[
+            (company_metrics['Customer_Segment'].str.contains('At Risk|Hibernating')) |
+            (company_metrics['Days_Since_Last_Order'] > 90)
+        ].copy()
+    elif view_type == "New Opportunities":
+        filtered_metrics = company_metrics[
+            (company_metrics['Customer_Segment'].str.contains('New|Potential')) |
+            (company_metrics['Total_Orders'] <= 3) & (company_metrics['Total_Revenue'] > company_metrics['Total_Revenue'].median())
+        ].copy()
+    else:
+        filtered_metrics = company_metrics.copy()
+    
+    _company_panel(company_metrics, filtered_metrics, segmentation, period_label, year_option, analysis_df,
+                   chart)
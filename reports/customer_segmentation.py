@@ -0,0 +1,86 @@
+"""Customer Segmentation report"""
+import pandas as pd
+import streamlit as st
+from config import CURRENCY
+from formatting import inr_column, percent_column
+
+
+# Classify
+def classify_abc(x):
+    if x <= 80:
+        return 'A (Top 80%)'
+    elif x <= 95:
+        return 'B (Next 15%)'
+    else:
+        return 'C (Bottom 5%)'
+
+
+def render(ctx):
+    order_queries, memo = ctx.order_queries, ctx.memo
+    st.markdown("## 🏢 Customer Segmentation (ABC Analysis)")
+    
+    # ABC Analysis
+    company_revenue = memo('company_revenue', lambda: order_queries.aggregate(
+        'Company', {'Total_Amount': ('Total_Amount', 'sum')})['Total_Amount'].sort_values(ascending=False))
+    total_revenue = company_revenue.sum()
+    
+    company_revenue_pct = company_revenue / total_revenue * 100
+    cumulative_pct = company_revenue_pct.cumsum()
+    
+    abc_classification = cumulative_pct.apply(classify_abc)
+    
+    abc_summary = pd.DataFrame({
+        'Revenue': company_revenue,
+        'Cumulative_%': cumulative_pct,
+        'Segment': abc_classification
+    })
+    
+    # Select Segment to View (NEW FILTER)
+    segment_filter = st.selectbox("📊 Select Segment to View:", ["All Segments", "A (Top 80%)", "B (Next 15%)", "C (Bottom 5%)"])
+    
+    # Filter and display companies
+    if segment_filter != "All Segments":
+        filtered_segment = abc_summary[abc_summary['Segment'] == segment_filter]
+        st.markdown(f"### 📋 Companies in {segment_filter}")
+        st.dataframe(filtered_segment, column_config={
+            'Revenue': inr_column(),
+            'Cumulative_%': percent_column(decimals=2)
+        }, use_container_width=True, height=400)
+        st.info(f"Total {len(filtered_segment)} companies in {segment_filter}")
+    else:
+        # Show all segments summary
+        col1, col2, col3 = st.columns(3)
+        segments = ['A (Top 80%)', 'B (Next 15%)', 'C (Bottom 5%)']
+        colors = ['#2ecc71', '#f39c12', '#e74c3c']
+        
+        for col, segment, color in zip([col1, col2, col3], segments, colors):
+            with col:
+                count = (abc_classification == segment).sum()
+                revenue = company_revenue[abc_classification == segment].sum()
+                st.markdown(f"<div style='background-color:{color}; padding:20px; border-radius:10px; color:white; text-align:center;'>"
+                           f"<h3>{segment}</h3>"
+                           f"<h2>{count}</h2><p>Companies</p>"
+                           f"<h4>{CURRENCY}{revenue:,.0f}</h4></div>", 
+                           unsafe_allow_html=True)
+        
+        # Show lists for each segment
+        st.markdown("---")
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("### 🟢 A Segment Companies (Top)")
+            a_companies = abc_summary[abc_summary['Segment'] == 'A (Top 80%)'].head(10)
+            for idx, (company, row) in enumerate(a_companies.iterrows(), 1):
+                st.write(f"{idx}. **{company}** - {CURRENCY}{row['Revenue']:,.0f}")
+        
+        with col2:
+            st.markdown("### 🟡 B Segment Companies")
+            b_companies = abc_summary[abc_summary['Segment'] == 'B (Next 15%)'].head(10)
+            for idx, (company, row) in enumerate(b_companies.iterrows(), 1):
+                st.write(f"{idx}. **{company}** - {CURRENCY}{row['Revenue']:,.0f}")
+        
+        with col3:
+            st.markdown("### 🔴 C Segment Companies")
+            c_companies = abc_summary[abc_summary['Segment'] == 'C (Bottom 5%)'].head(10)
+            for idx, (company, row) in enumerate(c_companies.iterrows(), 1):
+                st.write(f"{idx}. **{company}** - {CURRENCY}{row['Revenue']:,.0f}")
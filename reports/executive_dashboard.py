@@ -0,0 +1,86 @@
+"""Executive Dashboard report"""
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from config import CURRENCY
+from formatting import compact
+
+
+def render(ctx):
+    order_cube, chart, years = ctx.order_cube, ctx.chart, ctx.years
+    st.markdown("## 🎯 Executive Overview")
+    
+    # Top filters
+    with st.container():
+        col_f1, col_f2, col_f3 = st.columns(3)
+        with col_f1:
+            selected_year = st.selectbox("📅 Select Year:", ["All"] + [str(y) for y in years])
+        with col_f2:
+            selected_state = st.selectbox("🗺️ Select State:", ["All"] + order_cube.values('State'))
+        with col_f3:
+            selected_product = st.selectbox("🔧 Select Product:", ["All"] + order_cube.values('Product'))
+    
+    # Filters, answered from the pre-aggregated cube
+    filters = dict(
+        Year=int(selected_year) if selected_year != "All" else None,
+        State=selected_state if selected_state != "All" else None,
+        Product=selected_product if selected_product != "All" else None,
+    )
+    totals = order_cube.totals(**filters)
+    product_revenue = order_cube.rollup('Product', **filters)['Revenue']
+    
+    # KPI Cards with gradient
+    cols = st.columns(4)
+    metrics = [
+        ("💰 Total Revenue", f"{CURRENCY}{totals['Revenue']:,.0f}", f"{int(totals['Transactions'])} Orders"),
+        ("📦 Total Quantity", f"{totals['Qty']:,.0f}", "Units Sold"),
+        ("📊 Avg Order Value", f"{CURRENCY}{totals['AvgOrder']:,.0f}", "Per Order"),
+        ("🏆 Top Product", product_revenue.idxmax() if not product_revenue.empty else "N/A", "Best Seller")
+    ]
+    
+    for col, (label, value, delta) in zip(cols, metrics):
+        with col:
+            st.metric(label=label, value=value, delta=delta)
+    
+    st.markdown("---")
+    
+    # Charts Row 1
+    c1, c2 = st.columns(2)
+    with c1:
+        st.markdown("### 💵 Revenue by State (Top 8)")
+        state_data = order_cube.rollup('State', **filters)['Revenue'].rename('Total_Amount').nlargest(8).reset_index()
+        fig = chart('executive_state_bar', lambda: px.bar(
+            state_data, x='State', y='Total_Amount', color='Total_Amount', color_continuous_scale='Viridis',
+            text=compact(state_data['Total_Amount']),
+        ).update_layout(xaxis_tickangle=-45), state_data)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with c2:
+        st.markdown("### 🔥 Top 5 Products by Revenue")
+        prod_data = product_revenue.rename('Total_Amount').nlargest(5).reset_index()
+        fig = chart('executive_product_pie', lambda: px.pie(
+            prod_data, values='Total_Amount', names='Product', hole=0.5,
+            color_discrete_sequence=px.colors.qualitative.Set3,
+        ).update_traces(textposition='inside', textinfo='percent+label'), prod_data)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Charts Row 2
+    c1, c2 = st.columns(2)
+    with c1:
+        st.markdown("### 📈 Monthly Revenue Trend")
+        monthly = order_cube.rollup('Year_Month', **filters)['Revenue']
+        monthly.index = monthly.index.to_timestamp()
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=monthly.index, y=monthly.values, fill='tozeroy', 
+                                line=dict(color='#1f77b4', width=3), name='Revenue'))
+        fig.update_layout(height=350)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with c2:
+        st.markdown("### 🏢 Top 8 Companies")
+        comp_data = order_cube.rollup('Company', **filters)['Revenue'].rename('Total_Amount').nlargest(8).reset_index()
+        fig = chart('executive_company_bar', lambda: px.bar(
+            comp_data, y='Company', x='Total_Amount', orientation='h', color='Total_Amount',
+            color_continuous_scale='Blues',
+        ).update_layout(yaxis=dict(autorange="reversed")), comp_data)
+        st.plotly_chart(fig, use_container_width=True)
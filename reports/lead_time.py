@@ -0,0 +1,52 @@
+"""Lead Time Analysis report"""
+import streamlit as st
+
+
+def render(ctx):
+    df = ctx.df
+    st.markdown("## ⚡ Production & Delivery Lead Time Analysis")
+    
+    # Filter valid lead times (Lead_Time_Days is computed by the loader)
+    valid_lead = df[(df['Lead_Time_Days'] > 0) & (df['Lead_Time_Days'] < 365)]
+    
+    if not valid_lead.empty:
+        # Overall Statistics (NO CHARTS)
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("⏱️ Average Lead Time", f"{valid_lead['Lead_Time_Days'].mean():.1f} days")
+        with col2:
+            st.metric("⚡ Fastest Delivery", f"{valid_lead['Lead_Time_Days'].min()} days")
+        with col3:
+            st.metric("🐌 Slowest Delivery", f"{valid_lead['Lead_Time_Days'].max()} days")
+        with col4:
+            st.metric("📊 Median Lead Time", f"{valid_lead['Lead_Time_Days'].median():.1f} days")
+        
+        st.markdown("---")
+        
+        # Lead Time by Product (TABLE ONLY - NO GRAPHS)
+        st.markdown("### ⏱️ Lead Time by Product (Numbers Only)")
+        lead_by_product = valid_lead.groupby('Product', observed=True)['Lead_Time_Days'].agg(['mean', 'min', 'max', 'count']).round(1)
+        lead_by_product.columns = ['Avg_Days', 'Min_Days', 'Max_Days', 'Order_Count']
+        lead_by_product = lead_by_product.sort_values('Avg_Days', ascending=False)
+        
+        # Add interpretation
+        lead_by_product['Interpretation'] = lead_by_product['Avg_Days'].apply(
+            lambda x: '🔴 Long Time' if x > 30 else ('🟡 Medium' if x > 15 else '🟢 Fast')
+        )
+        
+        st.dataframe(lead_by_product, use_container_width=True)
+        
+        # Products that take MORE TIME (Text Analysis)
+        st.markdown("---")
+        st.markdown("### 🐌 Products with Longest Lead Time")
+        slow_products = lead_by_product.head(5)
+        for idx, (product, row) in enumerate(slow_products.iterrows(), 1):
+            st.write(f"{idx}. **{product}** - Avg: **{row['Avg_Days']:.1f} days** "
+                    f"(Range: {row['Min_Days']:.0f} to {row['Max_Days']:.0f} days)")
+        
+        st.markdown("### ⚡ Products with Fastest Delivery")
+        fast_products = lead_by_product.tail(5)
+        for idx, (product, row) in enumerate(fast_products.iterrows(), 1):
+            st.write(f"{idx}. **{product}** - Avg: **{row['Avg_Days']:.1f} days**")
+    else:
+        st.warning("No valid lead time data available (check EDD dates format in your sheet)")
@@ -0,0 +1,456 @@
+"""Map Analytics report"""
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from config import CURRENCY
+from formatting import inr, percent
+
+
+# ── India GeoJSON (cached) ────────────────────────────────────────────────
+@st.cache_data(ttl=86400, show_spinner=False)
+def _load_india_geojson():
+    """Load India state boundaries from GitHub mirror."""
+    try:
+        import requests as _req
+        url = (
+            "https://raw.githubusercontent.com/geohacker/india/"
+            "master/state/india_telengana.geojson"
+        )
+        r = _req.get(url, timeout=12)
+        r.raise_for_status()
+        return r.json()
+    except Exception:
+        return None
+
+
+def _highlight_top3(row):
+    if row["Rank"] == 1:
+        return ["background: linear-gradient(90deg,#FFD700,#FFA500)"] * len(row)
+    elif row["Rank"] == 2:
+        return ["background: linear-gradient(90deg,#C0C0C0,#E8E8E8)"] * len(row)
+    elif row["Rank"] == 3:
+        return ["background: linear-gradient(90deg,#CD7F32,#D4AF37)"] * len(row)
+    return [""] * len(row)
+
+
+@st.fragment
+def _state_deep_dive(state_metrics, order_cube, order_queries, memo, year_select):
+    """State Deep Dive panel, rerun by itself when another state is picked"""
+    selected_state_map = st.selectbox(
+        "Select State for Detailed Analysis:",
+        options=state_metrics['State'].tolist(),
+        index=0,
+        key="map_deep_dive_state",
+    )
+
+    if selected_state_map:
+        filters = dict(Year=int(year_select) if year_select != "All Years" else None, State=selected_state_map)
+
+        col_detail1, col_detail2 = st.columns([2, 1])
+
+        with col_detail1:
+            st.markdown(f"#### 📊 {selected_state_map} — Performance Metrics")
+
+            monthly_state = order_cube.rollup('Year_Month', **filters)[['Revenue']].reset_index()
+            monthly_state['Date'] = monthly_state.pop('Year_Month').dt.to_timestamp()
+
+            fig_state_trend = go.Figure()
+            fig_state_trend.add_trace(go.Scatter(
+                x=monthly_state['Date'],
+                y=monthly_state['Revenue'],
+                mode='lines+markers',
+                name='Revenue',
+                line=dict(width=3, color='#11998e'),
+                fill='tozeroy',
+                fillcolor='rgba(17,153,142,0.2)',
+            ))
+            fig_state_trend.update_layout(
+                title=f"Monthly Revenue Trend — {selected_state_map}",
+                xaxis_title="Month",
+                yaxis_title=f"Revenue ({CURRENCY})",
+                height=350,
+                template='plotly_white',
+            )
+            st.plotly_chart(fig_state_trend, use_container_width=True)
+
+        with col_detail2:
+            st.markdown("#### 🏆 Top Customers")
+            # Exact order counts per customer from the query backend
+            top_cust_map = memo('map_state_customers', lambda: order_queries.aggregate('Company', {
+                'Revenue': ('Total_Amount', 'sum'), 'Orders': ('Inquiry_No', 'nunique'),
+            }, **filters), **filters).sort_values('Revenue', ascending=False).head(5)
+            top_cust_map['Revenue'] = inr(top_cust_map['Revenue'])
+            st.dataframe(top_cust_map, use_container_width=True)
+
+            st.markdown("#### 🏷️ Top Products")
+            top_prod_map = (
+                order_cube.rollup('Product', **filters)['Revenue']
+                .rename('Total_Amount')
+                .sort_values(ascending=False)
+                .head(5)
+            )
+            st.bar_chart(top_prod_map)
+
+
+def render(ctx):
+    df, order_index, order_cube, chart = ctx.df, ctx.order_index, ctx.order_cube, ctx.chart
+    order_queries, memo = ctx.order_queries, ctx.memo
+
+    # ── Styling (same pattern as your other pages) ───────────────────────────
+    st.markdown("""
+        <style>
+        .map-header {
+            background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
+            padding: 30px;
+            border-radius: 20px;
+            color: white;
+            text-align: center;
+            margin-bottom: 25px;
+            box-shadow: 0 15px 35px rgba(17,153,142,0.3);
+        }
+        .map-stats {
+            background: white;
+            padding: 20px;
+            border-radius: 15px;
+            box-shadow: 0 10px 25px rgba(0,0,0,0.1);
+            border-left: 5px solid #11998e;
+        }
+        .state-card {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 15px;
+            border-radius: 12px;
+            margin: 10px 0;
+            box-shadow: 0 8px 20px rgba(102,126,234,0.3);
+        }
+        </style>
+        <div class="map-header">
+            <h1 style="margin:0; font-size:2.5rem;">🗺️ Geographic Intelligence</h1>
+            <p style="margin:10px 0 0 0; font-size:1.1rem; opacity:0.9;">
+                State-wise Order Distribution & Market Analytics
+            </p>
+        </div>
+    """, unsafe_allow_html=True)
+
+    available_years = sorted(ctx.years)
+
+    # ── Controls ─────────────────────────────────────────────────────────────
+    st.markdown("### 🎛️ Map Controls")
+    col_ctrl1, col_ctrl2, col_ctrl3, col_ctrl4 = st.columns([1, 1, 1, 1])
+
+    with col_ctrl1:
+        year_select = st.selectbox(
+            "📅 Select Year:",
+            ["All Years"] + [str(y) for y in available_years],
+            help="Filter orders by year",
+            key="map_year_select"
+        )
+    with col_ctrl2:
+        metric_type = st.selectbox(
+            "📊 Metric:",
+            ["Revenue", "Order Count", "Quantity", "Average Order Value"],
+            help="Choose metric to visualise (order counts per state are estimates, within ~2%)",
+            key="map_metric_type"
+        )
+    with col_ctrl3:
+        map_style = st.selectbox(
+            "🗺️ Map Style:",
+            ["Choropleth (India Map)", "Bubble Chart", "State Rankings Table"],
+            help="Visualisation style",
+            key="map_style"
+        )
+    with col_ctrl4:
+        top_n_states = st.slider(
+            "🏆 Top States:", 5, 30, 15,
+            help="Number of top states to highlight",
+            key="map_top_n"
+        )
+
+    # ── Filter ────────────────────────────────────────────────────────────────
+    if year_select != "All Years":
+        map_df = order_index.select(df, Year=int(year_select))
+        period_label = f"FY {year_select}"
+    else:
+        map_df = df
+        period_label = "All Time"
+
+    # ── Aggregate per state (cube roll-up, Orders is a distinct-count sketch estimate) ──
+    state_details = order_cube.rollup(
+        'State', distinct=['Company', 'Product'], orders=True,
+        Year=int(year_select) if year_select != "All Years" else None,
+    ).rename(columns={'Qty': 'TotalQty', 'Company': 'Customers', 'Product': 'Products'})
+    if state_details.empty:
+        st.error("⚠️ No data available for selected filters")
+        st.stop()
+    state_details = state_details[
+        ['Revenue', 'AvgOrder', 'Transactions', 'TotalQty', 'Orders', 'Customers', 'Products']
+    ].round(2)
+
+    value_column = {"Revenue": 'Revenue', "Order Count": 'Orders',
+                    "Quantity": 'TotalQty', "Average Order Value": 'AvgOrder'}[metric_type]
+    state_metrics = state_details[value_column].rename('Value').reset_index()
+    state_metrics = state_metrics.merge(state_details.reset_index(), on='State', how='left')
+    state_metrics = state_metrics.sort_values('Value', ascending=False).reset_index(drop=True)
+
+    total_value = state_metrics['Value'].sum()
+    state_metrics['Percentage'] = (state_metrics['Value'] / total_value * 100).round(2)
+    state_metrics['CumulativePct'] = state_metrics['Percentage'].cumsum().round(2)
+
+    # ── MAP VISUALISATION ─────────────────────────────────────────────────────
+    plot_data = state_metrics.head(top_n_states).copy()
+
+    if map_style == "Choropleth (India Map)":
+        st.markdown(f"### 🗺️ India Heat Map — {metric_type} ({period_label})")
+
+        geojson = _load_india_geojson()
+
+        if geojson is not None:
+            # ── Find the property key that holds the state name ───────────────
+            name_key = "NAME_1"   # default for geohacker dataset
+            if geojson.get("features"):
+                props = geojson["features"][0].get("properties", {})
+                for k in ("NAME_1", "ST_NM", "name", "NAME"):
+                    if k in props:
+                        name_key = k
+                        break
+
+            # geojson is the same cached file every run, name_key stands in for it in the key
+            fig_map = chart('map_state_choropleth', lambda: px.choropleth(
+                plot_data,
+                geojson=geojson,
+                locations="State",
+                featureidkey=f"properties.{name_key}",
+                color="Value",
+                hover_name="State",
+                hover_data={
+                    "State":      False,
+                    "Value":      True,
+                    "Percentage": True,
+                    "Orders":     True,
+                    "Customers":  True,
+                },
+                color_continuous_scale=[
+                    [0.0, "#E8F5E9"],
+                    [0.2, "#81C784"],
+                    [0.4, "#4CAF50"],
+                    [0.6, "#2E7D32"],
+                    [1.0, "#1B5E20"],
+                ],
+                labels={"Value": metric_type, "Percentage": "Share (%)"},
+                title=f"Top {top_n_states} States — {metric_type}",
+            ).update_geos(fitbounds="locations", visible=False).update_layout(
+                height=600,
+                margin=dict(l=0, r=0, t=40, b=0),
+                coloraxis_colorbar=dict(title=metric_type),
+                template="plotly_white",
+            ), plot_data, name_key=name_key, metric_type=metric_type, top_n_states=top_n_states)
+            st.plotly_chart(fig_map, use_container_width=True)
+
+        else:
+            # ── Fallback: treemap (works offline, no external deps) ───────────
+            st.info("ℹ️ Map tiles unavailable (network issue). Showing treemap instead.")
+            fig_tree = px.treemap(
+                plot_data,
+                path=[px.Constant("India"), "State"],
+                values="Value",
+                color="Value",
+                color_continuous_scale="RdYlGn",
+                title=f"State-wise {metric_type} Distribution ({period_label})",
+            )
+            fig_tree.update_traces(
+                texttemplate="<b>%{label}</b><br>%{value:,.0f}",
+            )
+            fig_tree.update_layout(height=600)
+            st.plotly_chart(fig_tree, use_container_width=True)
+
+    elif map_style == "Bubble Chart":
+        st.markdown(f"### 🫧 Bubble Chart — Market Concentration ({period_label})")
+
+        fig_bubble = px.scatter(
+            plot_data,
+            x="Customers",
+            y="Value",
+            size="Orders",
+            color="Revenue",
+            hover_name="State",
+            text="State",
+            size_max=60,
+            title=f"State Analysis: {metric_type} vs Customer Base",
+            labels={
+                "Customers": "Number of Customers",
+                "Value":     f"{metric_type}",
+                "Orders":    "Total Orders (est.)",
+                "Revenue":   f"Total Revenue ({CURRENCY})",
+            },
+            color_continuous_scale="Plasma",
+        )
+        fig_bubble.update_traces(
+            textposition="top center",
+            textfont=dict(size=10, color="black"),
+            marker=dict(line=dict(width=2, color="DarkSlateGrey")),
+        )
+        fig_bubble.update_layout(height=550, template="plotly_white")
+        st.plotly_chart(fig_bubble, use_container_width=True)
+
+    else:  # State Rankings Table
+        st.markdown(f"### 📋 State Rankings ({period_label})")
+
+        disp = plot_data.copy()
+        disp.insert(0, "Rank", range(1, len(disp) + 1))
+        disp["Revenue"]     = inr(disp["Revenue"])
+        disp["AvgOrder"]    = inr(disp["AvgOrder"])
+        disp["Percentage"]  = percent(disp["Percentage"], 2)
+        disp["CumulativePct"] = percent(disp["CumulativePct"], 2)
+        disp = disp[["Rank", "State", "Value", "Percentage", "CumulativePct",
+                     "Revenue", "Orders", "Customers", "Products", "AvgOrder"]]
+        disp = disp.rename(columns={"Orders": "Orders (est.)"})
+
+        st.dataframe(
+            disp.style.apply(_highlight_top3, axis=1),
+            use_container_width=True,
+            height=500,
+        )
+
+    # ── KPI Cards ─────────────────────────────────────────────────────────────
+    st.markdown("---")
+    st.markdown(f"### 📊 Geographic Intelligence ({period_label})")
+
+    col_geo1, col_geo2, col_geo3 = st.columns(3)
+    top_state = state_metrics.iloc[0]
+    # One state: count its orders exactly, the roll-up's Orders is a sketch estimate
+    top_year = int(year_select) if year_select != "All Years" else None
+    top_orders = memo('distinct_orders', lambda: order_queries.distinct('Inquiry_No', State=top_state['State'],
+                                                                        Year=top_year),
+                      State=top_state['State'], Year=top_year)
+
+    with col_geo1:
+        val_prefix = CURRENCY if metric_type in ("Revenue", "Average Order Value") else ""
+        st.markdown(f"""
+            <div class="state-card">
+                <h4 style="margin:0;">🏆 #1 State</h4>
+                <h2 style="margin:10px 0; font-size:1.8rem;">{top_state['State']}</h2>
+                <p style="font-size:1.3rem; font-weight:600;">{val_prefix}{top_state['Value']:,.0f}</p>
+                <p>{top_state['Percentage']:.1f}% of total {metric_type.lower()}</p>
+                <hr style="border-color:rgba(255,255,255,0.3); margin:10px 0;">
+                <small>📦 {top_orders:,} orders &nbsp;•&nbsp; 🏢 {int(top_state['Customers'])} customers</small>
+            </div>
+        """, unsafe_allow_html=True)
+
+    with col_geo2:
+        top5_share = state_metrics.head(5)['Percentage'].sum()
+        st.markdown(f"""
+            <div class="map-stats" style="border-left-color:#f093fb;">
+                <h4 style="margin:0; color:#6b7280;">📍 Market Concentration</h4>
+                <h2 style="margin:15px 0; font-size:2rem; color:#f093fb;">{top5_share:.1f}%</h2>
+                <p style="color:#6b7280;">Top 5 states contribution</p>
+                <hr style="margin:15px 0;">
+                <p style="margin:0;"><b>Active Markets:</b> {len(state_metrics)} states</p>
+                <p style="margin:5px 0 0 0;"><b>Total Customers:</b> {int(state_metrics['Customers'].sum())}</p>
+            </div>
+        """, unsafe_allow_html=True)
+
+    with col_geo3:
+        avg_rev = state_metrics['Revenue'].mean()
+        best_aov_state   = state_metrics.loc[state_metrics['AvgOrder'].idxmax(), 'State']
+        most_cust_state  = state_metrics.loc[state_metrics['Customers'].idxmax(), 'State']
+        st.markdown(f"""
+            <div class="map-stats" style="border-left-color:#4facfe;">
+                <h4 style="margin:0; color:#6b7280;">📈 Avg Performance</h4>
+                <h2 style="margin:15px 0; font-size:2rem; color:#4facfe;">{CURRENCY}{avg_rev:,.0f}</h2>
+                <p style="color:#6b7280;">Revenue per state (avg)</p>
+                <hr style="margin:15px 0;">
+                <p style="margin:0;"><b>Best AOV:</b> {best_aov_state}</p>
+                <p style="margin:5px 0 0 0;"><b>Most Customers:</b> {most_cust_state}</p>
+            </div>
+        """, unsafe_allow_html=True)
+
+    # ── Pareto Chart ──────────────────────────────────────────────────────────
+    st.markdown("#### 📈 Pareto Analysis (80/20 Rule)")
+
+    pareto_data = state_metrics.head(15)
+    x_vals = list(range(len(pareto_data)))
+
+    fig_pareto = go.Figure()
+    fig_pareto.add_trace(go.Bar(
+        x=x_vals,
+        y=pareto_data['Value'],
+        name=metric_type,
+        marker_color='royalblue',
+        text=pareto_data['Value'].apply(
+            lambda v: f"{CURRENCY}{v/1e6:.1f}M" if v >= 1e6
+            else (f"{CURRENCY}{v/1e3:.0f}K" if v >= 1e3 else f"{v:.0f}")
+        ),
+        textposition='auto',
+    ))
+    fig_pareto.add_trace(go.Scatter(
+        x=x_vals,
+        y=pareto_data['CumulativePct'],
+        name='Cumulative %',
+        yaxis='y2',
+        line=dict(color='red', width=3),
+        marker=dict(size=8, symbol='diamond'),
+    ))
+    fig_pareto.add_hline(
+        y=80, line_dash="dash", line_color="green",
+        annotation_text="80% Threshold", yref='y2',
+    )
+    fig_pareto.update_layout(
+        title=f"Top 15 States — {metric_type} Contribution",
+        xaxis=dict(
+            tickmode='array',
+            tickvals=x_vals,
+            ticktext=[
+                (s[:12] + "…") if len(s) > 12 else s
+                for s in pareto_data['State']
+            ],
+            tickangle=-30,
+        ),
+        yaxis=dict(
+            title=f"{metric_type} ({CURRENCY if metric_type in ('Revenue','Average Order Value') else ''})",
+            side='left',
+        ),
+        yaxis2=dict(
+            title='Cumulative %', side='right', overlaying='y',
+            range=[0, 100], ticksuffix='%',
+        ),
+        height=450,
+        template='plotly_white',
+        legend=dict(orientation="h", yanchor="bottom", y=1.02),
+    )
+    st.plotly_chart(fig_pareto, use_container_width=True)
+
+    states_80 = state_metrics[state_metrics['CumulativePct'] <= 80]
+    if not states_80.empty:
+        st.success(
+            f"🎯 **Pareto Insight:** Top **{len(states_80)} states** "
+            f"({len(states_80)/len(state_metrics)*100:.1f}% of markets) "
+            f"generate **80%** of total {metric_type.lower()}."
+        )
+
+    # ── State Deep Dive ───────────────────────────────────────────────────────
+    st.markdown("---")
+    st.markdown("### 🔍 State Deep Dive")
+
+    _state_deep_dive(state_metrics, order_cube, order_queries, memo, year_select)
+
+    # ── Export ──────────────────────────────────────────────────────
+    st.markdown("---")
+    st.markdown("### 📥 Export Geographic Data")
+
+    col_exp1, col_exp2 = st.columns(2)
+    with col_exp1:
+        st.download_button(
+            "📊 Export State Metrics (CSV)",
+            state_metrics.to_csv(index=False).encode('utf-8'),
+            f"state_metrics_{period_label.replace(' ', '_')}.csv",
+            mime="text/csv",
+            use_container_width=True,
+        )
+    with col_exp2:
+        st.download_button(
+            "📍 Export All Orders with State (CSV)",
+            map_df.to_csv(index=False).encode('utf-8'),
+            f"orders_by_state_{period_label.replace(' ', '_')}.csv",
+            mime="text/csv",
+            use_container_width=True,
+        )
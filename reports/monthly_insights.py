@@ -0,0 +1,371 @@
+"""Monthly Insights report"""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from config import CURRENCY
+from formatting import compact, inr, number, signed_percent
+
+
+def render(ctx):
+    order_cube, order_rollups, years = ctx.order_cube, ctx.order_rollups, ctx.years
+    st.markdown("## 💰 Monthly Deep Dive & Seasonal Analysis")
+    
+    # Select multiple years for comparison
+    selected_years = st.multiselect(
+        "📅 Select Years to Compare:", 
+        sorted(years), 
+        default=sorted(years)[-2:] if len(years) >= 2 else years,
+        help="Select multiple years to compare month-wise trends"
+    )
+    
+    # State filter
+    state_options = ["All States"] + order_cube.values('State')
+    selected_state_monthly = st.selectbox("🗺️ Filter by State:", state_options)
+    
+    if not selected_years:
+        st.warning("Please select at least one year")
+        st.stop()
+    
+    # Prepare month-wise data (cube roll-up, order lines counted per month)
+    month_order = ['January', 'February', 'March', 'April', 'May', 'June',
+                   'July', 'August', 'September', 'October', 'November', 'December']
+    
+    monthly = order_cube.rollup(
+        ['Year', 'Month'], Year=selected_years,
+        State=selected_state_monthly if selected_state_monthly != "All States" else None,
+    ).reset_index()
+    monthly_data = pd.DataFrame({
+        'Year': monthly['Year'],
+        'Month_Name': [month_order[month - 1] for month in monthly['Month']],
+        'Total_Amount': monthly['Revenue'],
+        'Inquiry_No': monthly['Transactions'],
+        'Qty': monthly['Qty'],
+    })
+    
+    # ==========================================
+    # MONTH-WISE TREND CHARTS
+    # ==========================================
+    st.markdown(f"### 📈 Month-wise Trend Comparison - {selected_state_monthly}")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### 💰 Revenue by Month")
+        
+        fig_revenue = go.Figure()
+        colors = px.colors.qualitative.Set2[:len(selected_years)]
+        
+        for idx, year in enumerate(selected_years):
+            year_data = monthly_data[monthly_data['Year'] == year]
+            if not year_data.empty:
+                # Sort by month order
+                year_data['Month_Num'] = year_data['Month_Name'].apply(lambda x: month_order.index(x) if x in month_order else 0)
+                year_data = year_data.sort_values('Month_Num')
+                
+                fig_revenue.add_trace(go.Scatter(
+                    x=year_data['Month_Name'],
+                    y=year_data['Total_Amount'],
+                    mode='lines+markers+text',
+                    name=str(year),
+                    line=dict(color=colors[idx], width=3),
+                    marker=dict(size=8),
+                    text=compact(year_data['Total_Amount']),
+                    textposition='top center',
+                    textfont=dict(size=9)
+                ))
+        
+        fig_revenue.update_layout(
+            height=450,
+            xaxis_title="Month",
+            yaxis_title=f"Revenue ({CURRENCY})",
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            xaxis=dict(categoryorder='array', categoryarray=month_order),
+            hovermode='x unified',
+            margin=dict(l=50, r=50, t=80, b=50)
+        )
+        st.plotly_chart(fig_revenue, use_container_width=True)
+    
+    with col2:
+        st.markdown("#### 📊 Order Count by Month")
+        
+        fig_orders = go.Figure()
+        
+        for idx, year in enumerate(selected_years):
+            year_data = monthly_data[monthly_data['Year'] == year]
+            if not year_data.empty:
+                year_data['Month_Num'] = year_data['Month_Name'].apply(lambda x: month_order.index(x) if x in month_order else 0)
+                year_data = year_data.sort_values('Month_Num')
+                
+                fig_orders.add_trace(go.Bar(
+                    x=year_data['Month_Name'],
+                    y=year_data['Inquiry_No'],
+                    name=str(year),
+                    marker_color=colors[idx],
+                    text=year_data['Inquiry_No'].astype(int),
+                    textposition='outside'
+                ))
+        
+        fig_orders.update_layout(
+            height=450,
+            xaxis_title="Month",
+            yaxis_title="Number of Orders",
+            barmode='group',
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            xaxis=dict(categoryorder='array', categoryarray=month_order),
+            margin=dict(l=50, r=50, t=80, b=50)
+        )
+        st.plotly_chart(fig_orders, use_container_width=True)
+    
+    # ==========================================
+    # COMPARISON TABLE
+    # ==========================================
+    st.markdown("---")
+    st.markdown("### 📋 Month-wise Comparison Table")
+    
+    # Create pivot table
+    pivot_revenue = monthly_data.pivot(index='Month_Name', columns='Year', values='Total_Amount').fillna(0)
+    pivot_orders = monthly_data.pivot(index='Month_Name', columns='Year', values='Inquiry_No').fillna(0)
+    
+    # Reindex to ensure correct month order
+    pivot_revenue = pivot_revenue.reindex([m for m in month_order if m in pivot_revenue.index])
+    pivot_orders = pivot_orders.reindex([m for m in month_order if m in pivot_orders.index])
+    
+    # Display tabs for Revenue and Orders
+    tab1, tab2 = st.tabs(["💰 Revenue", "📦 Orders"])
+    
+    with tab1:
+        # Format for display
+        display_rev = pivot_revenue.copy()
+        for year in selected_years:
+            if year in display_rev.columns:
+                display_rev[year] = inr(display_rev[year].where(display_rev[year] > 0))
+        
+        # Add YoY Growth column if 2+ years selected
+        if len(selected_years) == 2:
+            y1, y2 = sorted(selected_years)
+            if y1 in pivot_revenue.columns and y2 in pivot_revenue.columns:
+                growth = ((pivot_revenue[y2] - pivot_revenue[y1]) / pivot_revenue[y1] * 100).round(1)
+                display_rev['Growth %'] = signed_percent(growth.where(growth != 0))
+        
+        st.table(display_rev)
+        
+        # Total row
+        totals = pivot_revenue.sum()
+        st.markdown("**Total:**")
+        cols = st.columns(len(selected_years) + (1 if len(selected_years) == 2 else 0))
+        for idx, year in enumerate(selected_years):
+            with cols[idx]:
+                st.metric(f"{year}", f"{CURRENCY}{totals[year]:,.0f}")
+
+    # ==========================================
+    # YEAR-WISE SUMMARY SECTION
+    # ==========================================
+    st.markdown("---")
+    st.markdown("### 🗓️ Year-wise Performance Summary")
+    
+    # Calculate year-wise totals
+    # Per-year totals, AOV and YoY growth between the selected years (from the period rollups)
+    yearly_summary = order_rollups.year_summary(
+        selected_years, None if selected_state_monthly == "All States" else selected_state_monthly)
+    
+    # Year-wise KPI Cards
+    st.markdown("#### 📊 Key Metrics by Year")
+    year_cols = st.columns(len(selected_years))
+    
+    for idx, row in yearly_summary.iterrows():
+        with year_cols[idx]:
+            st.markdown(f"**{int(row['Year'])}**")
+            st.metric(
+                label="Total Revenue",
+                value=f"{CURRENCY}{row['Total_Amount']:,.0f}",
+                delta=None
+            )
+            st.metric(
+                label="Total Orders",
+                value=f"{int(row['Inquiry_No'])}",
+                delta=None
+            )
+            st.metric(
+                label="Avg Order Value",
+                value=f"{CURRENCY}{row['Avg_Order_Value']:,.0f}",
+                delta=None
+            )
+    
+    # Year-over-Year Growth Calculation
+    if len(yearly_summary) > 1:
+        st.markdown("#### 📈 Year-over-Year Growth")
+        
+        yoy_data = yearly_summary
+        
+        # Display YoY metrics
+        yoy_cols = st.columns(3)
+        
+        # Get the latest comparison (last year vs previous)
+        latest_yoy = yoy_data.iloc[-1]
+        prev_year = yoy_data.iloc[-2]['Year']
+        curr_year = latest_yoy['Year']
+        
+        with yoy_cols[0]:
+            rev_growth = latest_yoy['Revenue_Growth']
+            st.metric(
+                label=f"Revenue Growth ({int(prev_year)} → {int(curr_year)})",
+                value=f"{rev_growth:+.1f}%",
+                delta=f"{CURRENCY}{latest_yoy['Total_Amount'] - yoy_data.iloc[-2]['Total_Amount']:,.0f}",
+                delta_color="normal" if rev_growth > 0 else "inverse"
+            )
+        
+        with yoy_cols[1]:
+            ord_growth = latest_yoy['Orders_Growth']
+            st.metric(
+                label=f"Orders Growth ({int(prev_year)} → {int(curr_year)})",
+                value=f"{ord_growth:+.1f}%",
+                delta=f"{int(latest_yoy['Inquiry_No'] - yoy_data.iloc[-2]['Inquiry_No'])} orders",
+                delta_color="normal" if ord_growth > 0 else "inverse"
+            )
+        
+        with yoy_cols[2]:
+            aov_growth = latest_yoy['AOV_Growth']
+            st.metric(
+                label=f"AOV Growth ({int(prev_year)} → {int(curr_year)})",
+                value=f"{aov_growth:+.1f}%",
+                delta=f"{CURRENCY}{latest_yoy['Avg_Order_Value'] - yoy_data.iloc[-2]['Avg_Order_Value']:,.0f}",
+                delta_color="normal" if aov_growth > 0 else "inverse"
+            )
+    
+    # ==========================================
+    # YEAR-WISE COMPARISON TABLE
+    # ==========================================
+    st.markdown("#### 📋 Year-wise Detailed Comparison")
+    
+    # Prepare display table
+    display_yearly = yearly_summary[['Year', 'Total_Amount', 'Inquiry_No', 'Qty', 'Avg_Order_Value']].copy()
+    display_yearly.columns = ['Year', 'Total Revenue', 'Total Orders', 'Total Qty', 'Avg Order Value']
+    
+    # Format for display
+    for col in ['Total Revenue', 'Avg Order Value']:
+        display_yearly[col] = inr(display_yearly[col])
+    display_yearly['Total Orders'] = number(display_yearly['Total Orders'], grouping=False)
+    display_yearly['Total Qty'] = number(display_yearly['Total Qty'], grouping=False)
+    
+    # Add YoY Growth columns if multiple years
+    if len(yearly_summary) > 1:
+        for i in range(1, len(yearly_summary)):
+            prev_rev = yearly_summary.iloc[i-1]['Total_Amount']
+            curr_rev = yearly_summary.iloc[i]['Total_Amount']
+            growth = ((curr_rev - prev_rev) / prev_rev * 100)
+            display_yearly.loc[i, 'YoY Growth'] = f"{growth:+.1f}%"
+    
+    st.table(display_yearly.set_index('Year').transpose())
+    
+    # ==========================================
+    # YEAR-WISE VISUAL TRENDS
+    # ==========================================
+    st.markdown("#### 📊 Year-wise Trend Visualization")
+    
+    col_y1, col_y2 = st.columns(2)
+    
+    with col_y1:
+        # Year-wise Revenue Bar Chart
+        fig_year_rev = go.Figure()
+        
+        colors_years = px.colors.qualitative.Bold[:len(yearly_summary)]
+        
+        fig_year_rev.add_trace(go.Bar(
+            x=yearly_summary['Year'].astype(str),
+            y=yearly_summary['Total_Amount'],
+            marker_color=colors_years,
+            text=compact(yearly_summary['Total_Amount']),
+            textposition='outside'
+        ))
+        
+        # Add trend line if 2+ years
+        if len(yearly_summary) > 1:
+            fig_year_rev.add_trace(go.Scatter(
+                x=yearly_summary['Year'].astype(str),
+                y=yearly_summary['Total_Amount'],
+                mode='lines+markers',
+                line=dict(color='red', width=2, dash='dash'),
+                marker=dict(size=10),
+                name='Trend'
+            ))
+        
+        fig_year_rev.update_layout(
+            title="Annual Revenue Trend",
+            xaxis_title="Year",
+            yaxis_title=f"Revenue ({CURRENCY})",
+            height=400,
+            showlegend=False,
+            margin=dict(l=50, r=50, t=50, b=50)
+        )
+        st.plotly_chart(fig_year_rev, use_container_width=True)
+    
+    with col_y2:
+        # Year-wise Orders & AOV Combo Chart
+        fig_year_combo = go.Figure()
+        
+        # Bar chart for Orders
+        fig_year_combo.add_trace(go.Bar(
+            x=yearly_summary['Year'].astype(str),
+            y=yearly_summary['Inquiry_No'],
+            name='Orders',
+            marker_color='lightblue',
+            yaxis='y',
+            text=yearly_summary['Inquiry_No'].astype(int),
+            textposition='outside'
+        ))
+        
+        # Line chart for AOV
+        fig_year_combo.add_trace(go.Scatter(
+            x=yearly_summary['Year'].astype(str),
+            y=yearly_summary['Avg_Order_Value'],
+            name='Avg Order Value',
+            mode='lines+markers',
+            line=dict(color='darkred', width=3),
+            marker=dict(size=10),
+            yaxis='y2'
+        ))
+        
+        fig_year_combo.update_layout(
+            title="Orders vs Avg Order Value",
+            xaxis_title="Year",
+            yaxis=dict(
+                title="Number of Orders",
+                side="left"
+            ),
+            yaxis2=dict(
+                title=f"Avg Order Value ({CURRENCY})",
+                side="right",
+                overlaying="y",
+                showgrid=False
+            ),
+            height=400,
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            margin=dict(l=50, r=50, t=80, b=50)
+        )
+        st.plotly_chart(fig_year_combo, use_container_width=True)
+
+    # ==========================================
+    # SEASONAL INSIGHTS
+    # ==========================================
+    st.markdown("---")
+    st.markdown("### 🎯 Seasonal Insights")
+    
+    if len(selected_years) > 0:
+        # Find peak months across all selected years
+        all_months = monthly_data.groupby('Month_Name', observed=True)['Total_Amount'].sum().sort_values(ascending=False)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("🏆 Peak Month", all_months.index[0], f"{CURRENCY}{all_months.iloc[0]:,.0f}")
+        with col2:
+            st.metric("📉 Lowest Month", all_months.index[-1], f"{CURRENCY}{all_months.iloc[-1]:,.0f}")
+        with col3:
+            avg_monthly = all_months.mean()
+            st.metric("📊 Avg Monthly", f"{CURRENCY}{avg_monthly:,.0f}")
+        
+        # Top 3 months
+        st.markdown("**Top 3 Performing Months:**")
+        for i, (month, revenue) in enumerate(all_months.head(3).items(), 1):
+            pct = (revenue / all_months.sum()) * 100
+            st.write(f"{i}. **{month}**: {CURRENCY}{revenue:,.0f} ({pct:.1f}% of total)")
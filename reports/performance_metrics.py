@@ -0,0 +1,171 @@
+"""Performance Metrics report"""
+import streamlit as st
+from config import CURRENCY
+
+
+def render(ctx):
+    df = ctx.df
+    
+    # Premium Styling
+    st.markdown("""
+        <style>
+        .metric-hero {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            padding: 30px;
+            border-radius: 20px;
+            color: white;
+            text-align: center;
+            box-shadow: 0 20px 40px rgba(102, 126, 234, 0.3);
+            margin-bottom: 30px;
+        }
+        .metric-card-pro {
+            background: white;
+            padding: 25px;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+            border-left: 5px solid #667eea;
+            transition: transform 0.3s ease;
+        }
+        .metric-card-pro:hover {
+            transform: translateY(-5px);
+        }
+        .trend-up { color: #10b981; font-weight: 600; }
+        .trend-down { color: #ef4444; font-weight: 600; }
+        .insight-badge {
+            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+            color: white;
+            padding: 8px 16px;
+            border-radius: 20px;
+            font-size: 0.85rem;
+            font-weight: 600;
+            display: inline-block;
+            margin: 5px;
+        }
+        </style>
+    """, unsafe_allow_html=True)
+    
+    # Header
+    st.markdown('<div class="metric-hero">', unsafe_allow_html=True)
+    st.markdown("## 📈 Performance Analytics Center")
+    st.markdown("### Real-time Business Intelligence & KPI Monitoring")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    available_years = sorted(df['Year'].unique())
+    
+    # Control Panel
+    st.markdown("### 🎛️ Analysis Controls")
+    col_ctrl1, col_ctrl2, col_ctrl3, col_ctrl4 = st.columns([1, 1, 1, 1])
+    
+    with col_ctrl1:
+        year_filter = st.selectbox("📅 Period:", ["All Years"] + [str(y) for y in available_years])
+    
+    with col_ctrl2:
+        comparison_mode = st.selectbox("📊 Comparison:", ["None", "Previous Period", "Year-over-Year"])
+    
+    with col_ctrl3:
+        metric_focus = st.selectbox("🎯 Focus:", ["Revenue", "Orders", "Quantity", "Efficiency"])
+    
+    with col_ctrl4:
+        granularity = st.selectbox("⏱️ Granularity:", ["Daily", "Weekly", "Monthly", "Quarterly"])
+    
+    # Filter data
+    if year_filter != "All Years":
+        analysis_df = df[df['Year'] == int(year_filter)]
+        period_label = f"FY {year_filter}"
+    else:
+        analysis_df = df
+        period_label = "All Time"
+    
+    # Core Calculations
+    total_revenue = analysis_df['Total_Amount'].sum()
+    total_orders = analysis_df['Inquiry_No'].nunique()
+    total_quantity = analysis_df['Qty'].sum()
+    total_transactions = len(analysis_df)
+    unique_states = analysis_df['State'].nunique()
+    unique_products = analysis_df['Product'].nunique()
+    unique_customers = analysis_df['Company'].nunique()
+    
+    avg_order_value = total_revenue / total_orders if total_orders > 0 else 0
+    avg_qty_per_order = total_quantity / total_orders if total_orders > 0 else 0
+    revenue_per_state = total_revenue / unique_states if unique_states > 0 else 0
+    revenue_per_product = total_revenue / unique_products if unique_products > 0 else 0
+    
+    # Time-based metrics
+    date_range = (analysis_df['Date'].max() - analysis_df['Date'].min()).days + 1
+    revenue_per_day = total_revenue / date_range if date_range > 0 else 0
+    orders_per_day = total_orders / date_range if date_range > 0 else 0
+    
+    # ==================== HERO METRICS SECTION ====================
+    st.markdown("### 🎯 Key Performance Indicators")
+    
+    # Determine metric colors based on focus
+    if metric_focus == "Revenue":
+        primary_color = "#667eea"
+        secondary_color = "#764ba2"
+    elif metric_focus == "Orders":
+        primary_color = "#f093fb"
+        secondary_color = "#f5576c"
+    elif metric_focus == "Quantity":
+        primary_color = "#4facfe"
+        secondary_color = "#00f2fe"
+    else:
+        primary_color = "#43e97b"
+        secondary_color = "#38f9d7"
+    
+    col_kpi1, col_kpi2, col_kpi3, col_kpi4, col_kpi5, col_kpi6 = st.columns(6)
+    
+    with col_kpi1:
+        st.markdown(f"""
+            <div class="metric-card-pro" style="border-left-color: {primary_color};">
+                <p style="color: #6b7280; font-size: 0.85rem; margin: 0;">TOTAL REVENUE</p>
+                <h2 style="color: {primary_color}; margin: 10px 0; font-size: 1.8rem;">{CURRENCY}{total_revenue/1e6:.2f}M</h2>
+                <p style="font-size: 0.8rem; color: #6b7280;">{period_label}</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col_kpi2:
+        st.markdown(f"""
+            <div class="metric-card-pro" style="border-left-color: {secondary_color};">
+                <p style="color: #6b7280; font-size: 0.85rem; margin: 0;">TOTAL ORDERS</p>
+                <h2 style="color: {secondary_color}; margin: 10px 0; font-size: 1.8rem;">{total_orders:,}</h2>
+                <p style="font-size: 0.8rem; color: #6b7280;">{total_transactions:,} transactions</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col_kpi3:
+        st.markdown(f"""
+            <div class="metric-card-pro" style="border-left-color: #10b981;">
+                <p style="color: #6b7280; font-size: 0.85rem; margin: 0;">AVG ORDER VALUE</p>
+                <h2 style="color: #10b981; margin: 10px 0; font-size: 1.8rem;">{CURRENCY}{avg_order_value:,.0f}</h2>
+                <p style="font-size: 0.8rem; color: #6b7280;">Per transaction</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col_kpi4:
+        st.markdown(f"""
+            <div class="metric-card-pro" style="border-left-color: #f59e0b;">
+                <p style="color: #6b7280; font-size: 0.85rem; margin: 0;">TOTAL QUANTITY</p>
+                <h2 style="color: #f59e0b; margin: 10px 0; font-size: 1.8rem;">{total_quantity/1e3:.1f}K</h2>
+                <p style="font-size: 0.8rem; color: #6b7280;">Units sold</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col_kpi5:
+        st.markdown(f"""
+            <div class="metric-card-pro" style="border-left-color: #ef4444;">
+                <p style="color: #6b7280; font-size: 0.85rem; margin: 0;">ACTIVE MARKETS</p>
+                <h2 style="color: #ef4444; margin: 10px 0; font-size: 1.8rem;">{unique_states}</h2>
+                <p style="font-size: 0.8rem; color: #6b7280;">{unique_products} products</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    with col_kpi6:
+        st.markdown(f"""
+            <div class="metric-card-pro" style="border-left-color: #8b5cf6;">
+                <p style="color: #6b7280; font-size: 0.85rem; margin: 0;">CUSTOMER BASE</p>
+                <h2 style="color: #8b5cf6; margin: 10px 0; font-size: 1.8rem;">{unique_customers:,}</h2>
+                <p style="font-size: 0.8rem; color: #6b7280;">Unique companies</p>
+            </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
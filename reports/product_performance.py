@@ -0,0 +1,157 @@
+"""Product Performance report"""
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from config import CURRENCY
+from formatting import compact, inr, inr_column, percent, percent_column
+
+
+def render(ctx):
+    df, memo = ctx.df, ctx.memo
+    st.markdown("## 🔧 Product Performance Analytics")
+    
+    # Calculate comprehensive metrics
+    product_stats = memo('product_stats', lambda: df.groupby('Product', observed=True).agg({
+        'Total_Amount': ['sum', 'mean', 'count', 'std'],
+        'Qty': ['sum', 'mean'],
+        'Company': 'nunique',
+        'State': 'nunique'
+    }).round(2))
+    
+    product_stats.columns = [
+        'Total_Revenue', 'Avg_Order_Value', 'Total_Orders', 'Revenue_StdDev',
+        'Total_Qty', 'Avg_Qty_Per_Order', 'Unique_Customers', 'States_Present'
+    ]
+    
+    # Calculate additional metrics
+    total_market_revenue = product_stats['Total_Revenue'].sum()
+    product_stats['Market_Share_Pct'] = (product_stats['Total_Revenue'] / total_market_revenue * 100).round(2)
+    product_stats['Revenue_Per_Customer'] = (product_stats['Total_Revenue'] / product_stats['Unique_Customers']).round(2)
+    
+    # Sort by revenue
+    product_stats = product_stats.sort_values('Total_Revenue', ascending=False)
+    
+    # TOP SUMMARY CARDS
+    st.markdown("### 📊 Market Overview")
+    cols = st.columns(5)
+    with cols[0]:
+        st.metric("Total Products", len(product_stats))
+    with cols[1]:
+        st.metric("Top Product", product_stats.index[0], f"{CURRENCY}{product_stats.iloc[0]['Total_Revenue']:,.0f}")
+    with cols[2]:
+        st.metric("Market Leader Share", f"{product_stats.iloc[0]['Market_Share_Pct']:.1f}%")
+    with cols[3]:
+        st.metric("Avg Order Value", f"{CURRENCY}{product_stats['Avg_Order_Value'].mean():,.0f}")
+    with cols[4]:
+        st.metric("Total Units Sold", f"{product_stats['Total_Qty'].sum():,.0f}")
+    
+    st.markdown("---")
+    
+    # TOP 10 RANKING TABLE (Main View)
+    st.markdown("### 🏆 Top 10 Products - Detailed Ranking")
+    
+    top_10 = product_stats.head(10).copy()
+    top_10['Rank'] = range(1, 11)
+    top_10['Total_Revenue_Fmt'] = inr(top_10['Total_Revenue'])
+    top_10['Avg_Order_Fmt'] = inr(top_10['Avg_Order_Value'])
+    top_10['Market_Share_Fmt'] = percent(top_10['Market_Share_Pct'])
+    
+    # Reorder columns for display
+    display_cols = [
+        'Rank', 'Total_Revenue_Fmt', 'Market_Share_Fmt', 'Total_Orders', 
+        'Total_Qty', 'Avg_Order_Fmt', 'Unique_Customers', 'States_Present'
+    ]
+    
+    st.table(top_10[display_cols].rename(columns={
+        'Total_Revenue_Fmt': 'Revenue',
+        'Market_Share_Fmt': 'Market Share',
+        'Total_Orders': 'Orders',
+        'Total_Qty': 'Units',
+        'Avg_Order_Fmt': 'Avg Order',
+        'Unique_Customers': 'Customers',
+        'States_Present': 'States'
+    }))
+    
+    st.markdown("---")
+    
+    # COMPARISON SECTION - Select products to compare
+    st.markdown("### 🔍 Product Comparison Tool")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        prod1 = st.selectbox("Select Product 1:", product_stats.index, index=0)
+    with col2:
+        prod2 = st.selectbox("Select Product 2:", product_stats.index, index=1 if len(product_stats) > 1 else 0)
+    
+    if prod1 and prod2:
+        p1_data = product_stats.loc[prod1]
+        p2_data = product_stats.loc[prod2]
+        
+        comparison_df = pd.DataFrame({
+            'Metric': ['Revenue', 'Market Share %', 'Orders', 'Units Sold', 'Avg Order Value', 'Customers', 'States'],
+            prod1: [
+                f"{CURRENCY}{p1_data['Total_Revenue']:,.0f}",
+                f"{p1_data['Market_Share_Pct']:.2f}%",
+                f"{int(p1_data['Total_Orders'])}",
+                f"{int(p1_data['Total_Qty'])}",
+                f"{CURRENCY}{p1_data['Avg_Order_Value']:,.0f}",
+                f"{int(p1_data['Unique_Customers'])}",
+                f"{int(p1_data['States_Present'])}"
+            ],
+            prod2: [
+                f"{CURRENCY}{p2_data['Total_Revenue']:,.0f}",
+                f"{p2_data['Market_Share_Pct']:.2f}%",
+                f"{int(p2_data['Total_Orders'])}",
+                f"{int(p2_data['Total_Qty'])}",
+                f"{CURRENCY}{p2_data['Avg_Order_Value']:,.0f}",
+                f"{int(p2_data['Unique_Customers'])}",
+                f"{int(p2_data['States_Present'])}"
+            ],
+            'Difference': [
+                f"{CURRENCY}{p1_data['Total_Revenue'] - p2_data['Total_Revenue']:,.0f}",
+                f"{p1_data['Market_Share_Pct'] - p2_data['Market_Share_Pct']:.2f}%",
+                f"{int(p1_data['Total_Orders'] - p2_data['Total_Orders'])}",
+                f"{int(p1_data['Total_Qty'] - p2_data['Total_Qty'])}",
+                f"{CURRENCY}{p1_data['Avg_Order_Value'] - p2_data['Avg_Order_Value']:,.0f}",
+                f"{int(p1_data['Unique_Customers'] - p2_data['Unique_Customers'])}",
+                f"{int(p1_data['States_Present'] - p2_data['States_Present'])}"
+            ]
+        })
+        
+        st.table(comparison_df.set_index('Metric'))
+    
+    st.markdown("---")
+    
+    # ONLY 1 CHART - Top 10 Revenue (Horizontal Bar for quick visual reference)
+    st.markdown("### 📊 Quick Visual Reference (Top 10)")
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=top_10.index[::-1],
+        x=top_10['Total_Revenue'][::-1],
+        orientation='h',
+        marker_color='royalblue',
+        text=compact(top_10['Total_Revenue'][::-1], prefix=''),
+        textposition='outside'
+    ))
+    fig.update_layout(
+        height=400,
+        xaxis_title=f"Revenue ({CURRENCY})",
+        showlegend=False,
+        margin=dict(l=200, r=50, t=30, b=30)
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # FULL DATA TABLE (Expandable)
+    with st.expander("📋 View All Products Data"):
+        st.dataframe(
+            product_stats,
+            column_config={
+                'Total_Revenue': inr_column(),
+                'Avg_Order_Value': inr_column(),
+                'Revenue_Per_Customer': inr_column(),
+                'Market_Share_Pct': percent_column(decimals=2)
+            },
+            use_container_width=True,
+            height=500
+        )
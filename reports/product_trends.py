@@ -0,0 +1,524 @@
+"""Product Trends report"""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from config import CURRENCY
+from formatting import number, percent, signed_percent
+
+TREND_COLORS = px.colors.qualitative.Set1 + px.colors.qualitative.Set2 + px.colors.qualitative.Set3
+
+
+def prepare_time_series(order_queries, products, period, trend_measure, trend_year):
+    """Period x product frame based on selected period, one grouped query for all selected products"""
+    period_keys = {"Monthly": ['Year_Month'], "Quarterly": ['Year', 'Quarter'], "Yearly": ['Year']}[period]
+    values = order_queries.aggregate(
+        period_keys + ['Product'], {'Value': trend_measure}, Year=trend_year, Product=products
+    )['Value'].unstack('Product', fill_value=0)
+
+    # Convert index to datetime for consistent plotting
+    if period == "Quarterly":
+        values.index = pd.to_datetime(
+            values.index.map(lambda x: f"{x[0]}-{x[1]*3-2:02d}-01")
+        )
+    elif period == "Yearly":
+        values.index = pd.to_datetime(values.index.astype(str), format='%Y')
+
+    return values.reindex(columns=products, fill_value=0).rename_axis(index='Date', columns=None)
+
+
+@st.fragment
+def _trend_lines(trend_metric, period_label, selected_products, trend_df, time_period):
+    """Trend Lines tab, rerun on its own when the chart type changes"""
+    st.markdown(f"#### 📈 {trend_metric} Trends{period_label}")
+
+    chart_type = st.radio(
+        "Chart Type:",
+        ["Line Chart", "Area Chart", "Stacked Area", "Candlestick Style"],
+        horizontal=True,
+        key="trend_chart_type"
+    )
+
+    fig = go.Figure()
+
+    for idx, product in enumerate(selected_products):
+        color = TREND_COLORS[idx % len(TREND_COLORS)]
+
+        if chart_type == "Line Chart":
+            fig.add_trace(go.Scatter(
+                x=trend_df.index,
+                y=trend_df[product],
+                mode='lines+markers',
+                name=product,
+                line=dict(width=3, color=color),
+                marker=dict(size=8, color=color)
+            ))
+
+        elif chart_type == "Area Chart":
+            fig.add_trace(go.Scatter(
+                x=trend_df.index,
+                y=trend_df[product],
+                fill='tozeroy',
+                name=product,
+                line=dict(width=2, color=color),
+                fillcolor=color.replace(')', ', 0.3)').replace('rgb', 'rgba')
+            ))
+
+        elif chart_type == "Stacked Area":
+            fig.add_trace(go.Scatter(
+                x=trend_df.index,
+                y=trend_df[product],
+                stackgroup='one',
+                name=product,
+                line=dict(width=1, color=color),
+                fillcolor=color
+            ))
+
+        else:  # Candlestick Style (showing min, max, start, end for grouped periods)
+            # For simplicity, show range as filled area
+            fig.add_trace(go.Scatter(
+                x=trend_df.index,
+                y=trend_df[product],
+                fill='tozeroy',
+                name=product,
+                line=dict(width=2, color=color)
+            ))
+
+    # Add trend line for total if multiple products
+    if len(selected_products) > 1 and chart_type != "Stacked Area":
+        total_line = trend_df.sum(axis=1)
+        fig.add_trace(go.Scatter(
+            x=total_line.index,
+            y=total_line.values,
+            mode='lines',
+            name='TOTAL',
+            line=dict(width=4, color='black', dash='dash'),
+            opacity=0.7
+        ))
+
+    y_axis_title = f"{trend_metric} ({'%' if trend_metric == 'Market Share' else CURRENCY if trend_metric == 'Revenue' else 'Units'})"
+
+    fig.update_layout(
+        title=f'{trend_metric} Trends - {time_period} View',
+        xaxis_title="Time Period",
+        yaxis_title=y_axis_title,
+        height=550,
+        template='plotly_white',
+        hovermode='x unified',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.3,
+            xanchor="center",
+            x=0.5
+        )
+    )
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Summary statistics
+    col_stat1, col_stat2, col_stat3 = st.columns(3)
+
+    with col_stat1:
+        total_value = trend_df.sum().sum()
+        prefix = CURRENCY if trend_metric == "Revenue" else ""
+        suffix = "%" if trend_metric == "Market Share" else ""
+        st.metric(
+            f"Total {trend_metric}",
+            f"{prefix}{total_value:,.0f}{suffix}"
+        )
+
+    with col_stat2:
+        avg_period = trend_df.sum(axis=1).mean()
+        st.metric(
+            f"Avg per {time_period[:-2]}",
+            f"{prefix}{avg_period:,.0f}{suffix}"
+        )
+
+    with col_stat3:
+        peak_period = trend_df.sum(axis=1).idxmax()
+        st.metric(
+            "Peak Period",
+            peak_period.strftime('%b %Y') if hasattr(peak_period, 'strftime') else str(peak_period)
+        )
+
+
+@st.fragment
+def _product_panel(top_products, order_queries, time_period, trend_measure, trend_year, trend_metric,
+                   period_label, metric_col, year_option, chart):
+    """Product selection and the trend tabs; picking products reruns only this panel"""
+    col_prod1, col_prod2 = st.columns([3, 1])
+
+    with col_prod1:
+        selected_products = st.multiselect(
+            "🔧 Select Products to Compare:", 
+            top_products, 
+            default=top_products[:5] if len(top_products) >= 5 else top_products,
+            help="Choose multiple products to compare trends"
+        )
+
+    with col_prod2:
+        select_all = st.checkbox("Select All Top 20", value=False)
+        if select_all:
+            selected_products = top_products
+
+    if not selected_products:
+        st.warning("⚠️ Please select at least one product")
+        st.stop()
+
+    trend_df = prepare_time_series(order_queries, selected_products, time_period, trend_measure, trend_year)
+
+    # Calculate market share if selected
+    if trend_metric == "Market Share":
+        total_by_period = trend_df.sum(axis=1)
+        trend_df = trend_df.div(total_by_period, axis=0) * 100
+
+    # Main visualization tabs
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "📈 Trend Lines", 
+        "📊 Comparative Analysis", 
+        "🎯 Growth Metrics", 
+        "🔍 Seasonality"
+    ])
+
+    with tab1:
+        _trend_lines(trend_metric, period_label, selected_products, trend_df, time_period)
+
+    with tab2:
+        st.markdown("#### 📊 Comparative Performance Matrix")
+
+        # Calculate performance metrics for each product
+        comparison_metrics = []
+
+        for product in selected_products:
+            series = trend_df[product]
+
+            metrics = {
+                'Product': product,
+                'Total': series.sum(),
+                'Average': series.mean(),
+                'Peak': series.max(),
+                'Min': series.min(),
+                'Std_Dev': series.std(),
+                'Growth_Rate': ((series.iloc[-1] - series.iloc[0]) / series.iloc[0] * 100) if len(series) > 1 and series.iloc[0] != 0 else 0,
+                'Volatility': (series.std() / series.mean() * 100) if series.mean() != 0 else 0
+            }
+            comparison_metrics.append(metrics)
+
+        comp_df = pd.DataFrame(comparison_metrics).sort_values('Total', ascending=False)
+
+        # Display as table
+        display_comp = comp_df.copy()
+        prefix = CURRENCY if trend_metric == "Revenue" else ""
+        suffix = "%" if trend_metric == "Market Share" else ""
+
+        for col in ['Total', 'Average', 'Peak', 'Min']:
+            display_comp[col] = number(display_comp[col], prefix=prefix, suffix=suffix)
+
+        display_comp['Std_Dev'] = number(display_comp['Std_Dev'], prefix=prefix)
+        display_comp['Growth_Rate'] = signed_percent(display_comp['Growth_Rate'])
+        display_comp['Volatility'] = percent(display_comp['Volatility'])
+
+        st.dataframe(display_comp, use_container_width=True, hide_index=True)
+
+        # Radar chart comparison
+        st.markdown("#### 🕸️ Multi-Dimensional Comparison")
+
+        # Normalize metrics for radar chart (0-100 scale)
+        radar_metrics = ['Total', 'Average', 'Peak', 'Growth_Rate']
+        radar_df = comp_df[['Product'] + radar_metrics].copy()
+
+        # Normalize to 0-100 scale
+        for metric in radar_metrics:
+            min_val = radar_df[metric].min()
+            max_val = radar_df[metric].max()
+            if max_val > min_val:
+                radar_df[metric] = ((radar_df[metric] - min_val) / (max_val - min_val)) * 100
+            else:
+                radar_df[metric] = 50
+
+        fig_radar = go.Figure()
+
+        for idx, row in radar_df.iterrows():
+            fig_radar.add_trace(go.Scatterpolar(
+                r=[row[m] for m in radar_metrics] + [row[radar_metrics[0]]],
+                theta=radar_metrics + [radar_metrics[0]],
+                fill='toself',
+                name=row['Product'],
+                opacity=0.6
+            ))
+
+        fig_radar.update_layout(
+            polar=dict(
+                radialaxis=dict(visible=True, range=[0, 100])
+            ),
+            showlegend=True,
+            title="Performance Comparison (Normalized)",
+            height=500,
+            template='plotly_white'
+        )
+
+        st.plotly_chart(fig_radar, use_container_width=True)
+
+    with tab3:
+        st.markdown("#### 🎯 Growth & Momentum Analysis")
+
+        # Calculate month-over-month or period-over-period growth
+        growth_df = trend_df.pct_change() * 100
+
+        col_growth1, col_growth2 = st.columns(2)
+
+        with col_growth1:
+            st.markdown("**📈 Period-over-Period Growth Rate (%)**")
+
+            fig_growth = go.Figure()
+
+            for idx, product in enumerate(selected_products):
+                fig_growth.add_trace(go.Bar(
+                    name=product,
+                    x=growth_df.index,
+                    y=growth_df[product],
+                    marker_color=TREND_COLORS[idx % len(TREND_COLORS)]
+                ))
+
+            fig_growth.update_layout(
+                barmode='group',
+                title=f'{time_period} Growth Rate',
+                yaxis_title="Growth %",
+                height=400,
+                template='plotly_white',
+                showlegend=True
+            )
+
+            fig_growth.add_hline(y=0, line_dash="dash", line_color="black")
+
+            st.plotly_chart(fig_growth, use_container_width=True)
+
+        with col_growth2:
+            st.markdown("**🎢 Cumulative Growth**")
+
+            # Calculate cumulative growth from first period
+            cumulative_df = ((trend_df / trend_df.iloc[0] - 1) * 100) if len(trend_df) > 0 else trend_df
+
+            fig_cum = go.Figure()
+
+            for idx, product in enumerate(selected_products):
+                fig_cum.add_trace(go.Scatter(
+                    x=cumulative_df.index,
+                    y=cumulative_df[product],
+                    mode='lines',
+                    name=product,
+                    line=dict(width=3, color=TREND_COLORS[idx % len(TREND_COLORS)]),
+                    stackgroup=None
+                ))
+
+            fig_cum.update_layout(
+                title='Cumulative Growth from Start',
+                yaxis_title="Cumulative Growth %",
+                height=400,
+                template='plotly_white',
+                hovermode='x unified'
+            )
+
+            fig_cum.add_hline(y=0, line_dash="dash", line_color="black")
+
+            st.plotly_chart(fig_cum, use_container_width=True)
+
+        # Growth insights
+        st.markdown("#### 💡 Growth Insights")
+
+        # Best and worst performers
+        total_growth = {}
+        for product in selected_products:
+            series = trend_df[product]
+            if len(series) >= 2 and series.iloc[0] != 0:
+                growth = ((series.iloc[-1] - series.iloc[0]) / series.iloc[0]) * 100
+                total_growth[product] = growth
+
+        if total_growth:
+            best_product = max(total_growth, key=total_growth.get)
+            worst_product = min(total_growth, key=total_growth.get)
+
+            col_ins1, col_ins2 = st.columns(2)
+
+            with col_ins1:
+                st.success(f"🏆 **Best Performer:** {best_product}  \n"
+                          f"Total Growth: {total_growth[best_product]:+.1f}%")
+
+            with col_ins2:
+                if total_growth[worst_product] < 0:
+                    st.error(f"📉 **Needs Attention:** {worst_product}  \n"
+                            f"Total Growth: {total_growth[worst_product]:+.1f}%")
+                else:
+                    st.info(f"📊 **Slowest Growth:** {worst_product}  \n"
+                           f"Total Growth: {total_growth[worst_product]:+.1f}%")
+
+    with tab4:
+        st.markdown("#### 🔍 Seasonality Patterns")
+
+        if time_period == "Monthly" and len(trend_df) > 0:
+            # Aggregate by month across all years
+            monthly_pattern = order_queries.aggregate(
+                ['Product', 'Month'], {metric_col: trend_measure}, Year=trend_year, Product=selected_products
+            ).reset_index()
+
+            # Pivot for heatmap
+            pivot_seasonal = monthly_pattern.pivot(index='Product', columns='Month', values=metric_col).fillna(0)
+
+            # Reorder columns to start from January
+            pivot_seasonal = pivot_seasonal[[i for i in range(1, 13) if i in pivot_seasonal.columns]]
+
+            fig_heatmap = chart('product_seasonal_heatmap', lambda: px.imshow(
+                pivot_seasonal,
+                labels=dict(x="Month", y="Product", color=trend_metric),
+                x=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][:len(pivot_seasonal.columns)],
+                y=pivot_seasonal.index,
+                color_continuous_scale="RdYlGn",
+                aspect="auto",
+                title=f"Seasonal Heatmap - {trend_metric} by Month",
+                template='plotly_white'
+            ).update_layout(height=max(400, len(selected_products) * 40)),
+                pivot_seasonal, trend_metric=trend_metric, n_products=len(selected_products))
+            st.plotly_chart(fig_heatmap, use_container_width=True)
+
+            # Seasonal index calculation
+            st.markdown("#### 📊 Seasonal Index (Average = 100)")
+
+            seasonal_index = pivot_seasonal.div(pivot_seasonal.mean(axis=1), axis=0) * 100
+
+            fig_index = go.Figure()
+
+            for product in selected_products:
+                if product in seasonal_index.index:
+                    fig_index.add_trace(go.Scatter(
+                        x=list(range(1, 13)),
+                        y=seasonal_index.loc[product].values,
+                        mode='lines+markers',
+                        name=product,
+                        line=dict(width=2)
+                    ))
+
+            fig_index.add_hline(y=100, line_dash="dash", line_color="black", 
+                               annotation_text="Average")
+
+            fig_index.update_layout(
+                title="Seasonal Index by Month",
+                xaxis=dict(
+                    tickmode='array',
+                    tickvals=list(range(1, 13)),
+                    ticktext=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+                ),
+                yaxis_title="Index (100 = Average)",
+                height=450,
+                template='plotly_white',
+                hovermode='x unified'
+            )
+
+            st.plotly_chart(fig_index, use_container_width=True)
+
+            # Peak season identification
+            st.markdown("#### 🎯 Peak Season Insights")
+
+            for product in selected_products:
+                if product in seasonal_index.index:
+                    peak_month = seasonal_index.loc[product].idxmax()
+                    low_month = seasonal_index.loc[product].idxmin()
+                    peak_value = seasonal_index.loc[product].max()
+                    low_value = seasonal_index.loc[product].min()
+
+                    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+                    col_peak1, col_peak2 = st.columns(2)
+                    with col_peak1:
+                        st.success(f"**{product}**  \n"
+                                  f"🔥 Peak: {months[peak_month-1]} ({peak_value:.0f} index)  \n"
+                                  f"❄️ Low: {months[low_month-1]} ({low_value:.0f} index)")
+
+        else:
+            st.info("ℹ️ Switch to 'Monthly' time grouping to view seasonality analysis")
+
+    # Data table at bottom
+    with st.expander("📋 View Raw Trend Data"):
+        display_trend = trend_df.copy()
+        if trend_metric != "Market Share":
+            prefix = CURRENCY if trend_metric == "Revenue" else ""
+            display_trend = number(display_trend, prefix=prefix)
+        else:
+            display_trend = percent(display_trend)
+
+        st.dataframe(display_trend, use_container_width=True)
+
+        # Export option
+        csv = trend_df.to_csv().encode('utf-8')
+        st.download_button(
+            label="📥 Export Trend Data (CSV)",
+            data=csv,
+            file_name=f"product_trends_{year_option.replace(' ', '_')}.csv",
+            mime='text/csv'
+        )
+
+
+def render(ctx):
+    df, order_queries, chart = ctx.df, ctx.order_queries, ctx.chart
+    st.markdown("## 🔧 Product Trends Over Time")
+    st.markdown("---")
+    
+    # Get available years
+    available_years = sorted(df['Year'].unique())
+    
+    # Header controls
+    col_year, col_metric, col_period = st.columns([1, 1, 1])
+    
+    with col_year:
+        year_option = st.selectbox(
+            "📅 Select Period:",
+            ["All Years"] + [str(y) for y in available_years],
+            help="Analyze trends across specific time period"
+        )
+    
+    with col_metric:
+        trend_metric = st.selectbox(
+            "📊 Metric:",
+            ["Revenue", "Quantity", "Orders", "Market Share"],
+            help="Choose metric for trend analysis"
+        )
+    
+    with col_period:
+        time_period = st.selectbox(
+            "⏱️ Time Grouping:",
+            ["Monthly", "Quarterly", "Yearly"],
+            help="Aggregate data by time period"
+        )
+    
+    # Year filter pushed down to the query backend
+    if year_option != "All Years":
+        trend_year = int(year_option)
+        period_label = f" ({trend_year})"
+    else:
+        trend_year = None
+        period_label = " (All Time)"
+    
+    # Metric mapping
+    metric_map = {
+        "Revenue": ("Total_Amount", "sum"),
+        "Quantity": ("Qty", "sum"),
+        "Orders": ("Inquiry_No", "count"),
+        "Market Share": ("Total_Amount", "sum")  # Special calculation
+    }
+    metric_col, agg_func = metric_map[trend_metric]
+    trend_measure = (metric_col, 'size' if agg_func == "count" else agg_func)
+    
+    # Product selection with categories
+    st.markdown("### 🏷️ Product Selection")
+    
+    # Get top products by selected metric
+    product_ranking = order_queries.aggregate(
+        'Product', {'Value': (metric_col, agg_func)}, Year=trend_year)['Value'].sort_values(ascending=False)
+    
+    top_products = product_ranking.head(20).index.tolist()
+    
+    _product_panel(top_products, order_queries, time_period, trend_measure, trend_year, trend_metric,
+                   period_label, metric_col, year_option, chart)
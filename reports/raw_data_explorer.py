@@ -0,0 +1,270 @@
+"""Raw Data Explorer report"""
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import streamlit as st
+from config import CURRENCY
+from order_store import row_bytes
+from table_pages import in_order, page_bounds, sort_controls, sort_order
+
+
+def quick_stats(df, rows):
+    """Quick Statistics of the filtered rows, read column by column at their positions"""
+    amounts = df['Total_Amount'].to_numpy()[rows]
+    qty = df['Qty'].iloc[rows]
+    dates = df['Date'].iloc[rows]
+    return {
+        'revenue': amounts.sum(),
+        'avg_order': amounts.mean(),
+        'qty': qty.sum(),
+        'avg_qty': qty.mean(),
+        'orders': df['Inquiry_No'].iloc[rows].nunique(),
+        'days': (dates.max() - dates.min()).days,
+    }
+
+
+def render(ctx):
+    loader, df, order_index, memo = ctx.loader, ctx.df, ctx.order_index, ctx.memo
+    st.markdown("## 📋 Interactive Data Explorer")
+    st.markdown("---")
+    
+    # Data integrity check section
+    with st.expander("🔍 Data Integrity Status", expanded=False):
+        col_check1, col_check2, col_check3, col_check4 = st.columns(4)
+        
+        # Counts are computed once per sync by the loader
+        ingest_report = loader.ingest_report
+        
+        with col_check1:
+            total_records_source = len(df)
+            st.metric("Total Records in DataFrame", f"{total_records_source:,}")
+        
+        with col_check2:
+            duplicate_count = ingest_report.get('duplicate_rows', 0)
+            st.metric("Duplicate Rows", f"{duplicate_count:,}", 
+                     delta=None if duplicate_count == 0 else "Check data")
+        
+        with col_check3:
+            null_counts = ingest_report.get('missing_key_values', 0)
+            st.metric("Missing Values (Key Columns)", f"{null_counts:,}",
+                     delta=None if null_counts == 0 else "Data Quality Issue")
+        
+        with col_check4:
+            rejected_count = ingest_report.get('rows_rejected', 0)
+            st.metric("Rejected Sheet Rows", f"{rejected_count:,}",
+                     delta=None if rejected_count == 0 else "Not loaded")
+        
+        # Why rows were rejected, and the rows themselves
+        reject_counts = ingest_report.get('reject_counts', {})
+        if reject_counts:
+            st.markdown("**🚫 Rejected Rows by Reason:**")
+            st.dataframe(
+                pd.DataFrame(list(reject_counts.items()), columns=['Reason', 'Rows']),
+                use_container_width=True, hide_index=True
+            )
+            if loader.rejects is not None and not loader.rejects.empty:
+                rejects_view = loader.rejects.copy()
+                rejects_view.insert(0, 'Sheet Row', rejects_view.index + 2)
+                st.dataframe(rejects_view.head(500), use_container_width=True, height=200, hide_index=True)
+        
+        # Show data range info
+        st.caption(f"📅 Date Range: {df['Date'].min().strftime('%Y-%m-%d')} to {df['Date'].max().strftime('%Y-%m-%d')}")
+        st.caption(f"🗺️ Unique States: {df['State'].nunique()} | 🏷️ Unique Products: {df['Product'].nunique()}")
+        
+        # Show last few records to verify data loading
+        with st.container():
+            st.markdown("**📝 Last 5 Records (Verification):**")
+            st.dataframe(df.tail(5), use_container_width=True, height=200)
+    
+    # Advanced filters
+    with st.expander("🔍 Advanced Filters", expanded=True):
+        col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
+        
+        with col1:
+            # Add "Select All" option for states
+            all_states = sorted(order_index.values('State'))
+            select_all_states = st.checkbox("Select All States", value=True, key="select_all_states")
+            if select_all_states:
+                f_states = st.multiselect("States:", all_states, default=all_states, key="states_multiselect")
+            else:
+                f_states = st.multiselect("States:", all_states, default=[], key="states_multiselect")
+        
+        with col2:
+            # Add "Select All" option for products
+            all_products = sorted(order_index.values('Product'))
+            select_all_products = st.checkbox("Select All Products", value=True, key="select_all_products")
+            if select_all_products:
+                f_products = st.multiselect("Products:", all_products, default=all_products[:50], key="products_multiselect")  # Limit default to prevent lag
+            else:
+                f_products = st.multiselect("Products:", all_products, default=[], key="products_multiselect")
+        
+        with col3:
+            # Better date range handling
+            min_date = df['Date'].min().date()
+            max_date = df['Date'].max().date()
+            date_range = st.date_input(
+                "Date Range:", 
+                [min_date, max_date],
+                min_value=min_date,
+                max_value=max_date
+            )
+        
+        with col4:
+            st.markdown("<br>", unsafe_allow_html=True)
+            reset_filters = st.button("🔄 Reset", use_container_width=True)
+            if reset_filters:
+                st.rerun()
+    
+    # Apply filters with validation, on row positions: only the page shown is materialized
+    rows = order_index.rows(State=f_states, Product=f_products)
+    filter_log = []
+    
+    if f_states:
+        filter_log.append(f"States: {len(f_states)} selected")
+    
+    if f_products:
+        filter_log.append(f"Products: {len(f_products)} selected")
+    
+    if len(date_range) == 2:
+        start_date, end_date = date_range
+        # Ensure we capture the full end date (up to 23:59:59)
+        start_timestamp = pd.Timestamp(start_date)
+        end_timestamp = pd.Timestamp(end_date) + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+        
+        dates = df['Date'].to_numpy()
+        if rows is None:
+            rows = np.flatnonzero((dates >= start_timestamp.to_datetime64()) &
+                                  (dates <= end_timestamp.to_datetime64()))
+        else:
+            rows = rows[(dates[rows] >= start_timestamp.to_datetime64()) &
+                        (dates[rows] <= end_timestamp.to_datetime64())]
+        filter_log.append(f"Date: {start_date} to {end_date}")
+    if rows is None:
+        rows = np.arange(len(df))
+    
+    # Display filter summary
+    st.markdown("---")
+    col_summary1, col_summary2, col_summary3 = st.columns([2, 2, 1])
+    
+    with col_summary1:
+        st.markdown(f"**📊 Showing {len(rows):,} of {len(df):,} records**")
+        if filter_log:
+            st.caption(" | ".join(filter_log))
+    
+    with col_summary2:
+        # Pagination info
+        if len(rows) > 0:
+            row_size = memo('raw_row_bytes', lambda: row_bytes(df))
+            st.caption(f"💾 Memory Usage: ~{len(rows) * row_size / 1024**2:.2f} MB")
+    
+    with col_summary3:
+        # Export button (the CSV is only built when clicked)
+        if len(rows) > 0:
+            st.download_button(
+                label="📥 Export CSV",
+                data=lambda: df.iloc[rows].to_csv(index=False).encode('utf-8'),
+                file_name=f'raw_data_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv',
+                mime='text/csv',
+                use_container_width=True
+            )
+    
+    # Data display with guaranteed full dataset visibility
+    if len(rows) == 0:
+        st.warning("⚠️ No records match the selected filters. Please adjust your criteria.")
+    else:
+        # Show data with pagination options
+        st.markdown("### 📋 Data Table")
+        
+        # Option to show all or paginated
+        show_option = st.radio(
+            "Display Mode:",
+            ["Show All (Up to 1000 rows)", "Paginated View"],
+            horizontal=True,
+            key="display_mode"
+        )
+        
+        # Sorted server-side: one stable sort of the whole snapshot per column, reused for every filter and page
+        sort_column, ascending = sort_controls(df.columns, key="raw")
+        if sort_column is not None:
+            order = memo('raw_sort_order', lambda: sort_order(df[sort_column], ascending),
+                         column=sort_column, ascending=ascending)
+            rows_shown = in_order(order, rows, len(df))
+        else:
+            rows_shown = rows
+        
+        if show_option == "Show All (Up to 1000 rows)" and len(rows) <= 1000:
+            start_idx, end_idx = 0, len(rows_shown)
+            height_setting = min(800, 40 + ((end_idx - start_idx) * 35))  # Dynamic height
+        else:
+            # Paginated view
+            start_idx, end_idx = page_bounds(len(rows_shown), key="raw")
+            height_setting = min(600, 40 + ((end_idx - start_idx) * 35))
+        display_df = df.iloc[rows_shown[start_idx:end_idx]]
+        
+        # Display the dataframe with full configuration
+        st.dataframe(
+            display_df,
+            use_container_width=True,
+            height=int(height_setting),
+            column_config={
+                "Date": st.column_config.DateColumn(
+                    "Date",
+                    format="YYYY-MM-DD",
+                    help="Order date"
+                ),
+                "Total_Amount": st.column_config.NumberColumn(
+                    f"Amount ({CURRENCY})",
+                    format=f"{CURRENCY}%.2f",
+                    help="Total order amount"
+                ),
+                "Qty": st.column_config.NumberColumn(
+                    "Quantity",
+                    format="%d",
+                    help="Quantity ordered"
+                ),
+                "Inquiry_No": st.column_config.TextColumn(
+                    "Inquiry #",
+                    help="Unique inquiry number"
+                ),
+                "State": st.column_config.TextColumn(
+                    "State",
+                    help="Customer state"
+                ),
+                "Product": st.column_config.TextColumn(
+                    "Product",
+                    help="Product name",
+                    width="large"
+                )
+            },
+            hide_index=False  # Show index to verify row count
+        )
+        
+        # Row index verification
+        st.caption(f"🔢 Row Indices: {display_df.index.min()} to {display_df.index.max()} "
+                  f"(Total: {len(display_df)} rows)")
+        
+        # Show last row details to verify data completeness
+        with st.expander("🔍 Verify Last Record"):
+            if len(rows) > 0:
+                last_record = df.iloc[rows[-1]]
+                st.json(last_record.to_dict())
+                st.caption(f"Index position: {df.index[rows[-1]]}")
+    
+    # Data statistics (per filter combination, not per page)
+    with st.expander("📊 Quick Statistics"):
+        if len(rows) > 0:
+            quick = memo('raw_quick_stats', lambda: quick_stats(df, rows), State=f_states, Product=f_products,
+                         Dates=[str(d) for d in date_range])
+            col_stat1, col_stat2, col_stat3 = st.columns(3)
+            
+            with col_stat1:
+                st.metric("Total Revenue", f"{CURRENCY}{quick['revenue']:,.2f}")
+                st.metric("Avg Order Value", f"{CURRENCY}{quick['avg_order']:,.2f}")
+            
+            with col_stat2:
+                st.metric("Total Quantity", f"{quick['qty']:,}")
+                st.metric("Avg Quantity", f"{quick['avg_qty']:.2f}")
+            
+            with col_stat3:
+                st.metric("Unique Orders", f"{quick['orders']:,}")
+                st.metric("Date Range", f"{quick['days']} days")
@@ -0,0 +1,526 @@
+"""Regional Comparison report"""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import streamlit as st
+from config import CURRENCY
+from formatting import number
+
+
+def calculate_metrics(order_queries, region_year, state):
+    """Headline metrics of one state for the comparison cards"""
+    totals = order_queries.aggregate('State', {
+        'revenue': ('Total_Amount', 'sum'),
+        'orders': ('Inquiry_No', 'nunique'),
+        'quantity': ('Qty', 'sum'),
+        'avg_order': ('Total_Amount', 'mean'),
+        'unique_products': ('Product', 'nunique'),
+        'active_months': ('Year_Month', 'nunique'),
+    }, Year=region_year, State=state)
+    if totals.empty:
+        return {
+            'revenue': 0,
+            'orders': 0,
+            'quantity': 0,
+            'avg_order': 0,
+            'top_product': "N/A",
+            'top_product_revenue': 0,
+            'unique_products': 0,
+            'active_months': 0
+        }
+
+    metrics = {name: values.iloc[0] for name, values in totals.items()}
+
+    # Top product
+    top_prod = order_queries.aggregate(
+        'Product', {'Revenue': ('Total_Amount', 'sum')}, Year=region_year, State=state)['Revenue']
+    metrics['top_product'] = top_prod.idxmax() if not top_prod.empty else "N/A"
+    metrics['top_product_revenue'] = top_prod.max() if not top_prod.empty else 0
+
+    return metrics
+
+
+@st.fragment
+def _product_comparison(product_values, state1, state2, colors, comparison_metric):
+    """Product Comparison tab: the chart type reruns only this tab"""
+    # Product-wise comparison with selected metric
+    prod_comparison = product_values.reset_index()
+
+    # Sort by total
+    prod_comparison['Total'] = prod_comparison[state1] + prod_comparison[state2]
+    prod_comparison = prod_comparison.sort_values('Total', ascending=False).head(15)
+
+    # Chart type selector
+    chart_type = st.radio(
+        "Chart Type:",
+        ["Grouped Bar", "Stacked Bar", "Radar Chart"],
+        horizontal=True,
+        key="prod_chart_type"
+    )
+
+    if chart_type == "Grouped Bar":
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            name=state1, 
+            x=prod_comparison['Product'], 
+            y=prod_comparison[state1],
+            marker_color=colors['state1'],
+            text=number(prod_comparison[state1]),
+            textposition='auto'
+        ))
+        fig.add_trace(go.Bar(
+            name=state2, 
+            x=prod_comparison['Product'], 
+            y=prod_comparison[state2],
+            marker_color=colors['state2'],
+            text=number(prod_comparison[state2]),
+            textposition='auto'
+        ))
+        fig.update_layout(
+            barmode='group',
+            title=f'Top Products Comparison ({comparison_metric.split("(")[0].strip()})',
+            xaxis_tickangle=-45,
+            height=500,
+            template='plotly_white',
+            legend=dict(orientation="h", yanchor="bottom", y=1.02)
+        )
+
+    elif chart_type == "Stacked Bar":
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            name=state1, 
+            x=prod_comparison['Product'], 
+            y=prod_comparison[state1],
+            marker_color=colors['state1']
+        ))
+        fig.add_trace(go.Bar(
+            name=state2, 
+            x=prod_comparison['Product'], 
+            y=prod_comparison[state2],
+            marker_color=colors['state2']
+        ))
+        fig.update_layout(
+            barmode='stack',
+            title=f'Product Distribution - Stacked View',
+            xaxis_tickangle=-45,
+            height=500,
+            template='plotly_white'
+        )
+
+    else:  # Radar Chart
+        fig = go.Figure()
+        fig.add_trace(go.Scatterpolar(
+            r=prod_comparison[state1].tolist() + [prod_comparison[state1].iloc[0]],
+            theta=prod_comparison['Product'].tolist() + [prod_comparison['Product'].iloc[0]],
+            fill='toself',
+            name=state1,
+            line_color=colors['state1']
+        ))
+        fig.add_trace(go.Scatterpolar(
+            r=prod_comparison[state2].tolist() + [prod_comparison[state2].iloc[0]],
+            theta=prod_comparison['Product'].tolist() + [prod_comparison['Product'].iloc[0]],
+            fill='toself',
+            name=state2,
+            line_color=colors['state2']
+        ))
+        fig.update_layout(
+            polar=dict(radialaxis=dict(visible=True)),
+            showlegend=True,
+            title="Product Performance Radar",
+            height=600,
+            template='plotly_white'
+        )
+
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def render(ctx):
+    df, order_cube, order_queries, memo = ctx.df, ctx.order_cube, ctx.order_queries, ctx.memo
+    st.markdown("## 🗺️ Multi-State Comparison Tool")
+    st.markdown("---")
+    
+    # Get available years
+    available_years = sorted(df['Year'].unique())
+    
+    # Year Selection with "All Years" option
+    col_year, col_metric = st.columns([1, 2])
+    with col_year:
+        year_option = st.selectbox(
+            "📅 Select Year:",
+            ["All Years"] + [str(y) for y in available_years],
+            help="Compare states across specific year or all time"
+        )
+    
+    # Year filter pushed down to the query backend
+    if year_option == "All Years":
+        region_year = None
+        selected_year_label = "All Years"
+    else:
+        region_year = int(year_option)
+        selected_year_label = str(region_year)
+    
+    with col_metric:
+        comparison_metric = st.radio(
+            "📊 Comparison Metric:",
+            ["Revenue (Total_Amount)", "Quantity (Qty)", "Orders (Count)"],
+            horizontal=True,
+            key="regional_metric"
+        )
+    
+    # State Selection with swap button
+    st.markdown("### 🗺️ Select States to Compare")
+    
+    col_s1, col_swap, col_s2 = st.columns([2, 0.5, 2])
+    
+    states_list = sorted(order_cube.rollup('State', Year=region_year).index)
+    
+    with col_s1:
+        state1 = st.selectbox(
+            "State 1:", 
+            states_list, 
+            index=0,
+            key="state1_select"
+        )
+    
+    with col_swap:
+        st.markdown("<br>", unsafe_allow_html=True)
+        if st.button("🔄", help="Swap States"):
+            # Store in session state to swap
+            if 'state1_select' in st.session_state and 'state2_select' in st.session_state:
+                st.session_state.state1_select, st.session_state.state2_select = \
+                    st.session_state.state2_select, st.session_state.state1_select
+                st.rerun()
+    
+    with col_s2:
+        # Filter out state1 from options for state2 to prevent same state comparison
+        state2_options = [s for s in states_list if s != state1]
+        default_index = 0 if len(state2_options) > 0 else 0
+        state2 = st.selectbox(
+            "State 2:", 
+            state2_options, 
+            index=default_index,
+            key="state2_select"
+        )
+    
+    # Metric calculations
+    metric_map = {
+        "Revenue (Total_Amount)": ("Total_Amount", "sum"),
+        "Quantity (Qty)": ("Qty", "sum"),
+        "Orders (Count)": ("Inquiry_No", "count")
+    }
+    metric_col, agg_func = metric_map[comparison_metric]
+    region_measure = ('Inquiry_No', 'size') if metric_col == 'Inquiry_No' else (metric_col, 'sum')
+    
+    s1_metrics = memo('regional_metrics', lambda: calculate_metrics(order_queries, region_year, state1),
+                      Year=year_option, State=state1)
+    s2_metrics = memo('regional_metrics', lambda: calculate_metrics(order_queries, region_year, state2),
+                      Year=year_option, State=state2)
+    
+    # Per-product values of both states, shared by the product and category tabs
+    product_values = order_queries.aggregate(
+        ['Product', 'State'], {'Value': region_measure}, Year=region_year, State=[state1, state2]
+    )['Value'].unstack('State', fill_value=0).reindex(columns=[state1, state2], fill_value=0).rename_axis(columns=None)
+    
+    # Display Metrics Cards with Delta Comparison
+    st.markdown(f"### 📊 Performance Overview - {selected_year_label}")
+    
+    cols = st.columns(2)
+    
+    # Color scheme - Professional contrasting colors
+    colors = {
+        'state1': '#2563EB',  # Royal Blue
+        'state2': '#DC2626',  # Red
+        'state1_light': '#DBEAFE',
+        'state2_light': '#FEE2E2'
+    }
+    
+    for idx, (state, metrics) in enumerate([
+        (state1, s1_metrics), 
+        (state2, s2_metrics)
+    ]):
+        with cols[idx]:
+            # Header with color indicator
+            header_color = colors['state1'] if idx == 0 else colors['state2']
+            st.markdown(
+                f"<h3 style='color: {header_color}; border-bottom: 3px solid {header_color}; padding-bottom: 10px;'>"
+                f"🏴 {state}</h3>", 
+                unsafe_allow_html=True
+            )
+            
+            # Main metrics in styled containers
+            with st.container():
+                col_m1, col_m2 = st.columns(2)
+                
+                with col_m1:
+                    # Primary metric based on selection
+                    if metric_col == 'Total_Amount':
+                        st.metric(
+                            "Total Revenue", 
+                            f"{CURRENCY}{metrics['revenue']:,.0f}",
+                            delta=None
+                        )
+                    elif metric_col == 'Qty':
+                        st.metric(
+                            "Total Quantity", 
+                            f"{metrics['quantity']:,.0f}",
+                            delta=None
+                        )
+                    else:
+                        st.metric(
+                            "Total Orders", 
+                            f"{metrics['orders']:,}",
+                            delta=None
+                        )
+                
+                with col_m2:
+                    st.metric(
+                        "Avg Order Value", 
+                        f"{CURRENCY}{metrics['avg_order']:,.0f}",
+                        delta=None
+                    )
+                
+                col_m3, col_m4 = st.columns(2)
+                with col_m3:
+                    st.metric("Unique Products", f"{metrics['unique_products']}")
+                with col_m4:
+                    st.metric("Active Months", f"{metrics['active_months']}")
+                
+                # Top product info
+                st.info(f"**Top Product:** {metrics['top_product']}  \n"
+                       f"Revenue: {CURRENCY}{metrics['top_product_revenue']:,.0f}")
+    
+    # Winner Banner
+    st.markdown("---")
+    winner_col, diff_col = st.columns([1, 2])
+    
+    with winner_col:
+        if metric_col == 'Total_Amount':
+            s1_score = s1_metrics['revenue']
+            s2_score = s2_metrics['revenue']
+        elif metric_col == 'Qty':
+            s1_score = s1_metrics['quantity']
+            s2_score = s2_metrics['quantity']
+        else:
+            s1_score = s1_metrics['orders']
+            s2_score = s2_metrics['orders']
+        
+        if s1_score > s2_score:
+            winner = state1
+            winner_color = colors['state1']
+            margin = ((s1_score - s2_score) / s2_score * 100) if s2_score > 0 else 0
+        elif s2_score > s1_score:
+            winner = state2
+            winner_color = colors['state2']
+            margin = ((s2_score - s1_score) / s1_score * 100) if s1_score > 0 else 0
+        else:
+            winner = "Tie"
+            winner_color = "#6B7280"
+            margin = 0
+        
+        if winner != "Tie":
+            st.markdown(
+                f"<div style='background-color: {winner_color}; color: white; padding: 15px; "
+                f"border-radius: 10px; text-align: center;'>"
+                f"<h2>🏆 Winner</h2>"
+                f"<h1>{winner}</h1>"
+                f"<p>Leading by {margin:.1f}%</p>"
+                f"</div>",
+                unsafe_allow_html=True
+            )
+        else:
+            st.markdown(
+                f"<div style='background-color: {winner_color}; color: white; padding: 15px; "
+                f"border-radius: 10px; text-align: center;'>"
+                f"<h2>⚖️ Tie</h2>"
+                f"<p>Both states are equal</p>"
+                f"</div>",
+                unsafe_allow_html=True
+            )
+    
+    with diff_col:
+        # Comparison metrics table
+        comparison_metrics = pd.DataFrame({
+            'Metric': ['Revenue', 'Orders', 'Quantity', 'Avg Order Value', 'Unique Products'],
+            state1: [
+                f"{CURRENCY}{s1_metrics['revenue']:,.0f}",
+                f"{s1_metrics['orders']:,}",
+                f"{s1_metrics['quantity']:,.0f}",
+                f"{CURRENCY}{s1_metrics['avg_order']:,.0f}",
+                f"{s1_metrics['unique_products']}"
+            ],
+            state2: [
+                f"{CURRENCY}{s2_metrics['revenue']:,.0f}",
+                f"{s2_metrics['orders']:,}",
+                f"{s2_metrics['quantity']:,.0f}",
+                f"{CURRENCY}{s2_metrics['avg_order']:,.0f}",
+                f"{s2_metrics['unique_products']}"
+            ],
+            'Difference': [
+                f"{CURRENCY}{s1_metrics['revenue'] - s2_metrics['revenue']:+,.0f}",
+                f"{s1_metrics['orders'] - s2_metrics['orders']:+,.0f}",
+                f"{s1_metrics['quantity'] - s2_metrics['quantity']:+,.0f}",
+                f"{CURRENCY}{s1_metrics['avg_order'] - s2_metrics['avg_order']:+,.0f}",
+                f"{s1_metrics['unique_products'] - s2_metrics['unique_products']:+d}"
+            ]
+        })
+        
+        st.markdown("#### 📋 Detailed Comparison")
+        st.dataframe(comparison_metrics, use_container_width=True, hide_index=True)
+    
+    # Visualizations
+    st.markdown("---")
+    st.markdown("### 📈 Visual Analytics")
+    
+    tab1, tab2, tab3 = st.tabs(["Product Comparison", "Monthly Trends", "Category Breakdown"])
+    
+    with tab1:
+        _product_comparison(product_values, state1, state2, colors, comparison_metric)
+    
+    with tab2:
+        # Monthly trends comparison
+        col_monthly, col_stats = st.columns([3, 1])
+        
+        with col_monthly:
+            # Prepare monthly data
+            state_monthly = order_queries.aggregate(['State', 'Year_Month'], {
+                'Total_Amount': ('Total_Amount', 'sum'),
+                'Qty': ('Qty', 'sum'),
+                'Inquiry_No': ('Inquiry_No', 'count')
+            }, Year=region_year, State=[state1, state2]).rename_axis(index={'Year_Month': 'Date'})
+            states_index = state_monthly.index.get_level_values('State')
+            s1_monthly = state_monthly[states_index == state1].droplevel('State').reset_index()
+            s2_monthly = state_monthly[states_index == state2].droplevel('State').reset_index()
+            
+            # Determine y-axis column
+            if metric_col == 'Inquiry_No':
+                y_col = 'Inquiry_No'
+                y_label = 'Orders'
+            elif metric_col == 'Qty':
+                y_col = 'Qty'
+                y_label = 'Quantity'
+            else:
+                y_col = 'Total_Amount'
+                y_label = 'Revenue'
+            
+            fig = go.Figure()
+            
+            # State 1 line
+            fig.add_trace(go.Scatter(
+                x=s1_monthly['Date'],
+                y=s1_monthly[y_col],
+                mode='lines+markers',
+                name=state1,
+                line=dict(color=colors['state1'], width=3),
+                marker=dict(size=8)
+            ))
+            
+            # State 2 line
+            fig.add_trace(go.Scatter(
+                x=s2_monthly['Date'],
+                y=s2_monthly[y_col],
+                mode='lines+markers',
+                name=state2,
+                line=dict(color=colors['state2'], width=3),
+                marker=dict(size=8)
+            ))
+            
+            fig.update_layout(
+                title=f'Monthly {y_label} Trends',
+                xaxis_title="Month",
+                yaxis_title=y_label,
+                height=450,
+                template='plotly_white',
+                hovermode='x unified'
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col_stats:
+            st.markdown("#### 📊 Trend Stats")
+            
+            # Calculate growth rates
+            if len(s1_monthly) > 1:
+                s1_growth = ((s1_monthly[y_col].iloc[-1] - s1_monthly[y_col].iloc[0]) / 
+                            s1_monthly[y_col].iloc[0] * 100)
+                st.metric(f"{state1} Growth", f"{s1_growth:+.1f}%")
+            
+            if len(s2_monthly) > 1:
+                s2_growth = ((s2_monthly[y_col].iloc[-1] - s2_monthly[y_col].iloc[0]) / 
+                            s2_monthly[y_col].iloc[0] * 100)
+                st.metric(f"{state2} Growth", f"{s2_growth:+.1f}%")
+            
+            # Peak months
+            if not s1_monthly.empty:
+                s1_peak = s1_monthly.loc[s1_monthly[y_col].idxmax()]
+                st.info(f"**{state1} Peak:**  \n"
+                       f"{s1_peak['Date'].strftime('%b %Y')}  \n"
+                       f"{CURRENCY if y_col == 'Total_Amount' else ''}{s1_peak[y_col]:,.0f}")
+            
+            if not s2_monthly.empty:
+                s2_peak = s2_monthly.loc[s2_monthly[y_col].idxmax()]
+                st.info(f"**{state2} Peak:**  \n"
+                       f"{s2_peak['Date'].strftime('%b %Y')}  \n"
+                       f"{CURRENCY if y_col == 'Total_Amount' else ''}{s2_peak[y_col]:,.0f}")
+    
+    with tab3:
+        # Product category analysis (if you have categories, otherwise use first letter grouping)
+        st.markdown("#### 🏷️ Product Category Analysis")
+        
+        # Create pseudo-categories from product names (first word), summed from the product values
+        categories = product_values.index.astype(str).str.split().str[0].rename('Category')
+        cat_comparison = product_values.groupby(categories).sum().reset_index()
+        
+        # Create sunburst chart
+        fig = go.Figure()
+        
+        # Donut charts side by side
+        fig = make_subplots(rows=1, cols=2, specs=[[{'type':'domain'}, {'type':'domain'}]],
+                           subplot_titles=(state1, state2))
+        
+        fig.add_trace(go.Pie(
+            labels=cat_comparison['Category'],
+            values=cat_comparison[state1],
+            name=state1,
+            hole=0.4,
+            marker_colors=px.colors.sequential.Blues_r
+        ), row=1, col=1)
+        
+        fig.add_trace(go.Pie(
+            labels=cat_comparison['Category'],
+            values=cat_comparison[state2],
+            name=state2,
+            hole=0.4,
+            marker_colors=px.colors.sequential.Reds_r
+        ), row=1, col=2)
+        
+        fig.update_layout(
+            title_text="Category Distribution Comparison",
+            height=500,
+            template='plotly_white',
+            showlegend=True,
+            legend=dict(orientation="h", yanchor="bottom", y=-0.2)
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Category comparison table
+        cat_comparison['Difference'] = cat_comparison[state1] - cat_comparison[state2]
+        cat_comparison = cat_comparison.sort_values('Difference', ascending=False)
+        
+        st.markdown("#### 📋 Category Breakdown")
+        st.dataframe(
+            cat_comparison.style.format({
+                state1: lambda x: f"{x:,.0f}",
+                state2: lambda x: f"{x:,.0f}",
+                'Difference': lambda x: f"{x:+,.0f}"
+            }).apply(lambda x: ['background-color: rgba(37, 99, 235, 0.1)' if x['Difference'] > 0 else 'background-color: rgba(220, 38, 38, 0.1)' if x['Difference'] < 0 else '' for _ in x], axis=1),
+            use_container_width=True,
+            hide_index=True
+        )
+
+
+        # 5.2  here new added the Map wise anlaysis for the states wise
+        # -----------------------------------------------------------------------------------------------------------------
+        #  =========================================================================================================
+          # ==========================================
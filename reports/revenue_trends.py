@@ -0,0 +1,376 @@
+"""Revenue Trends report"""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import streamlit as st
+from config import CURRENCY
+from formatting import compact, inr, number, signed_percent
+
+
+def render(ctx):
+    df, order_rollups, years = ctx.df, ctx.order_rollups, ctx.years
+    st.markdown("## 💰 Advanced Revenue Trends & Quarterly Analysis")
+    
+    # Year selection
+    selected_year = st.selectbox("📅 Select Year:", ["All"] + [str(y) for y in years])
+    
+    if selected_year != "All":
+        available_years = [int(selected_year)]
+    else:
+        available_years = sorted(df['Year'].unique())
+    
+    # ==========================================
+    # MONTHLY TREND ANALYSIS (Enhanced)
+    # ==========================================
+    st.markdown("### 📈 Monthly Trend Analysis")
+    
+    # Monthly totals with Period and MoM growth, kept up to date as orders arrive
+    trend_year = int(selected_year) if selected_year != "All" else None
+    monthly_data = order_rollups.months(trend_year)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Revenue Trend with Growth Indicators
+        fig_rev = go.Figure()
+        
+        fig_rev.add_trace(go.Scatter(
+            x=monthly_data['Period'], 
+            y=monthly_data['Total_Amount'],
+            mode='lines+markers+text',
+            name='Revenue',
+            line=dict(color='#2E86AB', width=3),
+            marker=dict(size=8),
+            text=compact(monthly_data['Total_Amount']),
+            textposition='top center',
+            textfont=dict(size=9),
+            fill='tozeroy',
+            fillcolor='rgba(46, 134, 171, 0.2)'
+        ))
+        
+        fig_rev.update_layout(
+            title="Monthly Revenue Trend",
+            xaxis_title="Month",
+            yaxis_title=f"Revenue ({CURRENCY})",
+            height=400,
+            hovermode='x unified',
+            showlegend=False
+        )
+        st.plotly_chart(fig_rev, use_container_width=True)
+    
+    with col2:
+        # Order Count with Secondary Trend
+        fig_ord = go.Figure()
+        
+        fig_ord.add_trace(go.Bar(
+            x=monthly_data['Period'], 
+            y=monthly_data['Inquiry_No'],
+            name='Orders',
+            marker_color='#A23B72',
+            text=monthly_data['Inquiry_No'].astype(int),
+            textposition='outside'
+        ))
+        
+        # Add trend line
+        fig_ord.add_trace(go.Scatter(
+            x=monthly_data['Period'], 
+            y=monthly_data['Inquiry_No'],
+            mode='lines',
+            name='Trend',
+            line=dict(color='#F18F01', width=2, dash='dash')
+        ))
+        
+        fig_ord.update_layout(
+            title="Monthly Order Count",
+            xaxis_title="Month",
+            yaxis_title="Number of Orders",
+            height=400,
+            showlegend=True,
+            legend=dict(orientation="h", yanchor="bottom", y=1.02)
+        )
+        st.plotly_chart(fig_ord, use_container_width=True)
+    
+    # Monthly Growth Metrics
+    if len(monthly_data) > 1:
+        st.markdown("#### 📊 Monthly Growth Metrics")
+        latest_month = monthly_data.iloc[-1]
+        prev_month = monthly_data.iloc[-2]
+        
+        m_cols = st.columns(4)
+        with m_cols[0]:
+            rev_growth = latest_month['Revenue_Growth']
+            st.metric(
+                "Revenue Growth (MoM)",
+                f"{rev_growth:+.1f}%" if pd.notna(rev_growth) else "N/A",
+                f"{CURRENCY}{latest_month['Total_Amount'] - prev_month['Total_Amount']:,.0f}" if pd.notna(rev_growth) else "",
+                delta_color="normal" if pd.notna(rev_growth) and rev_growth > 0 else "inverse" if pd.notna(rev_growth) else "off"
+            )
+        with m_cols[1]:
+            ord_growth = latest_month['Orders_Growth']
+            st.metric(
+                "Orders Growth (MoM)",
+                f"{ord_growth:+.1f}%" if pd.notna(ord_growth) else "N/A",
+                f"{int(latest_month['Inquiry_No'] - prev_month['Inquiry_No'])} orders" if pd.notna(ord_growth) else "",
+                delta_color="normal" if pd.notna(ord_growth) and ord_growth > 0 else "inverse" if pd.notna(ord_growth) else "off"
+            )
+        with m_cols[2]:
+            st.metric(
+                "Avg Monthly Revenue",
+                f"{CURRENCY}{monthly_data['Total_Amount'].mean():,.0f}",
+                f"Peak: {CURRENCY}{monthly_data['Total_Amount'].max():,.0f}"
+            )
+        with m_cols[3]:
+            best_month = monthly_data.loc[monthly_data['Total_Amount'].idxmax(), 'Period']
+            st.metric(
+                "Best Month",
+                best_month.strftime('%b %Y'),
+                f"{CURRENCY}{monthly_data['Total_Amount'].max():,.0f}"
+            )
+    
+    # ==========================================
+    # QUARTERLY ANALYSIS (Enhanced)
+    # ==========================================
+    st.markdown("---")
+    st.markdown("### 📊 Quarterly Performance Deep Dive")
+    
+    # Quarter label, AOV, QoQ growth and cumulative revenue come with the rollup
+    quarterly = order_rollups.quarters(trend_year)
+    
+    # Quarterly KPI Cards
+    st.markdown("#### 🎯 Quarterly Key Metrics")
+    
+    # Create columns for each quarter found
+    q_cols = st.columns(len(quarterly))
+    for idx, (_, row) in enumerate(quarterly.iterrows()):
+        with q_cols[idx]:
+            st.markdown(f"**{row['Quarter_Label']}**")
+            st.metric(
+                "Revenue",
+                f"{CURRENCY}{row['Total_Amount']:,.0f}",
+                None
+            )
+            st.metric(
+                "Orders",
+                f"{int(row['Inquiry_No'])}",
+                None
+            )
+            st.metric(
+                "AOV",
+                f"{CURRENCY}{row['Avg_Order_Value']:,.0f}",
+                None
+            )
+    
+    # Quarter-over-Quarter Analysis
+    if len(quarterly) > 1:
+        st.markdown("#### 📈 Quarter-over-Quarter Growth")
+        
+        qoq_cols = st.columns(min(len(quarterly)-1, 4))
+        for i in range(1, len(quarterly)):
+            if i-1 < len(qoq_cols):
+                with qoq_cols[i-1]:
+                    curr = quarterly.iloc[i]
+                    prev = quarterly.iloc[i-1]
+                    rev_growth = curr['QoQ_Revenue_Growth']
+                    
+                    st.metric(
+                        label=f"{prev['Quarter_Label']} → {curr['Quarter_Label']}",
+                        value=f"{rev_growth:+.1f}%" if pd.notna(rev_growth) else "N/A",
+                        delta=f"{CURRENCY}{curr['Total_Amount'] - prev['Total_Amount']:,.0f}" if pd.notna(rev_growth) else "",
+                        delta_color="normal" if pd.notna(rev_growth) and rev_growth > 0 else "inverse"
+                    )
+    
+    # Quarterly Visualizations
+    st.markdown("#### 📊 Quarterly Visualizations")
+    
+    col_q1, col_q2 = st.columns(2)
+    
+    with col_q1:
+        # Quarterly Revenue Trend
+        fig_qtr = go.Figure()
+        
+        colors_q = px.colors.qualitative.Prism[:len(quarterly)]
+        
+        fig_qtr.add_trace(go.Bar(
+            x=quarterly['Quarter_Label'],
+            y=quarterly['Total_Amount'],
+            marker_color=colors_q,
+            text=compact(quarterly['Total_Amount']),
+            textposition='outside'
+        ))
+        
+        # Add trend line
+        fig_qtr.add_trace(go.Scatter(
+            x=quarterly['Quarter_Label'],
+            y=quarterly['Total_Amount'],
+            mode='lines+markers',
+            line=dict(color='red', width=2),
+            marker=dict(size=10),
+            name='Trend'
+        ))
+        
+        fig_qtr.update_layout(
+            title="Quarterly Revenue Trend",
+            xaxis_title="Quarter",
+            yaxis_title=f"Revenue ({CURRENCY})",
+            height=400,
+            showlegend=False,
+            xaxis_tickangle=-45
+        )
+        st.plotly_chart(fig_qtr, use_container_width=True)
+    
+    with col_q2:
+        # Quarterly Orders vs AOV
+        fig_q_combo = make_subplots(specs=[[{"secondary_y": True}]])
+        
+        fig_q_combo.add_trace(
+            go.Bar(
+                x=quarterly['Quarter_Label'],
+                y=quarterly['Inquiry_No'],
+                name="Orders",
+                marker_color='lightblue',
+                text=quarterly['Inquiry_No'].astype(int),
+                textposition='outside'
+            ),
+            secondary_y=False
+        )
+        
+        fig_q_combo.add_trace(
+            go.Scatter(
+                x=quarterly['Quarter_Label'],
+                y=quarterly['Avg_Order_Value'],
+                name="AOV",
+                mode='lines+markers',
+                line=dict(color='darkred', width=3),
+                marker=dict(size=10)
+            ),
+            secondary_y=True
+        )
+        
+        fig_q_combo.update_layout(
+            title="Orders vs Average Order Value by Quarter",
+            height=400,
+            legend=dict(orientation="h", yanchor="bottom", y=1.02),
+            xaxis_tickangle=-45
+        )
+        fig_q_combo.update_yaxes(title_text="Number of Orders", secondary_y=False)
+        fig_q_combo.update_yaxes(title_text=f"Avg Order Value ({CURRENCY})", secondary_y=True)
+        
+        st.plotly_chart(fig_q_combo, use_container_width=True)
+    
+    # Quarterly Comparison Table
+    st.markdown("#### 📋 Quarterly Performance Table")
+    
+    # Prepare display table
+    display_qtr = quarterly[['Quarter_Label', 'Total_Amount', 'Inquiry_No', 'Avg_Order_Value', 'QoQ_Revenue_Growth']].copy()
+    display_qtr.columns = ['Quarter', 'Revenue', 'Orders', 'AOV', 'QoQ Growth']
+    
+    # Format columns
+    display_qtr['Revenue'] = inr(display_qtr['Revenue'])
+    display_qtr['Orders'] = number(display_qtr['Orders'], grouping=False)
+    display_qtr['AOV'] = inr(display_qtr['AOV'])
+    display_qtr['QoQ Growth'] = signed_percent(display_qtr['QoQ Growth'])
+    
+    st.table(display_qtr.set_index('Quarter'))
+    
+    # Year-over-Year Quarterly Comparison (if multiple years selected)
+    if len(available_years) > 1:
+        st.markdown("#### 🔄 Year-over-Year Quarterly Comparison")
+        
+        # Pivot for comparison
+        qtr_pivot = quarterly.pivot(index='Quarter', columns='Year', values='Total_Amount').fillna(0)
+        
+        fig_yoy = go.Figure()
+        
+        colors_yoy = px.colors.qualitative.Set2[:len(available_years)]
+        for idx, year in enumerate(available_years):
+            if year in qtr_pivot.columns:
+                fig_yoy.add_trace(go.Bar(
+                    name=str(year),
+                    x=['Q1', 'Q2', 'Q3', 'Q4'],
+                    y=qtr_pivot[year],
+                    marker_color=colors_yoy[idx],
+                    text=compact(qtr_pivot[year].where(qtr_pivot[year] > 0), na=''),
+                    textposition='outside'
+                ))
+        
+        fig_yoy.update_layout(
+            title="Quarterly Revenue Comparison Across Years",
+            xaxis_title="Quarter",
+            yaxis_title=f"Revenue ({CURRENCY})",
+            barmode='group',
+            height=450,
+            legend=dict(orientation="h", yanchor="bottom", y=1.02)
+        )
+        st.plotly_chart(fig_yoy, use_container_width=True)
+        
+        # YoY Growth by Quarter
+        if len(available_years) == 2:
+            y1, y2 = available_years
+            if y1 in qtr_pivot.columns and y2 in qtr_pivot.columns:
+                st.markdown(f"**{y1} vs {y2} Quarterly Growth:**")
+                yoy_cols = st.columns(4)
+                for q in [1, 2, 3, 4]:
+                    if q in qtr_pivot.index:
+                        val_prev = qtr_pivot.loc[q, y1]
+                        val_curr = qtr_pivot.loc[q, y2]
+                        if val_prev > 0:
+                            growth = ((val_curr - val_prev) / val_prev * 100)
+                            with yoy_cols[q-1]:
+                                st.metric(
+                                    f"Q{q} Growth",
+                                    f"{growth:+.1f}%",
+                                    f"{CURRENCY}{val_curr - val_prev:,.0f}",
+                                    delta_color="normal" if growth > 0 else "inverse"
+                                )
+    
+    # Quarterly Insights Summary
+    st.markdown("#### 🎯 Quarterly Insights")
+    
+    best_qtr = quarterly.loc[quarterly['Total_Amount'].idxmax()]
+    worst_qtr = quarterly.loc[quarterly['Total_Amount'].idxmin()]
+    avg_qtr_revenue = quarterly['Total_Amount'].mean()
+    
+    insight_cols = st.columns(3)
+    with insight_cols[0]:
+        st.metric(
+            "🏆 Best Quarter",
+            best_qtr['Quarter_Label'],
+            f"{CURRENCY}{best_qtr['Total_Amount']:,.0f}"
+        )
+    with insight_cols[1]:
+        st.metric(
+            "📉 Lowest Quarter",
+            worst_qtr['Quarter_Label'],
+            f"{CURRENCY}{worst_qtr['Total_Amount']:,.0f}"
+        )
+    with insight_cols[2]:
+        st.metric(
+            "📊 Quarterly Average",
+            f"{CURRENCY}{avg_qtr_revenue:,.0f}",
+            f"Total: {CURRENCY}{quarterly['Total_Amount'].sum():,.0f}"
+        )
+    
+    # Cumulative Trend
+    st.markdown("#### 📈 Cumulative Revenue Trend")
+    
+    fig_cum = go.Figure()
+    fig_cum.add_trace(go.Scatter(
+        x=quarterly['Quarter_Label'],
+        y=quarterly['Cumulative_Revenue'],
+        mode='lines+markers+text',
+        fill='tozeroy',
+        line=dict(color='green', width=3),
+        marker=dict(size=10),
+        text=compact(quarterly['Cumulative_Revenue']),
+        textposition='top center'
+    ))
+    
+    fig_cum.update_layout(
+        height=400,
+        xaxis_title="Quarter",
+        yaxis_title=f"Cumulative Revenue ({CURRENCY})",
+        showlegend=False,
+        xaxis_tickangle=-45
+    )
+    st.plotly_chart(fig_cum, use_container_width=True)
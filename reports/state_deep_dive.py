@@ -0,0 +1,492 @@
+"""State-wise Deep Dive report"""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from config import CURRENCY
+from formatting import inr_column, number_column
+
+
+def highlight_top3(row):
+    if row['Rank'] == 1:
+        return ['background-color: gold'] * len(row)
+    elif row['Rank'] == 2:
+        return ['background-color: silver'] * len(row)
+    elif row['Rank'] == 3:
+        return ['background-color: #CD7F32'] * len(row)  # Bronze
+    return [''] * len(row)
+
+
+def render(ctx):
+    order_cube, order_queries, memo, chart = ctx.order_cube, ctx.order_queries, ctx.memo, ctx.chart
+    st.markdown("## 🗺️ Comprehensive State Analysis")
+    st.markdown("---")
+    
+    # Validate available years
+    available_years = sorted(ctx.years)
+    target_years = [2024, 2025, 2026]
+    valid_years = [year for year in target_years if year in available_years]
+    
+    if not valid_years:
+        st.error("No data available for years 2024-2026. Please check your data.")
+        st.stop()
+    
+    # Year Selector - Horizontal layout
+    col_year, col_metric = st.columns([1, 2])
+    with col_year:
+        selected_years = st.multiselect(
+            "📅 Select Years:", 
+            valid_years, 
+            default=valid_years,
+            help="Compare performance across multiple years"
+        )
+    
+    if not selected_years:
+        st.warning("⚠️ Please select at least one year")
+        st.stop()
+    
+    with col_metric:
+        comparison_metric = st.radio(
+            "📊 Comparison Metric:",
+            ["Revenue (Total_Amount)", "Quantity (Qty)", "Orders (Count)"],
+            horizontal=True,
+            help="Choose metric for state comparisons"
+        )
+    
+    # State selector with search and multi-select
+    states = order_cube.values('State', Year=selected_years)
+    
+    col_state, col_view = st.columns([2, 1])
+    with col_state:
+        selected_states = st.multiselect(
+            "🗺️ Select States to Compare:", 
+            states, 
+            default=states[:min(5, len(states))],
+            help="Select multiple states for comparative analysis"
+        )
+    
+    if not selected_states:
+        st.warning("⚠️ Please select at least one state")
+        st.stop()
+    
+    with col_view:
+        view_type = st.selectbox(
+            "👁️ View Mode:",
+            ["Combined View", "Year-over-Year", "Side-by-Side"],
+            help="Choose how to visualize multi-year data"
+        )
+    
+    # Roll-ups below come from the cube with the same filters
+    cube_filters = dict(Year=selected_years, State=selected_states)
+    cube_columns = {'Revenue': 'Total_Amount', 'Transactions': 'Orders'}
+    
+    # Create tabs for different analysis views
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "📊 Overview & Rankings", 
+        "📈 Trends & Growth", 
+        "🎯 Product Breakdown", 
+        "🔥 Year-wise Heatmap"
+    ])
+    
+    # Metric mapping for dynamic calculations
+    metric_map = {
+        "Revenue (Total_Amount)": ("Total_Amount", "sum", CURRENCY),
+        "Quantity (Qty)": ("Qty", "sum", ""),
+        "Orders (Count)": ("Inquiry_No", "count", "")
+    }
+    
+    metric_col, agg_func, currency_symbol = metric_map[comparison_metric]
+    
+    with tab1:
+        st.markdown("### 📊 State Performance Overview")
+        
+        if view_type == "Combined View":
+            # Aggregate across all selected years
+            state_summary = order_cube.rollup('State', distinct=['Year'], **cube_filters).rename(
+                columns={**cube_columns, 'Year': 'Active_Years'}
+            )[['Total_Amount', 'Qty', 'Orders', 'Active_Years']].reset_index()
+            
+            # Calculate averages per year
+            state_summary['Avg_Revenue_Per_Year'] = state_summary['Total_Amount'] / state_summary['Active_Years']
+            
+            col_chart, col_table = st.columns([3, 2])
+            
+            with col_chart:
+                # Dual-axis bar chart
+                fig = go.Figure()
+                
+                # Determine which column to use based on metric
+                if metric_col == 'Inquiry_No':
+                    y_values = state_summary['Orders']
+                elif metric_col == 'Qty':
+                    y_values = state_summary['Qty']
+                else:
+                    y_values = state_summary['Total_Amount']
+                
+                # Primary metric bars
+                fig.add_trace(go.Bar(
+                    name=comparison_metric.split('(')[0].strip(),
+                    x=state_summary['State'],
+                    y=y_values,
+                    marker_color='royalblue',
+                    opacity=0.8
+                ))
+                
+                # Secondary metric line (Revenue always shown as reference)
+                if metric_col != 'Total_Amount':
+                    fig.add_trace(go.Scatter(
+                        name='Revenue Trend',
+                        x=state_summary['State'],
+                        y=state_summary['Total_Amount'],
+                        mode='lines+markers',
+                        yaxis='y2',
+                        line=dict(color='firebrick', width=3),
+                        marker=dict(size=8)
+                    ))
+                
+                fig.update_layout(
+                    title=f'State Comparison: {comparison_metric}',
+                    xaxis_title="State",
+                    yaxis_title=comparison_metric,
+                    yaxis2=dict(
+                        title="Revenue",
+                        overlaying='y',
+                        side='right',
+                        showgrid=False
+                    ),
+                    barmode='group',
+                    height=500,
+                    template='plotly_white',
+                    legend=dict(orientation="h", yanchor="bottom", y=1.02)
+                )
+                
+                st.plotly_chart(fig, use_container_width=True)
+            
+            with col_table:
+                st.markdown("### 🏆 State Rankings")
+                
+                # Determine ranking column
+                if metric_col == 'Inquiry_No':
+                    rank_col = 'Orders'
+                elif metric_col == 'Qty':
+                    rank_col = 'Qty'
+                else:
+                    rank_col = 'Total_Amount'
+                
+                state_summary['Rank'] = state_summary[rank_col].rank(ascending=False)
+                
+                # Format display
+                display_df = state_summary.sort_values(rank_col, ascending=False)
+                
+                st.dataframe(
+                    display_df.style.apply(highlight_top3, axis=1),
+                    column_config={
+                        'Total_Amount': inr_column(),
+                        'Qty': number_column(),
+                        'Orders': number_column(),
+                        'Avg_Revenue_Per_Year': inr_column()
+                    },
+                    use_container_width=True,
+                    height=400
+                )
+        
+        elif view_type == "Year-over-Year":
+            # FIXED: Proper aggregation for year-over-year comparison
+            yearly_state = order_cube.rollup(['State', 'Year'], **cube_filters).rename(columns=cube_columns)
+            yearly_state = yearly_state['Orders' if metric_col == 'Inquiry_No' else metric_col].reset_index(name='Value')
+            
+            # Create the line chart
+            fig = px.line(
+                yearly_state, 
+                x='Year', 
+                y='Value', 
+                color='State',
+                markers=True,
+                title=f'Year-over-Year {comparison_metric} Comparison',
+                template='plotly_white',
+                labels={'Value': comparison_metric.split('(')[0].strip()}
+            )
+            
+            # Ensure x-axis shows only selected years as integers
+            fig.update_layout(
+                height=500, 
+                xaxis=dict(
+                    tickmode='array', 
+                    tickvals=selected_years,
+                    dtick=1
+                )
+            )
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Growth rate calculation
+            if len(selected_years) > 1:
+                st.markdown("### 📈 Growth Analysis")
+                growth_data = []
+                
+                for state in selected_states:
+                    state_data = yearly_state[yearly_state['State'] == state].sort_values('Year')
+                    if len(state_data) > 1:
+                        first_val = state_data.iloc[0]['Value']
+                        last_val = state_data.iloc[-1]['Value']
+                        growth = ((last_val - first_val) / first_val * 100) if first_val != 0 else 0
+                        growth_data.append({
+                            'State': state,
+                            'First_Year': int(state_data.iloc[0]['Year']),
+                            'Last_Year': int(state_data.iloc[-1]['Year']),
+                            'First_Value': first_val,
+                            'Last_Value': last_val,
+                            'Growth_Rate': f"{growth:+.1f}%",
+                            'Trend': '📈' if growth > 0 else '📉' if growth < 0 else '➡️'
+                        })
+                
+                if growth_data:
+                    growth_df = pd.DataFrame(growth_data)
+                    st.dataframe(
+                        growth_df,
+                        column_config={
+                            'First_Value': number_column(),
+                            'Last_Value': number_column()
+                        },
+                        use_container_width=True
+                    )
+        
+        else:  # Side-by-Side
+            cols = st.columns(len(selected_years))
+            for idx, year in enumerate(selected_years):
+                with cols[idx]:
+                    st.markdown(f"### {year}")
+                    year_data = order_cube.rollup('State', Year=year, State=selected_states).rename(
+                        columns=cube_columns
+                    )[['Total_Amount', 'Qty', 'Orders']]
+                    
+                    # Determine y-axis column
+                    if metric_col == 'Inquiry_No':
+                        y_col = 'Orders'
+                    elif metric_col == 'Qty':
+                        y_col = 'Qty'
+                    else:
+                        y_col = 'Total_Amount'
+                    
+                    fig = chart('state_year_bar', lambda: px.bar(
+                        year_data.reset_index(), 
+                        x='State', 
+                        y=y_col,
+                        color='State',
+                        title=f'{year} Performance',
+                        template='plotly_white',
+                        labels={y_col: comparison_metric.split('(')[0].strip()}
+                    ).update_layout(showlegend=False, height=300), year_data,
+                        y_col=y_col, year=year, comparison_metric=comparison_metric)
+                    st.plotly_chart(fig, use_container_width=True)
+    
+    with tab2:
+        st.markdown("### 📈 Temporal Trends Analysis")
+        
+        # Determine metric for top states calculation (cube column)
+        calc_col = 'Orders' if metric_col == 'Inquiry_No' else metric_col
+        
+        # Get top 3 states based on selected metric
+        state_totals = order_cube.rollup('State', **cube_filters).rename(columns=cube_columns)
+        top_states = state_totals[calc_col].nlargest(3).index.tolist()
+        
+        col_trend, col_seasonal = st.columns([2, 1])
+        
+        with col_trend:
+            st.markdown("#### Monthly Trends (Top 3 States)")
+            
+            for state in top_states:
+                # Aggregate monthly data
+                monthly = order_cube.rollup('Year_Month', Year=selected_years, State=state).rename(columns=cube_columns)
+                monthly = monthly[calc_col].rename_axis('Date').reset_index(name='Value')
+                
+                monthly['Date'] = monthly['Date'].dt.to_timestamp()
+                
+                # Create filled area chart
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    x=monthly['Date'],
+                    y=monthly['Value'],
+                    fill='tozeroy',
+                    name=state,
+                    line=dict(width=2),
+                    mode='lines'
+                ))
+                
+                fig.update_layout(
+                    title=f"{state} - Monthly {comparison_metric}",
+                    height=250,
+                    template='plotly_white',
+                    showlegend=False,
+                    margin=dict(l=20, r=20, t=40, b=20),
+                    xaxis_title="Month",
+                    yaxis_title=comparison_metric.split('(')[0].strip()
+                )
+                st.plotly_chart(fig, use_container_width=True)
+        
+        with col_seasonal:
+            st.markdown("#### 🎯 Quick Insights")
+            
+            # Calculate metrics for insights
+            # Exact distinct orders from the query backend, the cube's would be an estimate
+            total_revenue = order_cube.totals(**cube_filters)['Revenue']
+            total_orders = memo('distinct_orders', lambda: order_queries.distinct('Inquiry_No', **cube_filters),
+                                **cube_filters)
+            avg_order_value = total_revenue / total_orders if total_orders > 0 else 0
+            
+            st.metric("Total Revenue (Selected)", f"{CURRENCY}{total_revenue:,.0f}")
+            st.metric("Total Orders", f"{total_orders:,}")
+            st.metric("Avg Order Value", f"{CURRENCY}{avg_order_value:,.0f}")
+            
+            # Best performing state
+            best_state = state_totals['Total_Amount'].idxmax()
+            best_revenue = state_totals['Total_Amount'].max()
+            st.success(f"🏆 Top State: **{best_state}**  \nRevenue: {CURRENCY}{best_revenue:,.0f}")
+    
+    with tab3:
+        st.markdown("### 🎯 Product Distribution Analysis")
+        
+        col_prod1, col_prod2 = st.columns([1, 2])
+        
+        with col_prod1:
+            selected_state_detail = st.selectbox(
+                "🔍 Select State for Deep Dive:", 
+                selected_states,
+                help="Choose one state to analyze product performance"
+            )
+            
+            analysis_type = st.radio(
+                "Chart Type:",
+                ["Sunburst", "Treemap", "Bar Chart"],
+                help="Choose visualization type for product hierarchy"
+            )
+        
+        if selected_state_detail:
+            state_products = order_cube.rollup(
+                ['Product', 'Year'], State=selected_state_detail, Year=selected_years,
+            )[['Revenue', 'Qty', 'Transactions']].rename(columns=cube_columns).reset_index()
+            
+            with col_prod2:
+                if analysis_type == "Sunburst":
+                    # Sunburst chart with Year and Product hierarchy
+                    fig = px.sunburst(
+                        state_products,
+                        path=['Year', 'Product'],
+                        values='Total_Amount',
+                        color='Total_Amount',
+                        color_continuous_scale='RdYlBu',
+                        title=f'Product Hierarchy in {selected_state_detail} (by Revenue)',
+                        template='plotly_white'
+                    )
+                    fig.update_layout(height=600)
+                    
+                elif analysis_type == "Treemap":
+                    fig = px.treemap(
+                        state_products,
+                        path=[px.Constant(selected_state_detail), 'Year', 'Product'],
+                        values='Total_Amount',
+                        color='Qty',
+                        color_continuous_scale='Viridis',
+                        title=f'Product Distribution in {selected_state_detail}',
+                        template='plotly_white'
+                    )
+                    fig.update_traces(root_color="lightgrey")
+                    fig.update_layout(height=600)
+                    
+                else:  # Bar Chart
+                    top_products = state_products.groupby('Product', observed=True)['Total_Amount'].sum().nlargest(15).reset_index()
+                    fig = chart('state_top_products_bar', lambda: px.bar(
+                        top_products,
+                        x='Total_Amount',
+                        y='Product',
+                        orientation='h',
+                        color='Total_Amount',
+                        color_continuous_scale='Blues',
+                        title=f'Top 15 Products in {selected_state_detail}',
+                        template='plotly_white',
+                        labels={'Total_Amount': f'Revenue ({CURRENCY})'}
+                    ).update_layout(height=600, yaxis=dict(autorange="reversed")), top_products,
+                        selected_state_detail=selected_state_detail)
+                
+                st.plotly_chart(fig, use_container_width=True)
+            
+            # Product performance table
+            st.markdown("#### 📋 Detailed Product Performance")
+            product_summary = state_products.groupby('Product', observed=True).agg({
+                'Total_Amount': 'sum',
+                'Qty': 'sum',
+                'Orders': 'sum',
+                'Year': lambda x: ', '.join(map(str, sorted(x.unique())))
+            }).rename(columns={
+                'Year': 'Active_Years'
+            }).sort_values('Total_Amount', ascending=False).head(15)
+            
+            st.dataframe(
+                product_summary,
+                column_config={
+                    'Total_Amount': inr_column(),
+                    'Qty': number_column(),
+                    'Orders': number_column()
+                },
+                use_container_width=True
+            )
+    
+    with tab4:
+        st.markdown("### 🔥 Year-wise Performance Heatmap")
+        
+        # Create pivot table for heatmap
+        heatmap_data = order_cube.rollup(['State', 'Year'], **cube_filters)['Revenue'].rename('Total_Amount').reset_index()
+        heatmap_pivot = heatmap_data.pivot(index='State', columns='Year', values='Total_Amount').fillna(0)
+        
+        # Ensure all selected years are present
+        for year in selected_years:
+            if year not in heatmap_pivot.columns:
+                heatmap_pivot[year] = 0
+        
+        # Sort columns to ensure chronological order
+        heatmap_pivot = heatmap_pivot[sorted(selected_years)]
+        
+        fig = chart('state_year_heatmap', lambda: px.imshow(
+            heatmap_pivot,
+            labels=dict(x="Year", y="State", color="Revenue"),
+            x=[str(year) for year in sorted(selected_years)],
+            y=heatmap_pivot.index,
+            color_continuous_scale="YlOrRd",
+            aspect="auto",
+            title="Revenue Heatmap: States vs Years",
+            template='plotly_white'
+        ).update_traces(
+            # Add text annotations
+            text=[[f"{CURRENCY}{val:,.0f}" for val in row] for row in heatmap_pivot.values],
+            texttemplate="%{text}",
+            textfont={"size": 10}
+        ).update_layout(height=max(400, len(selected_states) * 40)),
+            heatmap_pivot, selected_years=selected_years, n_states=len(selected_states))
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Year-over-Year growth heatmap
+        if len(selected_years) > 1:
+            st.markdown("### 📊 Year-over-Year Growth Rates (%)")
+            
+            # Calculate percentage change
+            growth_pivot = heatmap_pivot.pct_change(axis=1) * 100
+            growth_pivot = growth_pivot.iloc[:, 1:]  # Remove first year (NaN)
+            
+            if not growth_pivot.empty and not growth_pivot.isna().all().all():
+                fig_growth = chart('state_growth_heatmap', lambda: px.imshow(
+                    growth_pivot,
+                    labels=dict(x="Year", y="State", color="Growth %"),
+                    color_continuous_scale="RdYlGn",
+                    color_continuous_midpoint=0,
+                    aspect="auto",
+                    title="YoY Growth Rate Heatmap (%)",
+                    template='plotly_white'
+                ).update_traces(
+                    # Add percentage text
+                    text=[[f"{val:.1f}%" if not pd.isna(val) else "N/A" for val in row] for row in growth_pivot.values],
+                    texttemplate="%{text}",
+                    textfont={"size": 10}
+                ).update_layout(height=max(400, len(selected_states) * 40)),
+                    growth_pivot, n_states=len(selected_states))
+                st.plotly_chart(fig_growth, use_container_width=True)
+            else:
+                st.info("Insufficient data for growth calculation")
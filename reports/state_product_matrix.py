@@ -0,0 +1,30 @@
+"""State vs Product Matrix report"""
+import plotly.express as px
+import streamlit as st
+
+
+def render(ctx):
+    df, memo, chart = ctx.df, ctx.memo, ctx.chart
+    st.markdown("## 🗺️ State-Product Correlation Matrix")
+    
+    # Create pivot table
+    pivot = memo('state_product_pivot', lambda: df.pivot_table(
+        values='Total_Amount', index='Product', columns='State', aggfunc='sum', fill_value=0, observed=True))
+    
+    # Filter options
+    min_revenue = st.slider("💰 Minimum Revenue Threshold:", 0, int(df['Total_Amount'].max()), 100000)
+    
+    # Filter pivot
+    pivot_filtered = pivot[pivot.sum(axis=1) > min_revenue]
+    
+    # Heatmap
+    fig = chart('state_product_heatmap', lambda: px.imshow(pivot_filtered, 
+                    labels=dict(x="State", y="Product", color="Revenue"),
+                    aspect="auto",
+                    color_continuous_scale='YlOrRd').update_layout(height=600), pivot_filtered)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("### 📊 Top State-Product Combinations")
+    top_combos = memo('state_product_top20', lambda: df.groupby(
+        ['State', 'Product'], observed=True)['Total_Amount'].sum().nlargest(20).reset_index())
+    st.dataframe(top_combos, use_container_width=True)
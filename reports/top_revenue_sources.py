@@ -0,0 +1,377 @@
+"""Top Revenue Sources report"""
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from config import CURRENCY
+from formatting import compact, inr, percent
+
+
+def render(ctx):
+    df, order_cube, chart = ctx.df, ctx.order_cube, ctx.chart
+    st.markdown("## 💰 Revenue Contribution & Distribution Analysis")
+    
+    # Get available years for dropdown
+    available_years = sorted(df['Year'].unique())
+    
+    # Year selection dropdown
+    col_year, col_view = st.columns([1, 2])
+    
+    with col_year:
+        year_option = st.selectbox(
+            "📅 Select Year:",
+            ["All Years"] + [str(y) for y in available_years],
+            help="Filter data by specific year or view all time"
+        )
+    
+    with col_view:
+        view_mode = st.selectbox(
+            "👁️ View Mode:",
+            ["Summary View", "Detailed Analysis", "Trend View"],
+            help="Choose display mode"
+        )
+    
+    # Filter data based on year selection
+    if year_option != "All Years":
+        selected_year = int(year_option)
+        analysis_df = df[df['Year'] == selected_year]
+        period_label = f" ({selected_year})"
+    else:
+        analysis_df = df
+        period_label = ""
+    
+    # Calculate contributions (roll-ups from the cube)
+    cube_year = selected_year if year_option != "All Years" else None
+    total_revenue = order_cube.totals(Year=cube_year)['Revenue']
+    
+    # State contribution
+    state_revenue = order_cube.rollup('State', Year=cube_year)[
+        ['Revenue', 'Transactions', 'AvgOrder', 'Qty']
+    ].round(2)
+    state_revenue.columns = ['Revenue', 'Orders', 'Avg_Order', 'Quantity']
+    state_revenue = state_revenue.sort_values('Revenue', ascending=False)
+    state_revenue['Revenue_Pct'] = (state_revenue['Revenue'] / total_revenue * 100).round(2)
+    state_revenue['Cumulative_Pct'] = state_revenue['Revenue_Pct'].cumsum().round(2)
+    
+    # Product contribution
+    product_revenue = order_cube.rollup('Product', distinct=['State'], Year=cube_year)[
+        ['Revenue', 'Transactions', 'Qty', 'State']
+    ].round(2)
+    product_revenue.columns = ['Revenue', 'Orders', 'Quantity', 'States_Presence']
+    product_revenue = product_revenue.sort_values('Revenue', ascending=False)
+    product_revenue['Revenue_Pct'] = (product_revenue['Revenue'] / total_revenue * 100).round(2)
+    product_revenue['Cumulative_Pct'] = product_revenue['Revenue_Pct'].cumsum().round(2)
+    
+    # Customer contribution (NEW FEATURE)
+    customer_revenue = order_cube.rollup('Company', distinct=['State', 'Product'], Year=cube_year)[
+        ['Revenue', 'Transactions', 'AvgOrder', 'Qty', 'State', 'Product']
+    ].round(2)
+    customer_revenue.columns = ['Revenue', 'Orders', 'Avg_Order', 'Quantity', 'States', 'Products']
+    customer_revenue = customer_revenue.sort_values('Revenue', ascending=False)
+    customer_revenue['Revenue_Pct'] = (customer_revenue['Revenue'] / total_revenue * 100).round(2)
+    customer_revenue['Cumulative_Pct'] = customer_revenue['Revenue_Pct'].cumsum().round(2)
+    
+    # TOP SUMMARY CARDS
+    st.markdown(f"### 📊 Market Overview{period_label}")
+    cols = st.columns(4)
+    with cols[0]:
+        st.metric("🗺️ Total States", len(state_revenue))
+    with cols[1]:
+        st.metric("🔧 Total Products", len(product_revenue))
+    with cols[2]:
+        top_state = state_revenue.index[0]
+        st.metric("🏆 Top State", top_state, f"{state_revenue.iloc[0]['Revenue_Pct']:.1f}%")
+    with cols[3]:
+        top_product = product_revenue.index[0]
+        st.metric("⭐ Top Product", top_product[:20] + "..." if len(top_product) > 20 else top_product, 
+                 f"{product_revenue.iloc[0]['Revenue_Pct']:.1f}%")
+    
+    st.markdown("---")
+    
+    # View mode content
+    if view_mode == "Summary View":
+        # Your original visualization code
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 🗺️ Top 10 States")
+            fig_states = chart('top_states_bar', lambda: px.bar(
+                state_revenue.head(10).reset_index(),
+                x='Revenue',
+                y='State',
+                orientation='h',
+                color='Revenue_Pct',
+                color_continuous_scale='Viridis',
+                text=compact(state_revenue.head(10)['Revenue'], 'K', 0)
+            ).update_traces(textposition='outside').update_layout(yaxis=dict(autorange="reversed"), height=400),
+                state_revenue.head(10))
+            st.plotly_chart(fig_states, use_container_width=True)
+        
+        with col2:
+            st.markdown("#### 🔧 Top 10 Products")
+            fig_products = chart('top_products_bar', lambda: px.bar(
+                product_revenue.head(10).reset_index(),
+                x='Revenue',
+                y='Product',
+                orientation='h',
+                color='Revenue_Pct',
+                color_continuous_scale='Plasma',
+                text=compact(product_revenue.head(10)['Revenue'], 'K', 0)
+            ).update_traces(textposition='outside').update_layout(yaxis=dict(autorange="reversed"), height=400),
+                product_revenue.head(10))
+            st.plotly_chart(fig_products, use_container_width=True)
+    
+    elif view_mode == "Detailed Analysis":
+        # Detailed tables with formatting
+        col_det1, col_det2 = st.columns(2)
+        
+        with col_det1:
+            st.markdown(f"#### 📋 State Details{period_label}")
+            display_state = state_revenue.head(15).copy()
+            display_state['Revenue'] = inr(display_state['Revenue'])
+            display_state['Avg_Order'] = inr(display_state['Avg_Order'])
+            display_state['Revenue_Pct'] = percent(display_state['Revenue_Pct'], 2)
+            display_state['Cumulative_Pct'] = percent(display_state['Cumulative_Pct'], 2)
+            st.dataframe(display_state, use_container_width=True, height=400)
+        
+        with col_det2:
+            st.markdown(f"#### 📋 Product Details{period_label}")
+            display_product = product_revenue.head(15).copy()
+            display_product['Revenue'] = inr(display_product['Revenue'])
+            display_product['Revenue_Pct'] = percent(display_product['Revenue_Pct'], 2)
+            display_product['Cumulative_Pct'] = percent(display_product['Cumulative_Pct'], 2)
+            st.dataframe(display_product, use_container_width=True, height=400)
+        
+        # NEW: Top Customers section
+        st.markdown("---")
+        st.markdown(f"#### 👥 Top 10 Customers{period_label}")
+        display_customer = customer_revenue.head(10).copy()
+        display_customer['Revenue'] = inr(display_customer['Revenue'])
+        display_customer['Avg_Order'] = inr(display_customer['Avg_Order'])
+        display_customer['Revenue_Pct'] = percent(display_customer['Revenue_Pct'], 2)
+        st.dataframe(display_customer, use_container_width=True)
+    
+    else:  # Trend View
+        # Monthly trend analysis
+        st.markdown(f"#### 📈 Monthly Revenue Trend{period_label}")
+        
+        monthly_trend = analysis_df.groupby(analysis_df['Year_Month'].rename('Date'), observed=True).agg({
+            'Total_Amount': 'sum',
+            'Inquiry_No': 'count'
+        }).reset_index()
+        monthly_trend['Date'] = monthly_trend['Date'].dt.to_timestamp()
+        monthly_trend.columns = ['Month', 'Revenue', 'Orders']
+        
+        fig_trend = go.Figure()
+        fig_trend.add_trace(go.Scatter(
+            x=monthly_trend['Month'],
+            y=monthly_trend['Revenue'],
+            mode='lines+markers',
+            name='Revenue',
+            line=dict(width=3, color='royalblue'),
+            fill='tozeroy'
+        ))
+        
+        fig_trend.update_layout(
+            title=f"Revenue Trend{period_label}",
+            xaxis_title="Month",
+            yaxis_title=f"Revenue ({CURRENCY})",
+            height=450,
+            template='plotly_white'
+        )
+        st.plotly_chart(fig_trend, use_container_width=True)
+        
+        # Show monthly data table
+        st.markdown(f"#### 📊 Monthly Breakdown{period_label}")
+        monthly_display = monthly_trend.copy()
+        monthly_display['Revenue'] = inr(monthly_display['Revenue'])
+        monthly_display['Month'] = monthly_display['Month'].dt.strftime('%b %Y')
+        st.dataframe(monthly_display, use_container_width=True, hide_index=True)
+    
+    # Export section
+    st.markdown("---")
+    col_exp1, col_exp2, col_exp3 = st.columns(3)
+    
+    with col_exp1:
+        st.download_button(
+            "📥 Export States",
+            state_revenue.to_csv().encode('utf-8'),
+            f"state_revenue{period_label.replace(' ', '_')}.csv"
+        )
+    
+    with col_exp2:
+        st.download_button(
+            "📥 Export Products",
+            product_revenue.to_csv().encode('utf-8'),
+            f"product_revenue{period_label.replace(' ', '_')}.csv"
+        )
+    
+    with col_exp3:
+        st.download_button(
+            "📥 Export Customers",
+            customer_revenue.to_csv().encode('utf-8'),
+            f"customer_revenue{period_label.replace(' ', '_')}.csv"
+        )
+
+    
+    #9-10 Between but diffrent 
+    # ==========================================
+    # STATE-WISE CONTRIBUTION (ENHANCED)
+    # ==========================================
+    st.markdown("### 🗺️ State-wise Revenue Contribution")
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        # Top 10 States Table with Rankings
+        top_states = state_revenue.head(10).copy()
+        top_states['Rank'] = range(1, len(top_states) + 1)
+        
+        # Format for display
+        display_states = pd.DataFrame({
+            'Rank': top_states['Rank'],
+            'State': top_states.index,
+            'Revenue': inr(top_states['Revenue']),
+            'Market Share': percent(top_states['Revenue_Pct'], 2),
+            'Orders': top_states['Orders'].astype(int),
+            'Avg Order': inr(top_states['Avg_Order']),
+            'Cumulative %': percent(top_states['Cumulative_Pct'])
+        })
+        
+        st.table(display_states.set_index('Rank'))
+        
+        # State tier classification
+        st.markdown("#### 🏅 State Performance Tiers")
+        tier_cols = st.columns(3)
+        
+        # Classify states
+        star_states = state_revenue[state_revenue['Revenue_Pct'] >= 10]  # >10% share
+        growth_states = state_revenue[(state_revenue['Revenue_Pct'] >= 5) & (state_revenue['Revenue_Pct'] < 10)]
+        emerging_states = state_revenue[state_revenue['Revenue_Pct'] < 5]
+        
+        with tier_cols[0]:
+            st.markdown(f"**⭐ Star States (≥10%)**\n\n{len(star_states)} states")
+            for state in star_states.head(3).index:
+                st.write(f"• {state}")
+        
+        with tier_cols[1]:
+            st.markdown(f"**📈 Growth States (5-10%)**\n\n{len(growth_states)} states")
+            for state in growth_states.head(3).index:
+                st.write(f"• {state}")
+        
+        with tier_cols[2]:
+            st.markdown(f"**🌱 Emerging (<5%)**\n\n{len(emerging_states)} states")
+            st.write(f"Total: {len(emerging_states)} states")
+    
+    with col2:
+        # Enhanced Pie Chart with details
+        st.markdown("#### Revenue Distribution")
+        
+        # Show top 8 + others
+        top_8_states = state_revenue.head(8)
+        others_revenue = state_revenue.iloc[8:]['Revenue'].sum()
+        
+        pie_data = pd.DataFrame({
+            'State': list(top_8_states.index) + ['Others'],
+            'Revenue': list(top_8_states['Revenue']) + [others_revenue]
+        })
+        
+        fig = chart('top_states_share_pie', lambda: px.pie(pie_data, values='Revenue', names='State', hole=0.5,
+                    color_discrete_sequence=px.colors.sequential.Blues_r
+        ).update_traces(textinfo='percent+label', textposition='outside', 
+                         textfont_size=11, pull=[0.05 if i == 0 else 0 for i in range(len(pie_data))]
+        ).update_layout(height=500, showlegend=False,
+                         annotations=[dict(text=f'Top 8<br>States', x=0.5, y=0.5, font_size=14, showarrow=False)]),
+            pie_data)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # ==========================================
+    # PRODUCT-WISE CONTRIBUTION (NUMERIC FOCUS)
+    # ==========================================
+    st.markdown("### 🔧 Product Revenue Contribution")
+    
+    # Filters
+    col_f1, col_f2 = st.columns(2)
+    with col_f1:
+        show_top_n = st.slider("Show Top N Products:", 5, 30, 10)
+    with col_f2:
+        min_revenue_prod = st.number_input("Min Revenue:", value=0, step=100000)
+    
+    filtered_products = product_revenue[product_revenue['Revenue'] >= min_revenue_prod].head(show_top_n)
+    
+    col1, col2 = st.columns([2, 3])
+    
+    with col1:
+        st.markdown(f"#### Top {show_top_n} Products Ranking")
+        
+        # Detailed product table
+        prod_display = pd.DataFrame({
+            'Rank': range(1, len(filtered_products) + 1),
+            'Product': filtered_products.index,
+            'Revenue': inr(filtered_products['Revenue']),
+            'Market Share': percent(filtered_products['Revenue_Pct'], 2),
+            'Orders': filtered_products['Orders'].astype(int),
+            'States': filtered_products['States_Presence'].astype(int)
+        })
+        
+        st.table(prod_display.set_index('Rank'))
+        
+        # Product market share summary
+        total_prod_share = filtered_products['Revenue_Pct'].sum()
+        st.info(f"**Top {show_top_n} products contribute {total_prod_share:.1f}% of total revenue**")
+    
+    with col2:
+        st.markdown("#### Product Performance Metrics")
+        
+        # Horizontal bar chart with numbers
+        fig = go.Figure()
+        
+        fig.add_trace(go.Bar(
+            y=filtered_products.index[::-1],
+            x=filtered_products['Revenue'][::-1],
+            orientation='h',
+            marker=dict(
+                color=filtered_products['Revenue_Pct'][::-1],
+                colorscale='Viridis',
+                showscale=True,
+                colorbar=dict(title="Market Share %")
+            ),
+            text=(compact(filtered_products['Revenue']) + ' (' + percent(filtered_products['Revenue_Pct']) + ')')[::-1],
+            textposition='outside',
+            textfont=dict(size=10)
+        ))
+        
+        fig.update_layout(
+            height=500,
+            xaxis_title=f"Revenue ({CURRENCY})",
+            yaxis=dict(autorange="reversed"),
+            margin=dict(l=150, r=100, t=30, b=30)
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Product concentration analysis
+    st.markdown("#### 📊 Product Concentration Analysis")
+    
+    # Calculate how many products make up 80% of revenue
+    product_revenue_sorted = product_revenue.sort_values('Revenue', ascending=False)
+    product_revenue_sorted['Cumulative_Revenue'] = product_revenue_sorted['Revenue'].cumsum()
+    product_revenue_sorted['Cumulative_Pct'] = (product_revenue_sorted['Cumulative_Revenue'] / total_revenue * 100)
+    
+    # Find Pareto point (80%)
+    pareto_80_idx = product_revenue_sorted[product_revenue_sorted['Cumulative_Pct'] <= 80].index
+    pareto_90_idx = product_revenue_sorted[product_revenue_sorted['Cumulative_Pct'] <= 90].index
+    
+    cols = st.columns(4)
+    with cols[0]:
+        st.metric("🎯 Top 20% Products", f"{int(len(product_revenue) * 0.2)}", 
+                 f"{(product_revenue_sorted.head(int(len(product_revenue) * 0.2))['Revenue_Pct'].sum()):.1f}% revenue")
+    with cols[1]:
+        st.metric("⭐ 80% Revenue Covered By", f"{len(pareto_80_idx)} products", 
+                 f"{len(pareto_80_idx)/len(product_revenue)*100:.1f}% of catalog")
+    with cols[2]:
+        st.metric("💎 90% Revenue Covered By", f"{len(pareto_90_idx)} products")
+    with cols[3]:
+        st.metric("📦 Long Tail Products", f"{len(product_revenue) - len(pareto_80_idx)}", 
+                 f"{(product_revenue_sorted.tail(len(product_revenue) - len(pareto_80_idx))['Revenue_Pct'].sum()):.1f}% revenue")
@@ -0,0 +1,223 @@
+"""Year-wise Analysis report"""
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from config import CURRENCY
+from formatting import compact, inr, number, signed_percent
+
+
+def render(ctx):
+    df, order_rollups = ctx.df, ctx.order_rollups
+    st.markdown("## 💰 Year-over-Year Growth Analysis")
+    
+    # Get available years
+    available_years = sorted(df['Year'].unique())
+    
+    if len(available_years) < 1:
+        st.warning("No year data available")
+        st.stop()
+    
+    # Year selection dropdowns
+    col1, col2 = st.columns(2)
+    with col1:
+        base_year = st.selectbox("📅 Select Base Year:", available_years, index=0)
+    with col2:
+        compare_years = [y for y in available_years if y != base_year]
+        if compare_years:
+            comparison_year = st.selectbox("📅 Compare With Year:", compare_years, index=len(compare_years)-1 if len(compare_years) > 0 else 0)
+        else:
+            comparison_year = None
+            st.info("Only one year available in dataset")
+    
+    # Calculate yearly stats
+    yearly_growth = order_rollups.years()
+    yearly_stats = yearly_growth[['Total_Revenue', 'Avg_Order_Value', 'Total_Orders', 'Total_Qty', 'Unique_Customers']]
+    
+    # Display stats for selected years
+    if base_year in yearly_stats.index:
+        base_data = yearly_stats.loc[base_year]
+        
+        st.markdown(f"### 📊 {base_year} Performance")
+        cols = st.columns(5)
+        with cols[0]:
+            st.metric("💰 Revenue", f"{CURRENCY}{base_data['Total_Revenue']:,.0f}")
+        with cols[1]:
+            st.metric("📦 Orders", f"{int(base_data['Total_Orders'])}")
+        with cols[2]:
+            st.metric("📊 Avg Order", f"{CURRENCY}{base_data['Avg_Order_Value']:,.0f}")
+        with cols[3]:
+            st.metric("🏭 Quantity", f"{int(base_data['Total_Qty'])}")
+        with cols[4]:
+            st.metric("🏢 Customers", f"{int(base_data['Unique_Customers'])}")
+    
+    # Year-to-Year Comparison
+    if comparison_year and comparison_year in yearly_stats.index:
+        st.markdown("---")
+        st.markdown(f"### 📈 {base_year} vs {comparison_year} - Growth Analysis")
+        
+        comp_data = yearly_stats.loc[comparison_year]
+        
+        # Calculate differences
+        revenue_diff = base_data['Total_Revenue'] - comp_data['Total_Revenue']
+        orders_diff = base_data['Total_Orders'] - comp_data['Total_Orders']
+        qty_diff = base_data['Total_Qty'] - comp_data['Total_Qty']
+        
+        # Calculate growth percentages
+        revenue_growth = ((base_data['Total_Revenue'] / comp_data['Total_Revenue']) - 1) * 100 if comp_data['Total_Revenue'] > 0 else 0
+        orders_growth = ((base_data['Total_Orders'] / comp_data['Total_Orders']) - 1) * 100 if comp_data['Total_Orders'] > 0 else 0
+        qty_growth = ((base_data['Total_Qty'] / comp_data['Total_Qty']) - 1) * 100 if comp_data['Total_Qty'] > 0 else 0
+        avg_order_growth = ((base_data['Avg_Order_Value'] / comp_data['Avg_Order_Value']) - 1) * 100 if comp_data['Avg_Order_Value'] > 0 else 0
+        
+        # Comparison Table
+        comparison_data = {
+            'Metric': ['Total Revenue', 'Total Orders', 'Quantity Sold', 'Avg Order Value', 'Active Customers'],
+            base_year: [
+                f"{CURRENCY}{base_data['Total_Revenue']:,.0f}",
+                f"{int(base_data['Total_Orders'])}",
+                f"{int(base_data['Total_Qty'])}",
+                f"{CURRENCY}{base_data['Avg_Order_Value']:,.0f}",
+                f"{int(base_data['Unique_Customers'])}"
+            ],
+            comparison_year: [
+                f"{CURRENCY}{comp_data['Total_Revenue']:,.0f}",
+                f"{int(comp_data['Total_Orders'])}",
+                f"{int(comp_data['Total_Qty'])}",
+                f"{CURRENCY}{comp_data['Avg_Order_Value']:,.0f}",
+                f"{int(comp_data['Unique_Customers'])}"
+            ],
+            'Difference': [
+                f"{CURRENCY}{revenue_diff:,.0f}",
+                f"{int(orders_diff)}",
+                f"{int(qty_diff)}",
+                f"{CURRENCY}{base_data['Avg_Order_Value'] - comp_data['Avg_Order_Value']:,.0f}",
+                f"{int(base_data['Unique_Customers'] - comp_data['Unique_Customers'])}"
+            ],
+            'Growth %': [
+                f"{revenue_growth:+.2f}%",
+                f"{orders_growth:+.2f}%",
+                f"{qty_growth:+.2f}%",
+                f"{avg_order_growth:+.2f}%",
+                f"{((base_data['Unique_Customers']/comp_data['Unique_Customers'])-1)*100:+.2f}%" if comp_data['Unique_Customers'] > 0 else "N/A"
+            ]
+        }
+        
+        comp_df = pd.DataFrame(comparison_data)
+        st.table(comp_df.set_index('Metric'))
+        
+        # Growth indicators
+        st.markdown("### 📊 Growth Indicators")
+        cols = st.columns(4)
+        
+        with cols[0]:
+            delta_color = "normal" if revenue_growth > 0 else "inverse"
+            st.metric(label="💰 Revenue Growth", value=f"{revenue_growth:+.2f}%", delta=f"{CURRENCY}{revenue_diff:,.0f}", delta_color=delta_color)
+        
+        with cols[1]:
+            delta_color = "normal" if orders_growth > 0 else "inverse"
+            st.metric(label="📦 Orders Growth", value=f"{orders_growth:+.2f}%", delta=f"{int(orders_diff)} orders", delta_color=delta_color)
+        
+        with cols[2]:
+            delta_color = "normal" if qty_growth > 0 else "inverse"
+            st.metric(label="🏭 Quantity Growth", value=f"{qty_growth:+.2f}%", delta=f"{int(qty_diff)} units", delta_color=delta_color)
+        
+        with cols[3]:
+            delta_color = "normal" if avg_order_growth > 0 else "inverse"
+            st.metric(label="📊 AOV Growth", value=f"{avg_order_growth:+.2f}%", delta=f"{CURRENCY}{base_data['Avg_Order_Value'] - comp_data['Avg_Order_Value']:,.0f}", delta_color=delta_color)
+        
+        # Visual indicator
+        if revenue_growth > 0:
+            st.success(f"✅ Growth of {revenue_growth:.2f}% from {comparison_year} to {base_year}")
+        else:
+            st.error(f"⚠️ Decline of {abs(revenue_growth):.2f}% from {comparison_year} to {base_year}")
+    
+    elif len(available_years) == 1:
+        # Only one year available - show detailed breakdown
+        st.info(f"📊 Only {available_years[0]} data available. Showing detailed breakdown...")
+        
+        # Monthly breakdown for single year
+        year_df = df[df['Year'] == available_years[0]]
+        monthly = year_df.groupby('Month', observed=True).agg({
+            'Total_Amount': 'sum',
+            'Inquiry_No': 'count',
+            'Qty': 'sum'
+        }).round(2)
+        monthly.columns = ['Revenue', 'Orders', 'Quantity']
+        monthly.index = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'][:len(monthly)]
+        
+        st.markdown(f"### 📅 {available_years[0]} Monthly Breakdown")
+        st.table(monthly.assign(
+            Revenue=inr(monthly['Revenue']),
+            Orders=number(monthly['Orders'], grouping=False),
+            Quantity=number(monthly['Quantity'], grouping=False)
+        ))
+    
+    # All Years Line Chart
+    if len(available_years) >= 2:
+        st.markdown("---")
+        st.markdown("### 📈 All Years Growth Trend")
+        
+        # Create two charts side by side
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 💰 Revenue Trend (All Years)")
+            fig1 = go.Figure()
+            
+            fig1.add_trace(go.Scatter(
+                x=yearly_growth.index,
+                y=yearly_growth['Total_Revenue'],
+                mode='lines+markers+text',
+                name='Revenue',
+                text=compact(yearly_growth['Total_Revenue'], decimals=0),
+                textposition='top center',
+                line=dict(color='#1f77b4', width=3),
+                marker=dict(size=10)
+            ))
+            
+            fig1.update_layout(
+                height=400,
+                xaxis_title="Year",
+                yaxis_title=f"Revenue ({CURRENCY})",
+                showlegend=False,
+                xaxis=dict(tickmode='linear', tick0=min(available_years), dtick=1)
+            )
+            st.plotly_chart(fig1, use_container_width=True)
+        
+        with col2:
+            st.markdown("#### 📊 Year-over-Year Growth %")
+            fig2 = go.Figure()
+            
+            # Filter out first year (no growth data)
+            growth_data = yearly_growth[yearly_growth['Revenue_Growth_Pct'].notna()]
+            
+            colors = ['green' if x > 0 else 'red' for x in growth_data['Revenue_Growth_Pct']]
+            
+            fig2.add_trace(go.Bar(
+                x=growth_data.index,
+                y=growth_data['Revenue_Growth_Pct'],
+                marker_color=colors,
+                text=signed_percent(growth_data['Revenue_Growth_Pct']),
+                textposition='outside'
+            ))
+            
+            fig2.add_hline(y=0, line_dash="dash", line_color="gray")
+            
+            fig2.update_layout(
+                height=400,
+                xaxis_title="Year",
+                yaxis_title="Growth %",
+                showlegend=False,
+                xaxis=dict(tickmode='linear', tick0=min(available_years), dtick=1)
+            )
+            st.plotly_chart(fig2, use_container_width=True)
+        
+        # Summary statistics for all years
+        st.markdown("#### 📋 Year-over-Year Summary")
+        summary_df = pd.DataFrame({
+            'Year': yearly_growth.index,
+            'Revenue': inr(yearly_growth['Total_Revenue']),
+            'Growth vs Previous': signed_percent(yearly_growth['Revenue_Growth_Pct'], 2, na='Base Year'),
+            'Orders': yearly_growth['Total_Orders'].astype(int),
+            'Order Growth': signed_percent(yearly_growth['Orders_Growth_Pct'], 2)
+        })
+        st.table(summary_df.set_index('Year'))
@@ -0,0 +1,202 @@
+import random
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+import gspread
+import requests
+from google.auth.transport.requests import AuthorizedSession, Request
+from google.oauth2.service_account import Credentials
+from gspread.exceptions import APIError
+from requests.adapters import HTTPAdapter
+from config import (
+    CREDENTIALS_FILE, SHEETS_POOL_SIZE, TOKEN_REFRESH_MARGIN,
+    SHEETS_QUOTA_PER_MINUTE, SHEETS_MAX_RETRIES, SHEETS_BACKOFF_BASE,
+)
+
+SCOPES = [
+    'https://spreadsheets.google.com/feeds',
+    'https://www.googleapis.com/auth/drive'
+]
+
+
+class SheetsClientManager:
+    """One authorized gspread client per process, shared by every loader call"""
+
+    def __init__(self, credentials_file=CREDENTIALS_FILE, scopes=SCOPES):
+        self.credentials_file = credentials_file
+        self.scopes = scopes
+        self._lock = threading.Lock()
+        self._creds = None
+        self._session = None
+        self._client = None
+
+    def get_client(self):
+        """Return the shared client, authorizing on first use and refreshing the token early"""
+        with self._lock:
+            if self._client is None:
+                self._client = self._build_client()
+
+            # A plain transport: the AuthorizedSession would refresh a missing token itself first
+            if self._token_expiring():
+                self._creds.refresh(Request())
+
+            return self._client
+
+    def reset(self):
+        """Drop the client so the next call authorizes from scratch"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._creds = None
+            self._session = None
+            self._client = None
+
+    def _build_client(self):
+        """Load credentials once and open a pooled, authorized HTTP session"""
+        self._creds = Credentials.from_service_account_file(self.credentials_file, scopes=self.scopes)
+
+        # Keep-alive pool shared by all sessions of the dashboard
+        self._session = AuthorizedSession(self._creds)
+        adapter = HTTPAdapter(pool_connections=SHEETS_POOL_SIZE, pool_maxsize=SHEETS_POOL_SIZE)
+        self._session.mount('https://', adapter)
+
+        return gspread.Client(self._creds, session=self._session)
+
+    def _token_expiring(self):
+        """True when the access token is missing or expires within TOKEN_REFRESH_MARGIN"""
+        if not self._creds.token or self._creds.expiry is None:
+            return True
+
+        # google-auth keeps expiry as naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return self._creds.expiry - now < timedelta(seconds=TOKEN_REFRESH_MARGIN)
+
+
+class SheetsRequestScheduler:
+    """Single queue for every Sheets API call: token-bucket quota, coalesced reads, retries"""
+
+    def __init__(self, quota_per_minute=SHEETS_QUOTA_PER_MINUTE, max_retries=SHEETS_MAX_RETRIES,
+                 backoff_base=SHEETS_BACKOFF_BASE):
+        self.rate = quota_per_minute / 60.0
+        self.capacity = max(1.0, quota_per_minute / 6.0)  # Allow ~10s worth of burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+
+        self._cond = threading.Condition()
+        self._tokens = self.capacity
+        self._refilled_at = time.monotonic()
+        self._inflight = {}
+
+        # Metrics
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.counters = Counter()
+        self._latencies = deque(maxlen=500)
+
+    def call(self, fn, *args, key=None, **kwargs):
+        """Run fn(*args, **kwargs) under the quota; calls sharing a key share one in-flight result"""
+        if key is None:
+            return self._run(fn, args, kwargs)
+
+        with self._cond:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self.counters['coalesced'] += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = self._run(fn, args, kwargs)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._cond:
+                self._inflight.pop(key, None)
+
+    def stats(self):
+        """Queue depth, counters and latency percentiles (ms) of recent calls"""
+        with self._cond:
+            latencies = sorted(self._latencies)
+            self._refill()
+            tokens = self._tokens
+
+        def percentile(p):
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0.0
+
+        return {
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'calls': self.counters['calls'],
+            'coalesced': self.counters['coalesced'],
+            'throttled': self.counters['throttled'],
+            'retries': self.counters['retries'],
+            'failures': self.counters['failures'],
+            'tokens_available': round(tokens, 1),
+            'latency_p50_ms': round(percentile(0.50), 1),
+            'latency_p95_ms': round(percentile(0.95), 1),
+        }
+
+    def _run(self, fn, args, kwargs):
+        """Wait for a token, call, and back off with jitter on quota/server errors"""
+        for attempt in range(self.max_retries + 1):
+            self._acquire()
+            started = time.monotonic()
+            try:
+                result = fn(*args, **kwargs)
+                with self._cond:
+                    self.counters['calls'] += 1
+                    self._latencies.append(time.monotonic() - started)
+                return result
+            except Exception as e:
+                if attempt == self.max_retries or not is_retryable(e):
+                    with self._cond:
+                        self.counters['failures'] += 1
+                    raise
+                with self._cond:
+                    self.counters['retries'] += 1
+                    if is_quota_error(e):
+                        # Google counts per minute: stop spending tokens we don't have
+                        self._tokens = min(self._tokens, 0.0)
+                time.sleep(self.backoff_base * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+    def _acquire(self):
+        """Block until the token bucket has a token for one call"""
+        with self._cond:
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            try:
+                self._refill()
+                if self._tokens < 1:
+                    self.counters['throttled'] += 1
+                while self._tokens < 1:
+                    self._cond.wait((1 - self._tokens) / self.rate)
+                    self._refill()
+                self._tokens -= 1
+            finally:
+                self.queue_depth -= 1
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+
+def is_quota_error(error):
+    return isinstance(error, APIError) and error.code == 429
+
+
+def is_retryable(error):
+    """Quota (429), server-side (5xx) and connection errors are worth retrying"""
+    if isinstance(error, APIError):
+        return error.code == 429 or error.code >= 500
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
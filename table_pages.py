@@ -0,0 +1,53 @@
+import numpy as np
+import streamlit as st
+
+PAGE_SIZES = [10, 25, 50, 100, 200]
+UNSORTED = "(sheet order)"
+
+
+def sort_order(values, ascending=True):
+    """Row positions that sort a column, stable, missing values last"""
+    ordered = values.reset_index(drop=True).sort_values(ascending=ascending, kind='stable', na_position='last')
+    return ordered.index.to_numpy(dtype=np.int32)
+
+
+def in_order(order, rows, n_rows):
+    """The selected row positions in a full-frame sort order; one mask pass, no re-sort"""
+    if rows is None or len(rows) == n_rows:
+        return order
+    selected = np.zeros(n_rows, dtype=bool)
+    selected[rows] = True
+    return order[selected[order]]
+
+
+def sort_controls(columns, key):
+    """Sort column and direction widgets; (None, True) keeps the rows as they are"""
+    col_sort1, col_sort2 = st.columns([3, 1])
+    with col_sort1:
+        column = st.selectbox("Sort by:", [UNSORTED] + list(columns), key=f"{key}_sort")
+    with col_sort2:
+        st.markdown("<br>", unsafe_allow_html=True)
+        descending = st.toggle("Descending", key=f"{key}_descending")
+    return (None if column == UNSORTED else column), not descending
+
+
+def page_bounds(n_rows, key, default_size=50):
+    """Rows-per-page and page widgets; the [start, stop) row range of the selected page"""
+    rows_per_page = st.selectbox("Rows per page:", PAGE_SIZES, index=PAGE_SIZES.index(default_size),
+                                 key=f"{key}_page_size")
+    total_pages = max(1, -(-n_rows // rows_per_page))
+
+    # Fewer rows after a filter change: stay on the last page that still exists
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > total_pages:
+        st.session_state[page_key] = total_pages
+
+    col_page1, col_page2, col_page3 = st.columns([1, 2, 1])
+    with col_page2:
+        current_page = st.number_input(f"Page (of {total_pages:,}):", min_value=1, max_value=total_pages,
+                                       key=page_key)
+
+    start = (current_page - 1) * rows_per_page
+    stop = min(start + rows_per_page, n_rows)
+    st.caption(f"Showing rows {start + 1:,} to {stop:,} of {n_rows:,}")
+    return start, stop
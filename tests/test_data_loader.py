@@ -0,0 +1,215 @@
+import pandas as pd
+import pytest
+import data_loader
+from config import BRUSH_SHEET_NAME, SHEET_ID, SYNC_RECHECK_ROWS
+from data_loader import OrderDataLoader, parse_sheet_dates
+from fake_sheets import FakeClientManager, FakeSheetsClient
+from filter_index import INDEX_DIMENSIONS, OrderFilterIndex
+from order_cube import OrderCube
+
+
+def test_two_digit_years_fall_through_to_inference():
+    parsed = parse_sheet_dates(pd.Series(['1/2/23', '01/02/2023 10:30:00']))
+    assert parsed.tolist() == [pd.Timestamp('2023-02-01'), pd.Timestamp('2023-02-01 10:30:00')]
+
+
+def test_years_outside_the_timestamp_range_do_not_parse():
+    parsed = parse_sheet_dates(pd.Series(['01/01/1600', '01/01/2300', '31/12/2261']))
+    assert parsed.isna().tolist() == [True, True, False]
+
+
+def test_out_of_range_dates_are_quarantined():
+    raw = pd.DataFrame({
+        'Date': ['01/01/1600', '05/06/2024'], 'Inquiry_No': ['INQ-1', 'INQ-2'], 'Company': ['a', 'b'],
+        'Client_Name': ['c', 'd'], 'Product': ['p', 'q'], 'Qty': ['1', '2'], 'City': ['Pune', 'Pune'],
+        'State': ['Maharashtra', 'Maharashtra'], 'Total_Amount': ['100', '200'], 'EDD': ['', ''],
+    })
+    cleaned, rejects = OrderDataLoader().clean_and_validate(raw)
+    assert cleaned['Inquiry_No'].tolist() == ['INQ-2']
+    assert rejects['Reason'].tolist() == ['Invalid Date']
+
+
+@pytest.fixture
+def fake_sheet(tmp_path, monkeypatch):
+    """Loader wired to an in-memory order sheet, snapshot files under tmp_path"""
+    monkeypatch.chdir(tmp_path)
+    client = FakeSheetsClient()
+    worksheet = client.add_order_sheet(n_rows=2_000)
+    loader = OrderDataLoader()
+    loader.client_manager = FakeClientManager(client)
+
+    # Row counts handed to clean_and_validate, to see how much each sync re-cleaned
+    loader.cleaned_rows = []
+    clean_and_validate = loader.clean_and_validate
+    def counting_clean(raw):
+        loader.cleaned_rows.append(len(raw))
+        return clean_and_validate(raw)
+    loader.clean_and_validate = counting_clean
+    return loader, worksheet, client
+
+
+def order_row(inquiry_no, date='05/06/2024 10:00:00', amount='₹1,500', product='Industrial Product 1'):
+    row = [''] * 21
+    row[0], row[1], row[5], row[6], row[7] = date, inquiry_no, 'acme pvt ltd', 'client', product
+    row[8], row[9], row[10], row[15], row[20] = '2', 'Pune', 'Maharashtra', amount, '10/06/2024'
+    return row
+
+
+def test_cold_load_reads_the_sheet_once(fake_sheet):
+    loader, _, client = fake_sheet
+    df = loader.fetch_data()
+
+    assert client.call_counts['batch_get'] == 1
+    assert loader.synced_rows == 2_000
+    assert len(df) + len(loader.rejects) == 2_000
+    assert loader.ingest_report['rows_loaded'] == len(df)
+
+
+def test_append_only_sync_cleans_only_the_new_rows(fake_sheet):
+    loader, worksheet, _ = fake_sheet
+    loader.fetch_data()
+    before = loader.df
+    worksheet.append_rows([order_row(f'INQ-NEW-{i}') for i in range(10)])
+
+    df = loader.sync_data()
+
+    assert loader.cleaned_rows[-1] == 10
+    assert loader.synced_rows == 2_010
+    assert len(df) == len(before) + 10
+    assert df['Inquiry_No'].iloc[-10:].tolist() == [f'INQ-NEW-{i}' for i in range(10)]
+    pd.testing.assert_frame_equal(df.iloc[:len(before)], before, check_categorical=False)
+
+
+def test_sync_without_new_rows_keeps_the_snapshot(fake_sheet):
+    loader, _, _ = fake_sheet
+    loader.fetch_data()
+    snapshot = loader.snapshot
+
+    loader.sync_data()
+
+    assert loader.snapshot.version == snapshot.version
+    assert loader.snapshot.df is snapshot.df
+    assert loader.snapshot.synced_at >= snapshot.synced_at
+
+
+def test_append_only_sync_extends_the_index_and_backend(fake_sheet):
+    loader, worksheet, _ = fake_sheet
+    loader.fetch_data()
+    loader.snapshot.queries.aggregate('State', {'Revenue': ('Total_Amount', 'sum')})
+    worksheet.append_rows([order_row('INQ-NEW', product='Brand New Product')])
+
+    df = loader.sync_data()
+
+    fresh = OrderFilterIndex(df)
+    for dim in INDEX_DIMENSIONS:
+        assert loader.snapshot.filter_index.values(dim) == fresh.values(dim)
+        for value in fresh.values(dim):
+            assert loader.snapshot.filter_index.rows(**{dim: value}).tolist() == fresh.rows(**{dim: value}).tolist()
+    revenue = loader.snapshot.queries.aggregate('Product', {'Revenue': ('Total_Amount', 'sum')})
+    assert revenue.loc['Brand New Product', 'Revenue'] == 1500
+
+
+def test_tail_edit_changes_the_hash_and_recleans_the_window(fake_sheet):
+    loader, worksheet, _ = fake_sheet
+    loader.fetch_data()
+    tail_hash = loader.tail_hash
+    worksheet.rows[-3] = order_row('INQ-EDITED', amount='123456')
+
+    df = loader.sync_data()
+
+    assert loader.tail_hash != tail_hash
+    assert loader.cleaned_rows[-1] == SYNC_RECHECK_ROWS
+    edited = df[df['Inquiry_No'] == 'INQ-EDITED']
+    assert edited.index.tolist() == [1_997]
+    assert edited['Total_Amount'].tolist() == [123456]
+    assert len(df) + len(loader.rejects) == 2_000
+    assert loader.snapshot.cube.totals(orders=True).equals(OrderCube(df).totals(orders=True))
+
+
+def test_bad_rows_are_quarantined_with_a_reason(fake_sheet):
+    loader, worksheet, _ = fake_sheet
+    worksheet.rows[1:1] = [
+        order_row('INQ-BAD-DATE', date='pending'),
+        order_row('INQ-NO-DATE', date=''),
+        order_row('INQ-BAD-AMOUNT', amount='tbd'),
+        order_row('INQ-NO-AMOUNT', amount=''),
+    ]
+    loader.fetch_data()
+
+    reasons = loader.rejects.set_index('Inquiry_No')['Reason']
+    assert reasons[['INQ-BAD-DATE', 'INQ-NO-DATE', 'INQ-BAD-AMOUNT', 'INQ-NO-AMOUNT']].tolist() == [
+        'Invalid Date', 'Missing Date', 'Invalid Total_Amount', 'Missing Total_Amount',
+    ]
+    assert not loader.df['Inquiry_No'].isin(reasons.index).any()
+    assert loader.ingest_report['rows_rejected'] == len(loader.rejects)
+
+
+def test_store_to_brush_sheet_writes_once_and_formats_in_one_batch(fake_sheet):
+    loader, _, client = fake_sheet
+    brush_df = loader.calculate_followup_dates(loader.identify_brush_products(loader.fetch_data()))
+    client.reset_stats()
+
+    ok, message = loader.store_to_brush_sheet(brush_df)
+
+    assert ok, message
+    assert client.call_counts['update'] == 1
+    assert client.call_counts['batch_format'] == 1
+    assert client.call_counts['format'] == 0
+
+    rows = client.spreadsheets[SHEET_ID].worksheets_by_title[BRUSH_SHEET_NAME].rows
+    assert rows[0] == [
+        'Purchase Date', 'Inquiry No', 'Company Name', 'Client Name', 'Product', 'Quantity', 'State', 'City',
+        'Total Amount (₹)', 'Follow Up Date', 'Urgency Status', 'Last Updated', 'Data Source',
+    ]
+    assert len(rows) == len(brush_df) + 1
+    first = brush_df.iloc[0]
+    assert rows[1][:9] == [
+        first['Date'].strftime('%d-%m-%Y'), first['Inquiry_No'], first['Company'], first['Client_Name'],
+        first['Product'], str(first['Qty']), first['State'], first['City'], str(first['Total_Amount']),
+    ]
+    assert rows[1][9:11] == [first['Follow_Up_Date'].strftime('%d-%m-%Y'), first['Urgency']]
+
+
+def test_duplicate_count_follows_appends_and_edits(fake_sheet):
+    loader, worksheet, _ = fake_sheet
+    loader.fetch_data()
+    worksheet.append_rows([order_row('INQ-TWICE')] * 3 + [list(worksheet.rows[-1])])
+    loader.sync_data()
+    worksheet.rows[-2] = order_row('INQ-ONCE')
+    df = loader.sync_data()
+
+    expected = pd.util.hash_pandas_object(df, index=False).duplicated().sum()
+    assert loader.ingest_report['duplicate_rows'] == expected == 2
+
+
+
+def assert_same_totals(loader, in_memory):
+    snapshot, expected = loader.snapshot, in_memory.snapshot
+    assert len(snapshot.df) < len(expected.df)
+    pd.testing.assert_frame_equal(snapshot.cube.rollup(['State', 'Year'], orders=True),
+                                  expected.cube.rollup(['State', 'Year'], orders=True), check_categorical=False)
+    assert loader.store.years(snapshot.queries.manifest) == sorted(expected.df['Year'].unique(), reverse=True)
+    assert snapshot.queries.distinct('Inquiry_No', Year=2019) == expected.queries.distinct('Inquiry_No', Year=2019)
+
+
+def test_out_of_core_roll_ups_cover_the_saved_history(fake_sheet, tmp_path, monkeypatch):
+    in_memory, worksheet, client = fake_sheet
+    in_memory.fetch_data()
+
+    # Same sheet, its own snapshot directory, memory for a few months only
+    (tmp_path / 'out_of_core').mkdir()
+    monkeypatch.chdir(tmp_path / 'out_of_core')
+    monkeypatch.setattr(data_loader, 'MEMORY_LIMIT_MB', 0.05)
+    loader = OrderDataLoader()
+    loader.client_manager = FakeClientManager(client)
+    loader.out_of_core = True
+    loader.fetch_data()
+    assert_same_totals(loader, in_memory)
+
+    # An append and an edit in a month long out of memory
+    worksheet.append_rows([order_row('INQ-NEW')])
+    worksheet.rows[-3] = order_row('INQ-EDITED', date='05/01/2019 10:00:00')
+    loader.sync_data()
+    monkeypatch.chdir(tmp_path)
+    in_memory.sync_data()
+    assert_same_totals(loader, in_memory)
@@ -0,0 +1,57 @@
+import warnings
+import numpy as np
+import pandas as pd
+import pytest
+from config import CURRENCY
+from formatting import compact, inr, number, percent, signed_percent
+
+EDGE_VALUES = [
+    0.0, -0.0, 0.5, 1.5, 2.5, -0.5, 0.65, 43.15, 2.675, -2.675, -0.04, 1.005,
+    123456.789, -987654321.125, 2.0 ** 52 + 1, 2.0 ** 53, -(2.0 ** 53), 9.5e17, 1e18, 9.2e18,
+    1e19, -1e19, 1e300, -1e300, np.inf, -np.inf,
+]
+
+FORMATS = [
+    (lambda s: number(s), lambda x: f"{x:,.0f}"),
+    (lambda s: number(s, 2), lambda x: f"{x:,.2f}"),
+    (lambda s: number(s, 3, grouping=False), lambda x: f"{x:.3f}"),
+    (inr, lambda x: f"{CURRENCY}{x:,.0f}"),
+    (lambda s: percent(s, 2), lambda x: f"{x:.2f}%"),
+    (signed_percent, lambda x: f"{x:+.1f}%"),
+    (compact, lambda x: f"{CURRENCY}{x / 100000:.1f}L"),
+]
+
+
+@pytest.mark.parametrize('column, cell', FORMATS)
+def test_edge_values_match_the_f_string(column, cell):
+    values = pd.Series(EDGE_VALUES)
+    assert column(values).tolist() == [cell(x) for x in EDGE_VALUES]
+
+
+@pytest.mark.parametrize('column, cell', FORMATS)
+def test_random_values_match_the_f_string(column, cell):
+    rng = np.random.default_rng(0)
+    values = np.concatenate([
+        rng.gamma(2, 50_000, 5_000) * rng.choice([-1, 1], 5_000),
+        np.round(rng.uniform(-100, 100, 5_000), 2),
+        np.round(rng.uniform(-1e7, 1e7, 5_000), 3),
+    ])
+    values = pd.Series(values)
+    assert (column(values) == values.apply(cell)).all()
+
+
+def test_missing_values_become_na():
+    assert number(pd.Series([np.nan, 1.0, None], dtype=float), 1, na='n/a').tolist() == ['n/a', '1.0', 'n/a']
+
+
+def test_large_values_do_not_warn():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert number(pd.Series([1e19]), 2).tolist() == [f"{1e19:,.2f}"]
+
+
+def test_returns_what_it_was_given():
+    assert number(2.675, 2) == '2.67'
+    assert number(pd.Index([1.0], name='x')).name == 'x'
+    frame = number(pd.DataFrame({'a': [1.0, 2.5]}), 1)
+    assert frame['a'].tolist() == ['1.0', '2.5']
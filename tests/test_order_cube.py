@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data_loader import OrderDataLoader, concat_orders
+from fake_sheets import synthetic_order_rows
+from order_cube import OrderCube
+from order_store import month_codes
+
+
+@pytest.fixture(scope='module')
+def orders():
+    loader = OrderDataLoader()
+    df, _ = loader.clean_and_validate(loader.parse_order_rows(synthetic_order_rows(5_000)[1:]))
+    return df
+
+
+def assert_same_cube(cube, expected):
+    by = ['State', 'Product', 'Year_Month']
+    result = cube.rollup(by, distinct=['Company'], orders=True).sort_index()
+    pd.testing.assert_frame_equal(result, expected.rollup(by, distinct=['Company'], orders=True).sort_index())
+    assert cube.totals(orders=True).equals(expected.totals(orders=True))
+
+
+def test_appended_rows_fold_into_the_cube(orders):
+    cut = len(orders) - 200
+    cube = OrderCube(orders.iloc[:cut]).apply(removed=None, added=orders.iloc[cut:])
+    assert_same_cube(cube, OrderCube(orders))
+
+
+def test_edited_and_deleted_rows_rebuild_their_months(orders):
+    cut = len(orders) - 200
+    removed = orders.iloc[cut:]
+    added = removed.iloc[:-30].assign(Total_Amount=removed['Total_Amount'].iloc[:-30] * 2)
+    df = concat_orders([orders.iloc[:cut], added])
+
+    cube = OrderCube(orders).apply(removed, added, month_rows=lambda codes: df[np.isin(month_codes(df), codes)])
+
+    assert_same_cube(cube, OrderCube(df))
+
+
+def test_chunks_merge_into_one_cube(orders):
+    cube = OrderCube.from_chunks(orders.iloc[start:start + 700] for start in range(0, len(orders), 700))
+    assert_same_cube(cube, OrderCube(orders))
@@ -0,0 +1,62 @@
+import pytest
+from data_loader import OrderDataLoader
+from fake_sheets import synthetic_order_rows
+from filter_index import OrderFilterIndex
+from query_backend import DuckDBBackend, PandasBackend, duckdb
+
+pytestmark = pytest.mark.skipif(duckdb is None, reason="duckdb not installed")
+
+MEASURES = {
+    'Revenue': ('Total_Amount', 'sum'),
+    'Orders': ('Inquiry_No', 'nunique'),
+    'Top_Product': ('Product', 'mode'),
+}
+
+
+@pytest.fixture(scope='module')
+def orders():
+    loader = OrderDataLoader()
+    df, _ = loader.clean_and_validate(loader.parse_order_rows(synthetic_order_rows(3_000)[1:]))
+    return df, OrderFilterIndex(df)
+
+
+def test_duckdb_matches_pandas(orders):
+    df, index = orders
+    expected = PandasBackend(df, index).aggregate('State', MEASURES, Year=[2021, 2022])
+    result = DuckDBBackend(df, index).aggregate('State', MEASURES, Year=[2021, 2022])
+    assert result.astype(str).values.tolist() == expected.astype(str).values.tolist()
+
+
+def test_query_after_close_runs_on_pandas_without_reopening(orders):
+    df, index = orders
+    backend = DuckDBBackend(df, index)
+    before = backend.aggregate('Year', MEASURES)
+    backend.close()
+
+    after = backend.aggregate('Year', MEASURES)
+
+    assert backend._con is None
+    assert after.astype(str).values.tolist() == before.astype(str).values.tolist()
+    backend.close()  # Closing twice is harmless
+
+
+def test_apply_hands_the_connection_to_the_next_snapshot(orders):
+    df, index = orders
+    head = df.iloc[:-100]
+    backend = DuckDBBackend(head, OrderFilterIndex(head))
+    before = backend.aggregate('Year', MEASURES)
+    con = backend._con
+
+    successor = backend.apply(df, index)
+
+    assert successor._con is con and backend._con is None
+    expected = PandasBackend(df, index).aggregate('Year', MEASURES)
+    assert successor.aggregate('Year', MEASURES).astype(str).values.tolist() == expected.astype(str).values.tolist()
+    assert backend.aggregate('Year', MEASURES).astype(str).values.tolist() == before.astype(str).values.tolist()
+
+
+def test_distinct_matches_pandas(orders):
+    df, index = orders
+    filters = dict(Year=[2021, 2022], State=df['State'].iloc[0])
+    expected = PandasBackend(df, index).distinct('Inquiry_No', **filters)
+    assert DuckDBBackend(df, index).distinct('Inquiry_No', **filters) == expected > 0